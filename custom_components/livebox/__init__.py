@@ -11,7 +11,7 @@ from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 
 from .const import CALLID, DOMAIN, PLATFORMS
-from .coordinator import LiveboxDataUpdateCoordinator
+from .coordinator import ENTRY_STORES, LiveboxDataUpdateCoordinator, entry_store
 
 type LiveboxConfigEntry = ConfigEntry[LiveboxDataUpdateCoordinator]
 
@@ -75,7 +75,8 @@ def _migrate_wan_access_unique_ids(
 async def async_setup_entry(hass: HomeAssistant, entry: LiveboxConfigEntry) -> bool:
     """Set up Livebox as config entry."""
     coordinator = LiveboxDataUpdateCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    if not await coordinator.async_config_entry_restore():
+        await coordinator.async_config_entry_first_refresh()
 
     # If unique_id was cleared (migration) or missing, set it from SerialNumber
     if entry.unique_id is None and coordinator.unique_id:
@@ -91,9 +92,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: LiveboxConfigEntry) -> b
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     async def async_remove_cmissed(call) -> None:
-        await coordinator.api.voiceservice.async_clear_calllist(
-            {CALLID: call.data.get(CALLID)}
+        await coordinator.async_run_action(
+            lambda api: api.voiceservice.async_clear_calllist(
+                {CALLID: call.data.get(CALLID)}
+            )
         )
+        coordinator.invalidate_sections("callers")
         await coordinator.async_refresh()
 
     hass.services.async_register(
@@ -108,9 +112,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: LiveboxConfigEntry) ->
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: LiveboxConfigEntry) -> None:
+    """Remove the data stored for a config entry."""
+    for name in ENTRY_STORES:
+        await entry_store(hass, entry.entry_id, name).async_remove()
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: LiveboxConfigEntry):
-    """Reload device tracker if change option."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Apply changed options, reload when the connection settings changed."""
+    coordinator = entry.runtime_data
+    if dict(entry.data) != coordinator.connection:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    await coordinator.async_apply_options()
 
 
 async def async_remove_config_entry_device(
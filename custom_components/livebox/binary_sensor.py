@@ -20,7 +20,7 @@ from . import LiveboxConfigEntry
 from .const import DDNS_ICON, MISSED_ICON, RA_ICON
 from .coordinator import LiveboxDataUpdateCoordinator
 from .entity import LiveboxEntity
-from .helpers import find_item
+from .helpers import KeyPath
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -29,36 +29,45 @@ class LiveboxBinarySensorEntityDescription(BinarySensorEntityDescription):
 
     value_fn: Callable[..., Any]
     attrs: dict[str, Callable[..., Any]]
-    index: int | None = None
+    data_keys: tuple[str | tuple[str, ...], ...] | None = None
 
 
 BINARYSENSOR_TYPES: Final[tuple[LiveboxBinarySensorEntityDescription, ...]] = (
     LiveboxBinarySensorEntityDescription(
         key="connectivity",
+        data_keys=(
+            "wan_status",
+            "count_wired_devices",
+            "count_wireless_devices",
+            "infos",
+        ),
         name="WAN Status",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda x: find_item(x, "wan_status.WanState", "").lower() == "up",
+        value_fn=KeyPath(
+            "wan_status.WanState", default="", convert=lambda x: x.lower() == "up"
+        ),
         attrs={
-            "link_type": lambda x: find_item(x, "wan_status.LinkType"),
-            "link_state": lambda x: find_item(x, "wan_status.LinkState"),
-            "last_connection_error": lambda x: find_item(
-                x, "wan_status.LastConnectionError"
-            ),
-            "wan_ipaddress": lambda x: find_item(x, "wan_status.IPAddress"),
-            "wan_gw": lambda x: find_item(x, "wan_status.RemoteGateway"),
-            "wan_ipv6address": lambda x: find_item(x, "wan_status.IPv6Address"),
-            "wan_ipv6prefix": lambda x: find_item(x, "wan_status.IPv6DelegatedPrefix"),
+            "link_type": KeyPath("wan_status.LinkType"),
+            "link_state": KeyPath("wan_status.LinkState"),
+            "last_connection_error": KeyPath("wan_status.LastConnectionError"),
+            "wan_ipaddress": KeyPath("wan_status.IPAddress"),
+            "wan_gw": KeyPath("wan_status.RemoteGateway"),
+            "wan_ipv6address": KeyPath("wan_status.IPv6Address"),
+            "wan_ipv6prefix": KeyPath("wan_status.IPv6DelegatedPrefix"),
             "wired clients": lambda x: x.get("count_wired_devices"),
             "wireless clients": lambda x: x.get("count_wireless_devices"),
-            "uptime": lambda x: (
-                datetime.today() - timedelta(seconds=find_item(x, "infos.UpTime", 0))
+            "uptime": KeyPath(
+                "infos.UpTime",
+                default=0,
+                convert=lambda x: datetime.today() - timedelta(seconds=x),
             ),
         },
         translation_key="connectivity",
     ),
     LiveboxBinarySensorEntityDescription(
         key="callmissed",
+        data_keys=("cmissed",),
         icon=MISSED_ICON,
         name="Call missed",
         value_fn=lambda x: len(x.get("cmissed", [])) > 0,
@@ -67,6 +76,7 @@ BINARYSENSOR_TYPES: Final[tuple[LiveboxBinarySensorEntityDescription, ...]] = (
     ),
     LiveboxBinarySensorEntityDescription(
         key="remote_access",
+        data_keys=("remote_access",),
         name="Remote Access",
         icon=RA_ICON,
         value_fn=lambda x: x.get("remote_access"),
@@ -92,14 +102,16 @@ async def async_setup_entry(
         idx = coordinator.data["ddns"].index(item)
         description = LiveboxBinarySensorEntityDescription(
             key=f"ddns_{idx}",
-            index=idx,
+            data_keys=("ddns",),
             icon=DDNS_ICON,
             device_class=BinarySensorDeviceClass.PROBLEM,
             name=f"Dynamic DNS ({item.get('service')})",
-            value_fn=lambda x, y: (
-                find_item(x, f"ddns.{y}.status", "").lower() != "updated"
+            value_fn=KeyPath(
+                ("ddns", str(idx), "status"),
+                default="",
+                convert=lambda x: x.lower() != "updated",
             ),
-            attrs={"last_update": lambda x, y: find_item(x, f"ddns.{y}.last_update")},
+            attrs={"last_update": KeyPath(("ddns", str(idx), "last_update"))},
             translation_key=f"ddns_{idx}",
         )
         entities.append(LiveboxBinarySensor(coordinator, description))
@@ -126,8 +138,6 @@ class LiveboxBinarySensor(  # pyrefly: ignore[inconsistent-inheritance]
         description = cast(
             LiveboxBinarySensorEntityDescription, self.entity_description
         )
-        if (idx := description.index) is not None:
-            return description.value_fn(self.coordinator.data, idx)
         return description.value_fn(self.coordinator.data)
 
     @property
@@ -136,10 +146,6 @@ class LiveboxBinarySensor(  # pyrefly: ignore[inconsistent-inheritance]
         description = cast(
             LiveboxBinarySensorEntityDescription, self.entity_description
         )
-        attributes = {}
-        for key, attr in description.attrs.items():
-            if (idx := description.index) is not None:
-                attributes.update({key: attr(self.coordinator.data, idx)})
-            else:
-                attributes.update({key: attr(self.coordinator.data)})
-        return attributes
+        return {
+            key: attr(self.coordinator.data) for key, attr in description.attrs.items()
+        }
@@ -21,6 +21,8 @@ class LiveboxButtonEntityDescription(ButtonEntityDescription):
     """Class describing Livebox button entities."""
 
     value_fn: Callable[..., Any]
+    # Sections fetched again once the action ran.
+    refresh_sections: tuple[str, ...] = ()
 
 
 BUTTON_TYPES: Final[tuple[LiveboxButtonEntityDescription, ...]] = (
@@ -44,6 +46,7 @@ BUTTON_TYPES: Final[tuple[LiveboxButtonEntityDescription, ...]] = (
         icon=CLEARCALLS_ICON,
         translation_key="cmissed_clear_btn",
         value_fn=lambda x: x.voiceservice.async_clear_calllist,
+        refresh_sections=("callers",),
     ),
 )
 
@@ -75,4 +78,7 @@ class Button(LiveboxEntity, ButtonEntity):  # pyrefly: ignore[inconsistent-inher
     async def async_press(self) -> None:
         """Triggers the button press service."""
         description = cast(LiveboxButtonEntityDescription, self.entity_description)
-        await description.value_fn(self.coordinator.api)()
+        await self.coordinator.async_run_action(lambda api: description.value_fn(api)())
+        if description.refresh_sections:
+            self.coordinator.invalidate_sections(*description.refresh_sections)
+            await self.coordinator.async_refresh()
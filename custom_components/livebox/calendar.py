@@ -82,7 +82,7 @@ class LiveboxCallLogCalendar(  # pyrefly: ignore[inconsistent-inheritance]
         self._previous_uptime = current_uptime
 
         max_call_id_in_batch = 0
-        for call in self.coordinator.data["callers"]:
+        for call in self.coordinator.data.get("callers", []):
             call_id = int(call["id"])
             max_call_id_in_batch = max(max_call_id_in_batch, call_id)
 
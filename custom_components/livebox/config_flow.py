@@ -26,6 +26,7 @@ from homeassistant.helpers.service_info.ssdp import ATTR_UPNP_SERIAL, SsdpServic
 from .const import (
     CONF_DISPLAY_DEVICES,
     CONF_LAN_TRACKING,
+    CONF_MAX_CONCURRENT_REQUESTS,
     CONF_TRACKING_TIMEOUT,
     CONF_USE_TLS,
     CONF_VERIFY_TLS,
@@ -33,6 +34,7 @@ from .const import (
     DEFAULT_DISPLAY_DEVICES,
     DEFAULT_HOST,
     DEFAULT_LAN_TRACKING,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
     DEFAULT_PORT,
     DEFAULT_TRACKING_TIMEOUT,
     DEFAULT_USERNAME,
@@ -206,6 +208,10 @@ class LiveboxOptionsFlowHandler(config_entries.OptionsFlow):
                         vol.Required(
                             CONF_DISPLAY_DEVICES, default=DEFAULT_DISPLAY_DEVICES
                         ): vol.In(["All", "Active only"]),
+                        vol.Required(
+                            CONF_MAX_CONCURRENT_REQUESTS,
+                            default=DEFAULT_MAX_CONCURRENT_REQUESTS,
+                        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=10)),
                     },
                 ),
                 self.config_entry.options,
@@ -33,6 +33,9 @@ DEFAULT_TRACKING_TIMEOUT = 300
 CONF_DISPLAY_DEVICES = "device_tracker_mode"
 DEFAULT_DISPLAY_DEVICES = "Active"
 
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
 UPLOAD_ICON = "mdi:upload-network"
 DOWNLOAD_ICON = "mdi:download-network"
 MISSED_ICON = "mdi:phone-alert"
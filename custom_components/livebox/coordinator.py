@@ -2,38 +2,679 @@
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import logging
-from collections.abc import Callable
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, cast
+from fnmatch import fnmatchcase
+from itertools import count
+from math import ceil
+from time import monotonic, time
+from typing import Any, Final, TypeVar, cast
 
 from aiosysbus import AIOSysbus
-from aiosysbus.exceptions import AiosysbusException
+from aiosysbus.exceptions import (
+    AiosysbusException,
+    HttpRequestFailed,
+    RetrieveFailed,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util.dt import DEFAULT_TIME_ZONE, UTC
 
 from .const import (
     CONF_DISPLAY_DEVICES,
     CONF_LAN_TRACKING,
+    CONF_MAX_CONCURRENT_REQUESTS,
     CONF_USE_TLS,
     CONF_VERIFY_TLS,
     CONF_WIFI_TRACKING,
     DEFAULT_DISPLAY_DEVICES,
     DEFAULT_LAN_TRACKING,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
     DEFAULT_WIFI_TRACKING,
     DOMAIN,
 )
 from .helpers import find_item
+from .statistics import (
+    async_get_imported_until,
+    async_import_traffic,
+    hour_start,
+    traffic_statistic_id,
+)
 
 _LOGGER = logging.getLogger(__name__)
+_T = TypeVar("_T")
 SCAN_INTERVAL = timedelta(minutes=1)
+MEDIUM_SCAN_INTERVAL = timedelta(minutes=5)
+SLOW_SCAN_INTERVAL = timedelta(minutes=15)
 TOPOLOGY_SCAN_INTERVAL = timedelta(minutes=15)
 TOPOLOGY_BUILD_TIMEOUT = 30
+# Requests waiting for the router are served by priority, then in order.
+PRIORITY_ACTION = 0
+PRIORITY_POLL = 1
+PRIORITY_DIAGNOSTICS = 2
+BREAKER_THRESHOLD = 3
+BREAKER_BACKOFF = 60
+BREAKER_MAX_BACKOFF = 3600
+# Services of a Livebox may still be starting for a while after a boot.
+BOOT_GRACE = timedelta(minutes=10)
+# Raw responses kept for other consumers, such as diagnostics.
+RESPONSE_CACHE_SIZE = 256
+# Endpoints whose errors depend on the device queried, not on the firmware.
+PER_DEVICE_ENDPOINTS: Final = ("Schedule.async_get_schedule",)
+# Endpoints of the startup sections: every Livebox supports them.
+CORE_ENDPOINTS: Final = (
+    "Devices.async_get_devices",
+    "DynDNS.async_get_hosts",
+    "HomeLan.async_get_interface",
+    "Nmc.async_get_wan_status",
+    "TopologyDiagnostics.async_get_topodiags",
+)
+# Requests found unsupported are probed again after this time.
+UNSUPPORTED_RETRY = timedelta(hours=6)
+STATS_SCAN_INTERVAL = timedelta(minutes=5)
+STATS_READING_INTERVAL = 30
+STATS_MAX_READINGS = 120
+COUNTER_WRAP = 1 << 32
+STORAGE_VERSION = 1
+# Data persisted per config entry, see entry_store.
+ENTRY_STORES: Final = ("capabilities", "counters", "session", "snapshot", "topology")
+COUNTERS_SAVE_DELAY = 300
+# Counters not read for this long, e.g. of a departed client, are forgotten.
+COUNTER_RETENTION = timedelta(days=7)
+SNAPSHOT_SAVE_DELAY = 600
+# Snapshot keys persisted as is: entities are created from them. The rest,
+# like call numbers or the WAN address, waits for the first refresh.
+SNAPSHOT_KEYS: Final = (
+    "devices",
+    "count_wired_devices",
+    "count_wireless_devices",
+    "ddns",
+    "topology_via_device",
+    "topology_repeaters",
+)
+# Device information needed to register the Livebox and its entities.
+SNAPSHOT_INFOS: Final = (
+    "Manufacturer",
+    "ModelName",
+    "ProductClass",
+    "SerialNumber",
+    "SoftwareVersion",
+)
+# Monotonically increasing byte counters, accumulated across wraps and resets.
+COUNTER_SECTIONS: Final = ("fiber_stats", "wifi_stats")
+COUNTER_METRICS: Final = ("RxBytes", "TxBytes")
+# Device changes pushed by the Livebox over a long-polled event channel.
+DEVICE_EVENTS: Final = [
+    {"service": "Devices.Device", "event": event}
+    for event in ("changed", "device_added", "device_deleted")
+]
+DEVICE_EVENT_HANDLER = "Devices.Device."
+EVENTS_RETRY_DELAY = 60
+EVENTS_MIN_POLL = 1
+
+MODELS: Final[dict[str, int | float]] = {
+    "Livebox 3": 3,
+    "Livebox 4": 4,
+    "Livebox Fibre": 5,
+    "Livebox 6": 6,
+    "Livebox 7": 7,
+    "Livebox W7": 7.1,
+    "SMBSLBFIBRA": 5656,  # Sagemcom f@st 5656
+    "Livebox Nautilus": 7.2,
+}
+DSL_LINK_TYPES: Final = ("dsl", "adsl", "vdsl")
+FIBER_LINK_TYPES: Final = ("gpon", "sfp")
+
+
+@dataclass(frozen=True, kw_only=True)
+class LiveboxProfile:
+    """Describe what a Livebox supports, computed once per config entry."""
+
+    model: int | float | None
+    link_type: str
+
+    @property
+    def has_dsl(self) -> bool:
+        """Return whether the box can report a DSL line."""
+        return self.link_type not in FIBER_LINK_TYPES
+
+    @property
+    def has_fiber(self) -> bool:
+        """Return whether the box can report an optical line."""
+        return self.model not in (3, 4) and self.link_type not in DSL_LINK_TYPES
+
+    @property
+    def has_dhcp(self) -> bool:
+        """Return whether the box exposes its DHCP pools."""
+        return self.model != 5656
+
+    @property
+    def wan_interface(self) -> str:
+        """Return the interface carrying WAN traffic counters."""
+        match self.model:
+            case 4:
+                return "eth0"
+            case 3:
+                return "bridge_vmulti"
+            case 5656:
+                return "bridge"
+            case _:
+                return "veip0"
+
+
+@dataclass(frozen=True, kw_only=True)
+class LiveboxSection:
+    """Describe a block of data fetched by the coordinator.
+
+    Sections without requirements are fetched concurrently. A section listing
+    other section keys in ``requires`` waits for them and receives their
+    results through the second argument of ``fetch_fn``. Sections slower than
+    ``SCAN_INTERVAL`` are only fetched again once ``interval`` has elapsed; in
+    between, their last result is reused.
+
+    ``entity_keys`` lists the entity description keys (shell-style patterns)
+    reading the section. When all of them are disabled in the entity
+    registry, the section is skipped and keeps its last result, or
+    ``default()`` if it was never fetched. Sections for which
+    ``supported_fn`` returns False are left out of the entry's fetch plan.
+
+    While the Livebox event channel is connected, sections whose changes are
+    pushed use ``pushed_interval`` instead, as a reconciliation sweep.
+
+    Only ``startup`` sections, those entities are created from, are fetched
+    by the first refresh; the others follow in the background. Until then,
+    the snapshot keys built from them, ``data_keys`` (the section key by
+    default), are pending and the entities reading them unavailable.
+    """
+
+    key: str
+    fetch_fn: Callable[[LiveboxDataUpdateCoordinator, dict[str, Any]], Awaitable[Any]]
+    requires: tuple[str, ...] = ()
+    interval: timedelta = SCAN_INTERVAL
+    entity_keys: tuple[str, ...] = ()
+    default: Callable[[], Any] = dict
+    supported_fn: Callable[[LiveboxProfile], bool] = lambda _: True
+    pushed_interval: timedelta | None = None
+    startup: bool = False
+    data_keys: tuple[str, ...] = ()
+
+
+SECTIONS: Final[tuple[LiveboxSection, ...]] = (
+    # Fast: presence, WAN state and switch states.
+    LiveboxSection(
+        key="topology",
+        startup=True,
+        data_keys=("topology_via_device", "topology_repeaters"),
+        fetch_fn=lambda c, _: c.async_get_topology(),
+    ),
+    LiveboxSection(
+        key="devices",
+        requires=("topology",),
+        pushed_interval=SLOW_SCAN_INTERVAL,
+        startup=True,
+        fetch_fn=lambda c, r: c.async_get_devices(
+            c.lan_tracking, c.wifi_tracking, set(r["topology"][1])
+        ),
+    ),
+    LiveboxSection(
+        key="devices_wan_access",
+        entity_keys=("*_wan_access",),
+        requires=("devices",),
+        fetch_fn=lambda c, r: c.async_get_devices_wan_access(r["devices"][0]),
+    ),
+    LiveboxSection(
+        key="wan_status",
+        startup=True,
+        fetch_fn=lambda c, _: c.async_get_wan_status(),
+    ),
+    LiveboxSection(
+        key="wifi",
+        entity_keys=("wifi",),
+        default=bool,
+        fetch_fn=lambda c, _: c.async_is_wifi(),
+    ),
+    LiveboxSection(
+        key="guest_wifi",
+        entity_keys=("guest_wifi",),
+        default=bool,
+        fetch_fn=lambda c, _: c.async_is_guest_wifi(),
+    ),
+    # Medium: line and traffic statistics.
+    LiveboxSection(
+        key="dsl_status",
+        supported_fn=lambda p: p.has_dsl,
+        entity_keys=("down", "up"),
+        interval=MEDIUM_SCAN_INTERVAL,
+        fetch_fn=lambda c, _: c.async_get_dsl_status(),
+    ),
+    LiveboxSection(
+        key="wifi_stats",
+        entity_keys=("wifi_rx", "wifi_tx"),
+        data_keys=("wifi_stats", "counters", "rates"),
+        interval=MEDIUM_SCAN_INTERVAL,
+        fetch_fn=lambda c, _: c.async_get_wifi_stats(),
+    ),
+    LiveboxSection(
+        key="fiber_status",
+        supported_fn=lambda p: p.has_fiber,
+        entity_keys=("fiber_power_rx", "fiber_power_tx"),
+        interval=MEDIUM_SCAN_INTERVAL,
+        fetch_fn=lambda c, _: c.async_get_fiber_status(),
+    ),
+    LiveboxSection(
+        key="fiber_stats",
+        entity_keys=(
+            "fiber_rx",
+            "fiber_tx",
+            "fiber_rx_throughput",
+            "fiber_tx_throughput",
+        ),
+        data_keys=("fiber_stats", "counters", "rates"),
+        interval=MEDIUM_SCAN_INTERVAL,
+        fetch_fn=lambda c, _: c.async_get_fiber_stats(),
+    ),
+    LiveboxSection(
+        key="lan",
+        entity_keys=(
+            "*_tx_bytes",
+            "*_rx_bytes",
+            "*_download_throughput",
+            "*_upload_throughput",
+        ),
+        default=list,
+        data_keys=("lan", "wifi_clients", "counters", "rates"),
+        interval=MEDIUM_SCAN_INTERVAL,
+        fetch_fn=lambda c, _: c.async_get_lan(),
+    ),
+    # Slow: nearly static configuration.
+    LiveboxSection(
+        key="interfaces",
+        entity_keys=("*_rate_rx", "*_rate_tx"),
+        startup=True,
+        data_keys=("stats",),
+        interval=SLOW_SCAN_INTERVAL,
+        fetch_fn=lambda c, _: c.async_get_interfaces(),
+    ),
+    LiveboxSection(
+        key="callers",
+        entity_keys=("callers", "callmissed", "call_log_calendar"),
+        default=lambda: ([], []),
+        data_keys=("callers", "cmissed"),
+        interval=SLOW_SCAN_INTERVAL,
+        fetch_fn=lambda c, _: c.async_get_callers(),
+    ),
+    LiveboxSection(
+        key="nmc",
+        interval=SLOW_SCAN_INTERVAL,
+        fetch_fn=lambda c, _: c.async_get_nmc(),
+    ),
+    LiveboxSection(
+        key="ddns",
+        entity_keys=("ddns_*",),
+        default=list,
+        startup=True,
+        interval=SLOW_SCAN_INTERVAL,
+        fetch_fn=lambda c, _: c.async_get_ddns(),
+    ),
+    LiveboxSection(
+        key="remote_access",
+        entity_keys=("remote_access",),
+        default=bool,
+        interval=SLOW_SCAN_INTERVAL,
+        fetch_fn=lambda c, _: c.async_is_remote_access(),
+    ),
+    LiveboxSection(
+        key="upnp",
+        entity_keys=("upnp",),
+        default=list,
+        interval=SLOW_SCAN_INTERVAL,
+        fetch_fn=lambda c, _: c.async_get_port_forwarding(),
+    ),
+    LiveboxSection(
+        key="dhcp_leases",
+        supported_fn=lambda p: p.has_dhcp,
+        entity_keys=("dhcp_leases",),
+        default=list,
+        interval=SLOW_SCAN_INTERVAL,
+        fetch_fn=lambda c, _: c.async_get_dhcp_leases(),
+    ),
+    LiveboxSection(
+        key="guest_dhcp_leases",
+        supported_fn=lambda p: p.has_dhcp,
+        entity_keys=("guest_dhcp_leases",),
+        default=list,
+        interval=SLOW_SCAN_INTERVAL,
+        fetch_fn=lambda c, _: c.async_get_dhcp_leases("guest"),
+    ),
+)
+
+
+_request_priority: ContextVar[int] = ContextVar(
+    "livebox_request_priority", default=PRIORITY_POLL
+)
+
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """Send the requests made in the block, and tasks it starts, at priority."""
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+class RequestScheduler:
+    """Limit the requests sent concurrently to one Livebox.
+
+    When all slots are busy, waiting requests get the next free slot by
+    priority (lowest first), so user actions overtake queued polling.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the scheduler."""
+        self.limit = limit
+        self.active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._order = count()
+
+    @property
+    def waiting(self) -> int:
+        """Return the number of requests waiting for a slot."""
+        return sum(not future.done() for *_, future in self._waiters)
+
+    @asynccontextmanager
+    async def slot(self, priority: int | None = None) -> AsyncIterator[None]:
+        """Hold a request slot, by default at the priority of the context."""
+        if priority is None:
+            priority = _request_priority.get()
+        if self.active < self.limit and not self.waiting:
+            self.active += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._order), future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    # The slot was handed over just before the cancellation.
+                    self._release()
+                raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    def set_limit(self, limit: int) -> None:
+        """Change the limit, waking waiting requests up to a raised one."""
+        self.limit = limit
+        while self.active < self.limit and self._waiters:
+            *_, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self.active += 1
+                future.set_result(None)
+
+    def _release(self) -> None:
+        """Hand the slot over to the first waiting request, or free it.
+
+        Slots beyond a lowered ``limit`` are freed until it is met again.
+        """
+        while self.active <= self.limit and self._waiters:
+            *_, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+
+
+@dataclass(kw_only=True)
+class EndpointBreaker:
+    """Track consecutive failures of one API endpoint.
+
+    After ``BREAKER_THRESHOLD`` consecutive failures the breaker opens: the
+    endpoint is not called until ``retry_at`` and its last good response is
+    served instead. Each failed retry doubles the wait, up to
+    ``BREAKER_MAX_BACKOFF`` seconds. ``rejected`` tells whether the Livebox
+    answered the last failure with an error, rather than not answering.
+    """
+
+    endpoint: str
+    failures: int = 0
+    retry_at: float = 0.0
+    last_error: str | None = None
+    last_response: dict[str, Any] = field(default_factory=dict)
+    answered: bool = False
+    rejected: bool = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether the endpoint is currently disabled."""
+        return self.failures >= BREAKER_THRESHOLD
+
+    def record_failure(self, error: Exception, now: float) -> None:
+        """Count a failure and schedule the next attempt once open."""
+        self.failures += 1
+        self.last_error = str(error)
+        self.rejected = isinstance(error, RetrieveFailed)
+        if self.is_open:
+            backoff = BREAKER_BACKOFF * 2 ** (self.failures - BREAKER_THRESHOLD)
+            self.retry_at = now + min(backoff, BREAKER_MAX_BACKOFF)
+
+    def record_success(self, response: dict[str, Any]) -> None:
+        """Close the breaker and remember the response."""
+        self.failures = 0
+        self.retry_at = 0.0
+        self.last_error = None
+        self.last_response = response
+        self.answered = True
+        self.rejected = False
+
+
+@dataclass(kw_only=True)
+class CounterAccumulator:
+    """Turn wrapping router byte counters into monotonic totals.
+
+    A counter going down either wrapped around 32 bits, when its previous
+    reading was in the upper half of the range, or restarted from zero (Livebox
+    reboot detected by its uptime, Wi-Fi client reassociation). Both are
+    absorbed in a per-counter offset, so totals keep increasing.
+
+    Only fresh readings must be given: after a reboot, each counter is
+    considered restarted at its next reading. Counters not read for
+    ``COUNTER_RETENTION`` are dropped.
+    """
+
+    uptime: int = 0
+    readings: dict[str, int] = field(default_factory=dict)
+    offsets: dict[str, int] = field(default_factory=dict)
+    restarted: list[str] = field(default_factory=list)
+    seen: dict[str, float] = field(default_factory=dict)
+
+    def update(
+        self, uptime: int, readings: dict[str, int], now: float
+    ) -> dict[str, int]:
+        """Account the new readings and return the total of every counter."""
+        if 0 < uptime < self.uptime:
+            self.restarted = sorted(self.readings)
+        if uptime:
+            self.uptime = uptime
+        for key, reading in readings.items():
+            previous = self.readings.get(key)
+            restarted = key in self.restarted
+            if previous is not None and (restarted or reading < previous):
+                wrapped = not restarted and COUNTER_WRAP > previous >= COUNTER_WRAP // 2
+                if wrapped:
+                    _LOGGER.debug("Rolling over 32-bit integer counter: %s", key)
+                self.offsets[key] = self.offsets.get(key, 0) + (
+                    COUNTER_WRAP if wrapped else previous
+                )
+            if restarted:
+                self.restarted.remove(key)
+            self.readings[key] = reading
+            self.seen[key] = now
+        for key in list(self.readings):
+            if now - self.seen.setdefault(key, now) > COUNTER_RETENTION.total_seconds():
+                _LOGGER.debug("Forgetting counter %s, not read for long", key)
+                del self.readings[key], self.seen[key]
+                self.offsets.pop(key, None)
+                if key in self.restarted:
+                    self.restarted.remove(key)
+        return {
+            key: self.offsets.get(key, 0) + reading
+            for key, reading in self.readings.items()
+        }
+
+
+@dataclass(kw_only=True)
+class LiveboxCapabilities:
+    """Remember what the firmware of a Livebox supports.
+
+    ``unsupported`` maps the requests the Livebox rejected every time it was
+    asked to when they were found so. They are answered empty without calling
+    the Livebox until ``UNSUPPORTED_RETRY`` elapsed. The record only holds for
+    ``software_version``: after a firmware update, everything is probed again.
+    """
+
+    software_version: str = ""
+    profile: dict[str, Any] | None = None
+    unsupported: dict[str, float] = field(default_factory=dict)
+    bulk_schedules: bool | None = None
+    events: bool | None = None
+
+    def __post_init__(self) -> None:
+        """Convert the unsupported requests stored by previous versions."""
+        if isinstance(self.unsupported, list):
+            self.unsupported = dict.fromkeys(self.unsupported, time())
+
+
+def entry_store(hass: HomeAssistant, entry_id: str, name: str) -> Store[Any]:
+    """Return the store of a config entry for the data called name."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.{name}")
+
+
+def _endpoint_name(func: Callable[..., Any]) -> str:
+    """Return a readable name for an API method."""
+    return getattr(func, "__qualname__", None) or repr(func)
+
+
+def _raise_if_cancelling() -> None:
+    """Propagate a cancellation that aiosysbus turned into an API error."""
+    if (task := asyncio.current_task()) is not None and task.cancelling():
+        raise asyncio.CancelledError
+
+
+def request_key(func: Callable[..., Any], *args: Any) -> str:
+    """Return the key identifying a request to the Livebox."""
+    return "::".join([_endpoint_name(func), *(str(arg) for arg in args)])
+
+
+class ResponseCache:
+    """Keep the latest responses of the Livebox for a while.
+
+    Responses are indexed by ``request_key`` and served as long as they are
+    younger than ``ttl`` seconds. Beyond ``size`` responses, the oldest ones
+    are dropped.
+    """
+
+    def __init__(self, size: int, ttl: float) -> None:
+        """Initialize the cache."""
+        self.size = size
+        self.ttl = ttl
+        self._responses: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        """Return the response to the request if still fresh."""
+        if (entry := self._responses.get(key)) is None:
+            return None
+        received_at, response = entry
+        if monotonic() - received_at > self.ttl:
+            del self._responses[key]
+            return None
+        return response
+
+    def put(self, key: str, response: Any) -> None:
+        """Store the latest response to the request."""
+        self._responses.pop(key, None)
+        self._responses[key] = (monotonic(), response)
+        while len(self._responses) > self.size:
+            self._responses.popitem(last=False)
+
+
+def _get_data_slice(data: dict[str, Any], data_key: str | tuple[str, ...]) -> Any:
+    """Return the part of a snapshot an entity subscribed to.
+
+    A data key is either a top-level key or a path, e.g. ``("devices", mac)``.
+    """
+    current: Any = data
+    for part in (data_key,) if isinstance(data_key, str) else data_key:
+        if not isinstance(current, dict):
+            return None
+        current = current.get(part)
+    return current
+
+
+def _channel_id(response: dict[str, Any]) -> int | None:
+    """Return the channel id of an event channel response."""
+    for payload in (response.get("data"), response.get("status"), response):
+        if isinstance(payload, dict) and payload.get("channelid") is not None:
+            return cast(int, payload["channelid"])
+    return None
+
+
+def _channel_events(response: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return the events of an event channel response."""
+    for payload in (response.get("data"), response):
+        if isinstance(payload, dict) and isinstance(payload.get("events"), list):
+            return cast(list[dict[str, Any]], payload["events"])
+    return []
+
+
+def _counter_rate(reading: dict[str, Any], counter: str, factor: float) -> float | None:
+    """Return the rate of a statistics reading counter, None without reading."""
+    if not isinstance(value := reading.get(counter), int | float):
+        return None
+    return round(value * factor, 2)
+
+
+def _index_wifi_clients(lan: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Return the access point payload of each Wi-Fi client, keyed by MAC."""
+    wifi_clients: dict[str, dict[str, Any]] = {}
+    for lan_device in lan:
+        if lan_device.get("type") != "Wireless":
+            continue
+        associated_devices = lan_device.get("extra_attributes", {}).get(
+            "associated_devices"
+        )
+        if not isinstance(associated_devices, dict):
+            continue
+        for associated_device in associated_devices.values():
+            if isinstance(associated_device, dict) and isinstance(
+                mac := associated_device.get("MACAddress"), str
+            ):
+                wifi_clients.setdefault(mac, associated_device)
+    return wifi_clients
+
+
+@callback
+def _entity_availability_changed(
+    event_data: er.EventEntityRegistryUpdatedData,
+) -> bool:
+    """Return whether an entity was added, removed, enabled or disabled."""
+    return event_data["action"] != "update" or "disabled_by" in event_data["changes"]
 
 
 class LiveboxDataUpdateCoordinator(DataUpdateCoordinator):
@@ -51,9 +692,69 @@ class LiveboxDataUpdateCoordinator(DataUpdateCoordinator):
 
         self.unique_id: str | None = None
         self.model: int | float | None = None
+        self.profile: LiveboxProfile | None = None
+        self.fetch_plan: tuple[LiveboxSection, ...] = SECTIONS
         self._topology_cache: tuple[dict[str, str], dict[str, str]] = ({}, {})
         self._topology_cache_at: datetime | None = None
         self._topology_last_update: str | None = None
+        self._topology_task: asyncio.Task[None] | None = None
+        self._topology_store = entry_store(hass, config_entry.entry_id, "topology")
+        self.section_timings: dict[str, float] = {}
+        self._section_results: dict[str, Any] = {}
+        self._section_fetched_at: dict[str, datetime] = {}
+        # Serial of the last merge of each section fetched outside a refresh.
+        self._section_merges: dict[str, int] = {}
+        self._merge_serial = 0
+        self.skipped_sections: set[str] = set()
+        self._fetch_plan_outdated = True
+        self.breakers: dict[str, EndpointBreaker] = {}
+        self._notified_data: dict[str, Any] | None = None
+        self.stats_readings: dict[str, deque[dict[str, Any]]] = {}
+        self._stats_collected_at: float | None = None
+        self._stats_reading_interval: int | None = None
+        self._stats_max_readings: int | None = None
+        # End of the last hour imported into statistics, per interface.
+        self._statistics_imported_until: dict[str, float] = {}
+        self._pending_statistics: dict[str, list[dict[str, Any]]] = {}
+        self._stats_task: asyncio.Task[None] | None = None
+        self.counters = CounterAccumulator()
+        self.rates: dict[str, float] = {}
+        self._counter_samples: dict[str, tuple[datetime, int]] = {}
+        self._counters_store = entry_store(hass, config_entry.entry_id, "counters")
+        self._session_store = entry_store(hass, config_entry.entry_id, "session")
+        self._saved_session: dict[str, Any] | None = None
+        self._session_restored = False
+        self.connection = dict(config_entry.data)
+        self._snapshot_store = entry_store(hass, config_entry.entry_id, "snapshot")
+        # Whether the data is the snapshot of the previous run, not live yet.
+        self.from_snapshot = False
+        self._notified_success = False
+        self.pending_keys: set[str] = set()
+        self._notified_pending: set[str] = set()
+        self.capabilities = LiveboxCapabilities()
+        self.uptime = 0
+        self.responses = ResponseCache(
+            RESPONSE_CACHE_SIZE, SCAN_INTERVAL.total_seconds()
+        )
+        self._capabilities_store = entry_store(
+            hass, config_entry.entry_id, "capabilities"
+        )
+        self.events_connected = False
+        self.scheduler = RequestScheduler(
+            config_entry.options.get(
+                CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+            )
+        )
+
+    @property
+    def lan_tracking(self) -> bool:
+        """Return whether wired devices are tracked."""
+        return self.config_entry.options.get(CONF_LAN_TRACKING, DEFAULT_LAN_TRACKING)
+
+    @property
+    def wifi_tracking(self) -> bool:
+        """Return whether wireless devices are tracked."""
+        return self.config_entry.options.get(CONF_WIFI_TRACKING, DEFAULT_WIFI_TRACKING)
 
     async def _async_setup(self) -> None:
         """Coordinator setup."""
@@ -66,6 +767,141 @@ class LiveboxDataUpdateCoordinator(DataUpdateCoordinator):
             use_tls=self.config_entry.data.get(CONF_USE_TLS, False),
             verify_tls=self.config_entry.data.get(CONF_VERIFY_TLS, True),
         )
+        await self._async_restore_session()
+        self.config_entry.async_on_unload(
+            self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED,
+                self._async_handle_entity_registry_updated,
+                event_filter=_entity_availability_changed,
+            )
+        )
+        self.config_entry.async_on_unload(
+            async_track_time_interval(
+                self.hass,
+                self._async_start_stats_collection,
+                STATS_SCAN_INTERVAL,
+                name=f"{DOMAIN} interface statistics",
+                cancel_on_shutdown=True,
+            )
+        )
+        if stored := await self._counters_store.async_load():
+            self.counters = CounterAccumulator(**stored)
+        if stored := await self._capabilities_store.async_load():
+            self.capabilities = LiveboxCapabilities(**stored)
+        if stored := await self._topology_store.async_load():
+            # Reused until the Livebox reports another LastUpdate.
+            self._topology_cache = (stored["via_device"], stored["repeaters"])
+            self._topology_last_update = stored["last_update"]
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_listen_device_events(),
+            name=f"{DOMAIN}_device_events",
+        )
+
+    async def async_config_entry_first_refresh(self) -> None:
+        """Refresh the startup sections, then the others in the background."""
+        await super().async_config_entry_first_refresh()
+        if self.pending_keys:
+            self.config_entry.async_create_background_task(
+                self.hass, self.async_refresh(), name=f"{DOMAIN}_deferred_refresh"
+            )
+
+    async def async_config_entry_restore(self) -> bool:
+        """Start from the snapshot of the previous run, if any.
+
+        Entities are then created from the snapshot while the first refresh
+        runs in the background. Return False without snapshot: the first
+        refresh must be awaited as usual.
+        """
+        stored = await self._snapshot_store.async_load()
+        if not stored or stored["unique_id"] != self.config_entry.unique_id:
+            return False
+        await self._async_setup()
+        self.unique_id = stored["unique_id"]
+        if stored["profile"] is not None:
+            self._async_set_profile(LiveboxProfile(**stored["profile"]))
+        self.data = stored["data"]
+        self.from_snapshot = True
+        # Entities reading what the snapshot left out wait for the refresh.
+        self.pending_keys = {
+            data_key
+            for section in SECTIONS
+            for data_key in section.data_keys or (section.key,)
+        } | {"infos"}
+        self.pending_keys.difference_update(SNAPSHOT_KEYS)
+        _LOGGER.debug("Restored the snapshot of %s", self.unique_id)
+        self.config_entry.async_create_background_task(
+            self.hass, self.async_refresh(), name=f"{DOMAIN}_first_refresh"
+        )
+        return True
+
+    @callback
+    def _async_save_snapshot(self, data: dict[str, Any]) -> None:
+        """Persist what entities are created from for the next startup."""
+        self._snapshot_store.async_delay_save(
+            lambda: {
+                "unique_id": self.unique_id,
+                "profile": asdict(self.profile) if self.profile else None,
+                "data": {key: data[key] for key in SNAPSHOT_KEYS}
+                | {
+                    "infos": {
+                        key: data["infos"][key]
+                        for key in SNAPSHOT_INFOS
+                        if key in data["infos"]
+                    },
+                    "wan_status": {"LinkType": data["wan_status"].get("LinkType")},
+                    "stats": {
+                        name: {"friendly_name": item["friendly_name"]}
+                        for name, item in data["stats"].items()
+                    },
+                },
+            },
+            SNAPSHOT_SAVE_DELAY,
+        )
+
+    async def _async_restore_session(self) -> None:
+        """Reuse the sysbus context of the previous run, saving a login.
+
+        The Livebox rejects an expired context, aiosysbus then logs in again.
+        """
+        stored = await self._session_store.async_load()
+        if not stored or stored.get("owner") != self._session_owner():
+            return
+        # aiosysbus exposes no accessor for the authenticated context.
+        auth = self.api._auth
+        auth.session_token = stored["context_id"]
+        auth._cookies.update(stored["cookies"])
+        self._saved_session = stored
+        self._session_restored = True
+        _LOGGER.debug("Reusing the stored Livebox session")
+
+    async def _async_forget_session(self) -> None:
+        """Drop the stored sysbus context, the next request logs in again."""
+        auth = self.api._auth
+        auth.session_token = None
+        auth._cookies.clear()
+        self._saved_session = None
+        await self._session_store.async_remove()
+
+    @callback
+    def _async_save_session(self) -> None:
+        """Persist the sysbus context whenever the Livebox issued a new one."""
+        auth = self.api._auth
+        if not isinstance(auth.session_token, str):
+            return
+        session = {
+            "owner": self._session_owner(),
+            "context_id": auth.session_token,
+            "cookies": dict(auth._cookies),
+        }
+        if session != self._saved_session:
+            self._saved_session = session
+            self._session_store.async_delay_save(lambda: session, 0)
+
+    def _session_owner(self) -> str:
+        """Return who a stored context belongs to."""
+        data = self.config_entry.data
+        return f"{data[CONF_USERNAME]}@{data[CONF_HOST]}:{data[CONF_PORT]}"
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data."""
@@ -80,73 +916,404 @@ class LiveboxDataUpdateCoordinator(DataUpdateCoordinator):
                     f"(SerialNumber={serial!r}, ProductClass={product_class!r})"
                 )
             self.unique_id = serial
-            match product_class:
-                case "Livebox 3":
-                    self.model = 3
-                case "Livebox 4":
-                    self.model = 4
-                case "Livebox Fibre":
-                    self.model = 5
-                case "Livebox 6":
-                    self.model = 6
-                case "Livebox 7":
-                    self.model = 7
-                case "Livebox W7":
-                    self.model = 7.1
-                case "SMBSLBFIBRA":
-                    self.model = 5656  # Sagemcom f@st 5656
-                case "Livebox Nautilus":
-                    self.model = 7.2
+            self.uptime = infos.get("UpTime") or 0
+            self._async_save_session()
+            self._async_check_capabilities(infos.get("SoftwareVersion") or "")
+            if self.profile is None and self.capabilities.profile is not None:
+                self._async_set_profile(LiveboxProfile(**self.capabilities.profile))
+            if self.profile is None or not self.profile.link_type:
+                await self.async_update_profile(product_class)
             # Optionals
-            wifi_tracking = self.config_entry.options.get(
-                CONF_WIFI_TRACKING, DEFAULT_WIFI_TRACKING
-            )
-            lan_tracking = self.config_entry.options.get(
-                CONF_LAN_TRACKING, DEFAULT_LAN_TRACKING
-            )
-            topology_via_device, topology_repeaters = await self.async_get_topology()
-            devices, device_counters = await self.async_get_devices(
-                lan_tracking, wifi_tracking, set(topology_repeaters)
-            )
-            callers, cmissed = await self.async_get_callers()
+            if self._fetch_plan_outdated:
+                self._async_update_fetch_plan()
+            sections = self.fetch_plan
+            if self.data is None:
+                sections = tuple(section for section in sections if section.startup)
+            fetched = {section.key for section in sections}
+            pending_keys = {
+                data_key
+                for section in self.fetch_plan
+                if section.key not in fetched
+                for data_key in section.data_keys or (section.key,)
+            }
+            results = {
+                section.key: section.default() for section in SECTIONS
+            } | await self._async_fetch_sections(sections)
+            topology_via_device, topology_repeaters = results["topology"]
+            devices, device_counters = results["devices"]
+            callers, cmissed = results["callers"]
 
             await self.async_detect_new_dvices(devices)
+            if self._stats_collected_at is None:
+                self._async_start_stats_collection()
+            wifi_clients = _index_wifi_clients(results["lan"])
 
-            return {
+            data = {
                 "cmissed": cmissed,
                 "callers": callers,
                 "devices": devices,
-                "dsl_status": await self.async_get_dsl_status(),
+                "dsl_status": results["dsl_status"],
                 "infos": infos,
-                "nmc": await self.async_get_nmc(),
-                "wan_status": await self.async_get_wan_status(),
-                "wifi": await self.async_is_wifi(),
-                "guest_wifi": await self.async_is_guest_wifi(),
+                "nmc": results["nmc"],
+                "wan_status": results["wan_status"],
+                "wifi": results["wifi"],
+                "guest_wifi": results["guest_wifi"],
                 "count_wired_devices": device_counters["wired"],
                 "count_wireless_devices": device_counters["wireless"],
-                "devices_wan_access": {
-                    key: await self.async_get_device_schedule(key) for key in devices
-                },
-                "ddns": await self.async_get_ddns(),
-                "wifi_stats": await self.async_get_wifi_stats(),
-                "fiber_status": await self.async_get_fiber_status(),
-                "fiber_stats": await self.async_get_fiber_stats(),
-                "remote_access": await self.async_is_remote_access(),
+                "devices_wan_access": results["devices_wan_access"],
+                "ddns": results["ddns"],
+                "wifi_stats": results["wifi_stats"],
+                "fiber_status": results["fiber_status"],
+                "fiber_stats": results["fiber_stats"],
+                "remote_access": results["remote_access"],
                 "topology_via_device": topology_via_device,
                 "topology_repeaters": topology_repeaters,
-                "lan": await self.async_get_lan(devices),
-                "upnp": await self.async_get_port_forwarding(),
-                "dhcp_leases": await self.async_get_dhcp_leases(),
-                "guest_dhcp_leases": await self.async_get_dhcp_leases("guest"),
-                "stats": await self.async_get_results(),
+                "lan": results["lan"],
+                "wifi_clients": wifi_clients,
+                "upnp": results["upnp"],
+                "dhcp_leases": results["dhcp_leases"],
+                "guest_dhcp_leases": results["guest_dhcp_leases"],
+                "stats": self.get_stats(results["interfaces"]),
+                "counters": self._async_update_counters(
+                    infos.get("UpTime") or 0, results, wifi_clients
+                ),
+                "rates": dict(self.rates),
             }
         except AiosysbusException as error:
+            _raise_if_cancelling()
             _LOGGER.error("Error while fetch data information: %s", error)
             raise UpdateFailed(error) from error
+        self.pending_keys = pending_keys
+        self.from_snapshot = False
+        if not pending_keys:
+            self._async_save_snapshot(data)
+        return data
+
+    @callback
+    def _async_update_counters(
+        self,
+        uptime: int,
+        results: dict[str, Any],
+        wifi_clients: dict[str, dict[str, Any]],
+    ) -> dict[str, int]:
+        """Accumulate the byte counters of the snapshot and persist them.
+
+        Only counters read from a freshly fetched section are accounted, and
+        update their throughput in ``rates``, in bytes per second. Counters
+        missing from a fresh fetch lose their throughput.
+        """
+        sources = {section: (section, results[section]) for section in COUNTER_SECTIONS}
+        sources |= {
+            f"wifi_clients.{mac}": ("lan", client)
+            for mac, client in wifi_clients.items()
+        }
+        readings: dict[str, int] = {}
+        sampled_at: dict[str, datetime] = {}
+        for prefix, (section, payload) in sources.items():
+            if not isinstance(payload, dict):
+                continue
+            fetched_at = self._section_fetched_at.get(section)
+            for metric in COUNTER_METRICS:
+                key = f"{prefix}.{metric}"
+                if not isinstance(value := payload.get(metric), int):
+                    continue
+                if fetched_at is not None:
+                    previous = self._counter_samples.get(key)
+                    if previous is not None and fetched_at <= previous[0]:
+                        # Served from the last fetch, already accounted.
+                        continue
+                    sampled_at[key] = fetched_at
+                readings[key] = value
+
+        totals = self.counters.update(uptime, readings, time())
+        self._counters_store.async_delay_save(
+            lambda: asdict(self.counters), COUNTERS_SAVE_DELAY
+        )
+
+        for key, sample_time in sampled_at.items():
+            previous = self._counter_samples.get(key)
+            if previous is not None:
+                elapsed = (sample_time - previous[0]).total_seconds()
+                self.rates[key] = round((totals[key] - previous[1]) / elapsed, 1)
+            self._counter_samples[key] = (sample_time, totals[key])
+        for key, (sample_time, _) in list(self._counter_samples.items()):
+            section = "lan" if key.startswith("wifi_clients.") else key.split(".")[0]
+            fetched_at = self._section_fetched_at.get(section)
+            if fetched_at is not None and fetched_at > sample_time:
+                # Missing from a fresh fetch: the client left, its rate is unknown.
+                del self._counter_samples[key]
+                self.rates.pop(key, None)
+        return totals
+
+    async def _async_fetch_sections(
+        self, sections: tuple[LiveboxSection, ...]
+    ) -> dict[str, Any]:
+        """Fetch due sections concurrently and record how long each one took.
+
+        Sections whose interval has not elapsed yet keep their last result.
+        Sections merged while fetching, e.g. after a switch action, are newer
+        than what this refresh read: their merged result is kept.
+        """
+        now = datetime.now(tz=UTC)
+        merge_serial = self._merge_serial
+        results: dict[str, Any] = {}
+        tasks: dict[str, asyncio.Task[None]] = {}
+
+        async def _async_fetch(section: LiveboxSection) -> None:
+            for required in section.requires:
+                if (task := tasks.get(required)) is not None:
+                    await task
+            start = monotonic()
+            results[section.key] = await section.fetch_fn(self, results)
+            elapsed = monotonic() - start
+            self.section_timings[section.key] = round(elapsed, 3)
+            _LOGGER.debug("Fetched section %s in %.3fs", section.key, elapsed)
+            if self._section_merges.get(section.key, 0) <= merge_serial:
+                self._section_results[section.key] = results[section.key]
+                self._section_fetched_at[section.key] = now
+
+        for section in sections:
+            if section.key in self.skipped_sections:
+                results[section.key] = (
+                    self._section_results[section.key]
+                    if section.key in self._section_results
+                    else section.default()
+                )
+                continue
+            fetched_at = self._section_fetched_at.get(section.key)
+            interval = (
+                section.pushed_interval
+                if self.events_connected and section.pushed_interval
+                else section.interval
+            )
+            if (
+                interval > SCAN_INTERVAL
+                and fetched_at is not None
+                and now - fetched_at < interval
+            ):
+                results[section.key] = self._section_results[section.key]
+                continue
+            tasks[section.key] = asyncio.create_task(
+                _async_fetch(section), name=f"{DOMAIN}_{section.key}"
+            )
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        for key, serial in self._section_merges.items():
+            if serial > merge_serial:
+                results[key] = self._section_results[key]
+        return results
+
+    @callback
+    def _async_handle_entity_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Rebuild the fetch plan on the next refresh."""
+        self._fetch_plan_outdated = True
+
+    @callback
+    def _async_update_fetch_plan(self) -> None:
+        """Skip sections whose consuming entities are all disabled.
+
+        A section is only skipped once its entities exist in the registry, so
+        entities created from the first refresh are never starved of data.
+        """
+        registry = er.async_get(self.hass)
+        prefix = f"{self.unique_id or DOMAIN}_"
+        entity_keys = {
+            entity.unique_id.removeprefix(prefix): entity.disabled_by is None
+            for entity in er.async_entries_for_config_entry(
+                registry, self.config_entry.entry_id
+            )
+            if entity.unique_id.startswith(prefix)
+        }
+        skipped_sections = set()
+        for section in SECTIONS:
+            enabled = [
+                is_enabled
+                for key, is_enabled in entity_keys.items()
+                if any(fnmatchcase(key, pattern) for pattern in section.entity_keys)
+            ]
+            if enabled and not any(enabled):
+                skipped_sections.add(section.key)
+        if skipped_sections != self.skipped_sections:
+            _LOGGER.debug("Sections skipped (entities disabled): %s", skipped_sections)
+        self.skipped_sections = skipped_sections
+        self._fetch_plan_outdated = False
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners whose data changed since they were last notified.
+
+        Entities subscribe with a tuple of data keys as listener context, see
+        ``_get_data_slice``. Listeners without context, and all listeners when
+        the availability of the coordinator or the pending keys change, are
+        always updated.
+        """
+        previous, self._notified_data = self._notified_data, self.data
+        notify_all = (
+            previous is None
+            or self.data is None
+            or self._notified_success != self.last_update_success
+            or self._notified_pending != self.pending_keys
+        )
+        self._notified_success = self.last_update_success
+        self._notified_pending = self.pending_keys
+        if notify_all:
+            super().async_update_listeners()
+            return
+
+        changed: dict[str | tuple[str, ...], bool] = {}
+
+        def _has_changed(data_key: str | tuple[str, ...]) -> bool:
+            if data_key not in changed:
+                changed[data_key] = _get_data_slice(
+                    cast(dict[str, Any], previous), data_key
+                ) != _get_data_slice(self.data, data_key)
+            return changed[data_key]
+
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or any(_has_changed(key) for key in context):
+                update_callback()
+
+    async def async_run_action(self, action: Callable[[Any], Awaitable[_T]]) -> _T:
+        """Send a user action to the Livebox ahead of queued polling.
+
+        ``action`` receives the API client. Errors are raised to the caller.
+        """
+        async with self.scheduler.slot(PRIORITY_ACTION):
+            return await action(self.api)
+
+    async def async_refresh_sections(self, *keys: str) -> None:
+        """Fetch only the given sections and merge them into the snapshot.
+
+        Meant for sections stored as is in the snapshot, e.g. ``wifi`` after a
+        switch action. Sections they require keep their last result, and only
+        the entities reading the refreshed sections are notified.
+        """
+        results = dict(self._section_results)
+        with request_priority(PRIORITY_ACTION):
+            for section in self.fetch_plan:
+                if section.key in keys:
+                    results[section.key] = await section.fetch_fn(self, results)
+                    self._async_merge_section(section.key, results[section.key])
+        self.async_update_listeners()
+
+    async def async_refresh_device_schedule(self, device_key: str) -> None:
+        """Fetch the schedule of one device and merge it into the snapshot."""
+        with request_priority(PRIORITY_ACTION):
+            schedule = await self.async_get_device_schedule(device_key)
+        self._async_merge_section(
+            "devices_wan_access",
+            self._section_results.get("devices_wan_access", {})
+            | {device_key: schedule},
+        )
+        self.async_update_listeners()
+
+    @callback
+    def _async_merge_section(self, key: str, result: Any) -> None:
+        """Store a section fetched outside of a full refresh."""
+        self._section_results[key] = result
+        self._section_fetched_at[key] = datetime.now(tz=UTC)
+        self._merge_serial += 1
+        self._section_merges[key] = self._merge_serial
+        if self.data is not None:
+            self.data = self.data | {key: result}
+
+    async def async_apply_options(self) -> None:
+        """Apply changed options to the running entry.
+
+        Devices are fetched again with the new tracking options; platforms
+        then remove the entities of untracked devices and add the new ones.
+        """
+        self.scheduler.set_limit(
+            self.config_entry.options.get(
+                CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+            )
+        )
+        self.invalidate_sections("devices", "devices_wan_access")
+        await self.async_refresh()
+        async_dispatcher_send(self.hass, self.signal_tracking_changed)
+        async_dispatcher_send(self.hass, self.signal_device_new)
+        async_dispatcher_send(self.hass, self.signal_wan_access_new)
+
+    def invalidate_sections(self, *keys: str) -> None:
+        """Fetch the given sections on the next refresh, whatever their interval."""
+        for key in keys:
+            self._section_fetched_at.pop(key, None)
+
+    async def async_update_profile(self, product_class: str) -> None:
+        """Build the capability profile and the fetch plan of the entry.
+
+        While the WAN is down the link type is unknown: every section stays in
+        the plan and the profile is built again on the next refresh.
+        """
+        wan_status = await self.async_get_wan_status()
+        profile = LiveboxProfile(
+            model=MODELS.get(product_class),
+            link_type=str(wan_status.get("LinkType") or "").lower(),
+        )
+        self._async_set_profile(profile)
+        if profile.link_type:
+            self.capabilities.profile = asdict(profile)
+            self._async_save_capabilities()
+        _LOGGER.debug(
+            "Fetch plan for %s (%s): %s",
+            product_class,
+            profile.link_type or "unknown link",
+            [section.key for section in self.fetch_plan],
+        )
+
+    @callback
+    def _async_set_profile(self, profile: LiveboxProfile) -> None:
+        """Use the profile and its fetch plan."""
+        self.profile = profile
+        self.model = profile.model
+        self.fetch_plan = tuple(
+            section for section in SECTIONS if section.supported_fn(profile)
+        )
+
+    @callback
+    def _async_check_capabilities(self, software_version: str) -> None:
+        """Probe the Livebox again once its firmware changed."""
+        if software_version == self.capabilities.software_version:
+            return
+        if self.capabilities.software_version:
+            _LOGGER.debug(
+                "Firmware changed from %s to %s, probing capabilities again",
+                self.capabilities.software_version,
+                software_version,
+            )
+        self.capabilities = LiveboxCapabilities(software_version=software_version)
+        self.profile = None
+        self._async_save_capabilities()
+
+    @callback
+    def _async_save_capabilities(self) -> None:
+        """Persist the capabilities for the next startup."""
+        self._capabilities_store.async_delay_save(lambda: asdict(self.capabilities), 0)
 
     async def async_get_infos(self) -> dict[str, Any]:
-        """Get router infos."""
-        return (await self.api.deviceinfo.async_get_deviceinfo()).get("status", {})
+        """Get router infos.
+
+        This is the first request sent with a restored context: when the
+        Livebox rejects it, the context is dropped and a new login is tried.
+        """
+        restored, self._session_restored = self._session_restored, False
+        async with self.scheduler.slot():
+            try:
+                infos = await self.api.deviceinfo.async_get_deviceinfo()
+            except HttpRequestFailed as error:
+                # Without cause, the Livebox answered: otherwise not reached.
+                if not restored or error.__cause__ is not None:
+                    raise
+                _LOGGER.debug("Stored Livebox session rejected (%s), logging in", error)
+                await self._async_forget_session()
+                infos = await self.api.deviceinfo.async_get_deviceinfo()
+        return infos.get("status", {})
 
     async def async_get_devices(
         self,
@@ -213,8 +1380,106 @@ class LiveboxDataUpdateCoordinator(DataUpdateCoordinator):
 
         return devices_tracker, device_counters
 
+    async def _async_listen_device_events(self) -> None:
+        """Long-poll the Livebox event channel and apply device changes.
+
+        While connected, the devices section is only polled as a slow
+        reconciliation sweep. The channel is reopened after errors; boxes
+        without event channel keep polling devices every scan.
+        """
+        if self.capabilities.events is False:
+            return
+        channel_id = None
+        while True:
+            try:
+                if channel_id is None:
+                    channel_id = _channel_id(
+                        await self.api.event.async_open_channel(
+                            {"events": DEVICE_EVENTS}
+                        )
+                    )
+                    if channel_id is None:
+                        _LOGGER.debug("Livebox event channel not supported")
+                        self.capabilities.events = False
+                        self._async_save_capabilities()
+                        return
+                    if self.capabilities.events is None:
+                        self.capabilities.events = True
+                        self._async_save_capabilities()
+                    self.events_connected = True
+                start = monotonic()
+                response = await self.api.event.async_get_events(
+                    {"channelid": channel_id, "events": DEVICE_EVENTS}
+                )
+            except AiosysbusException as error:
+                _raise_if_cancelling()
+                if (
+                    channel_id is None
+                    and isinstance(error, RetrieveFailed)
+                    and self.capabilities.events is not True
+                    and self._capabilities_settled()
+                ):
+                    _LOGGER.debug("Livebox event channel rejected: %s", error)
+                    self.capabilities.events = False
+                    self._async_save_capabilities()
+                    return
+                _LOGGER.debug("Livebox event channel lost: %s", error)
+                channel_id = None
+                self.events_connected = False
+                await asyncio.sleep(EVENTS_RETRY_DELAY)
+                continue
+
+            events = _channel_events(response)
+            if self._async_apply_device_events(events):
+                self.invalidate_sections("devices")
+                await self.async_request_refresh()
+            elif not events and monotonic() - start < EVENTS_MIN_POLL:
+                # Do not spin if the Livebox answers without waiting.
+                await asyncio.sleep(EVENTS_MIN_POLL)
+
+    @callback
+    def _async_apply_device_events(self, events: list[dict[str, Any]]) -> bool:
+        """Patch the devices with the attributes changed by the events.
+
+        Return whether devices must be reconciled with a full fetch: a device
+        was added, or a tracked one removed. Changes of devices not tracked
+        with the current options are ignored.
+        """
+        if self.data is None or "devices" not in self._section_results:
+            return False
+        devices, device_counters = self._section_results["devices"]
+        changed: dict[str, dict[str, Any]] = {}
+        reconcile = False
+        for event in events:
+            data = event.get("data") or {}
+            handler = data.get("handler") or ""
+            if not handler.startswith(DEVICE_EVENT_HANDLER):
+                continue
+            key = handler.removeprefix(DEVICE_EVENT_HANDLER)
+            payload = data.get("object") or {}
+            device = changed.get(key, devices.get(key))
+            reason = payload.get("reason")
+            if reason == "changed" and device is not None:
+                changed[key] = device | (payload.get("attributes") or {})
+            elif reason in ("device_added", "device_deleted"):
+                # Reconcile on new devices, and on removed ones if tracked.
+                reconcile |= (device is None) == (reason == "device_added")
+        if changed:
+            _LOGGER.debug("Devices changed by events: %s", list(changed))
+            devices = devices | changed
+            self._merge_serial += 1
+            self._section_merges["devices"] = self._merge_serial
+            self._section_results["devices"] = (devices, device_counters)
+            self.data = self.data | {"devices": devices}
+            self.async_update_listeners()
+        return reconcile
+
     async def async_get_topology(self) -> tuple[dict[str, str], dict[str, str]]:
-        """Build a device-to-repeater map from topology diagnostics."""
+        """Return the latest device-to-repeater map.
+
+        A stale map is rebuilt in a background task so that the poll never
+        waits for the Livebox to walk its network.
+        """
         now = datetime.now(tz=UTC)
         topo_status = (
             await self._make_request(self.api.topologydiagnostics.async_get_topodiags)
@@ -236,6 +1501,16 @@ class LiveboxDataUpdateCoordinator(DataUpdateCoordinator):
         ):
             return self._topology_cache
 
+        if self._topology_task is None or self._topology_task.done():
+            self._topology_task = self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_build_topology(last_update),
+                name=f"{DOMAIN}_topology_build",
+            )
+        return self._topology_cache
+
+    async def _async_build_topology(self, last_update: Any) -> None:
+        """Rebuild the topology and push it to entities once done."""
         data = (
             await self._make_request(
                 self.api.topologydiagnostics.async_set_topodiags_build,
@@ -247,7 +1522,7 @@ class LiveboxDataUpdateCoordinator(DataUpdateCoordinator):
             )
         ).get("status", [])
         if not data or not isinstance(data, list) or not isinstance(data[0], dict):
-            return self._topology_cache
+            return
 
         topology_via_device: dict[str, str] = {}
         topology_repeaters: dict[str, str] = {}
@@ -271,12 +1546,33 @@ class LiveboxDataUpdateCoordinator(DataUpdateCoordinator):
                     _walk(child, current_repeater)
 
         _walk(data[0])
+        repeaters_changed = topology_repeaters.keys() != self._topology_cache[1].keys()
         self._topology_cache = (topology_via_device, topology_repeaters)
-        self._topology_cache_at = now
+        self._topology_cache_at = datetime.now(tz=UTC)
         self._topology_last_update = cast(str | None, data[0].get("LastUpdate")) or (
             last_update if isinstance(last_update, str) else None
         )
-        return self._topology_cache
+        if self._topology_last_update is not None:
+            self._topology_store.async_delay_save(
+                lambda: {
+                    "last_update": self._topology_last_update,
+                    "via_device": topology_via_device,
+                    "repeaters": topology_repeaters,
+                },
+                0,
+            )
+
+        if self.data is None:
+            return
+        if repeaters_changed:
+            # Tracked devices depend on the known repeaters, refresh them too.
+            await self.async_request_refresh()
+            return
+        self.data = self.data | {
+            "topology_via_device": topology_via_device,
+            "topology_repeaters": topology_repeaters,
+        }
+        self.async_update_listeners()
 
     def get_parent_device_identifier(self, device_key: str | None) -> tuple[str, str]:
         """Return the parent device identifier for a tracked device."""
@@ -341,8 +1637,6 @@ class LiveboxDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_get_fiber_status(self):
         """Get fiber status."""
-        if self.model in [4, 3]:
-            return {}
         if self.model == 5656:
             optical = (
                 await self._make_request(self.api.sgcomci.async_get_optical)
@@ -361,7 +1655,7 @@ class LiveboxDataUpdateCoordinator(DataUpdateCoordinator):
         ).get("status", {})
         return find_item(veip0, "gpon.veip0", {})
 
-    async def async_get_lan(self, lan_devices):
+    async def async_get_lan(self, lan_devices=None):
         """Get lan status."""
         self_devices = (
             await self._make_request(
@@ -420,14 +1714,7 @@ class LiveboxDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_get_fiber_stats(self) -> bool:
         """Get fiber stats."""
-        if self.model == 4:
-            intf = "eth0"
-        elif self.model == 3:
-            intf = "bridge_vmulti"
-        elif self.model == 5656:
-            intf = "bridge"
-        else:
-            intf = "veip0"
+        intf = cast(LiveboxProfile, self.profile).wan_interface
         return (
             await self._make_request(self.api.nemo.async_get_net_dev_stats, intf)
         ).get("status", {})
@@ -461,6 +1748,74 @@ class LiveboxDataUpdateCoordinator(DataUpdateCoordinator):
         )
         return ddns if isinstance(ddns, list) else []
 
+    async def async_get_devices_wan_access(
+        self, devices: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Get the schedule of every tracked device."""
+        capabilities = self.capabilities
+        if capabilities.bulk_schedules is not False:
+            schedules = await self.async_get_schedules()
+            if schedules is not None:
+                if capabilities.bulk_schedules is None:
+                    capabilities.bulk_schedules = True
+                    self._async_save_capabilities()
+                return {key: schedules.get(key, {}) for key in devices}
+            if capabilities.bulk_schedules is None and self._schedules_rejected():
+                # Older firmwares only know getSchedule.
+                _LOGGER.debug("Bulk schedule listing unsupported, using per-device")
+                capabilities.bulk_schedules = False
+                self._async_save_capabilities()
+
+        schedules = await asyncio.gather(
+            *(self.async_get_device_schedule(key) for key in devices)
+        )
+        return dict(zip(devices, schedules, strict=True))
+
+    def _schedules_rejected(self) -> bool:
+        """Return whether the Livebox itself refused the bulk schedule listing.
+
+        A timeout or a lost connection says nothing about the firmware: the
+        listing is tried again at the next refresh.
+        """
+        key = request_key(self.api.schedule.async_get_schedules, {"type": "ToD"})
+        if key in self.capabilities.unsupported:
+            return True
+        if (breaker := self.breakers.get(key)) is None:
+            return False
+        return self._capabilities_settled() and (
+            breaker.rejected or (breaker.answered and not breaker.failures)
+        )
+
+    def _capabilities_settled(self) -> bool:
+        """Return whether rejected requests tell what the firmware supports.
+
+        Not before the firmware is known, nor while the Livebox is booting.
+        """
+        return (
+            bool(self.capabilities.software_version)
+            and self.uptime > BOOT_GRACE.total_seconds()
+        )
+
+    async def async_get_schedules(self) -> dict[str, Any] | None:
+        """Get all ToD schedules indexed by device ID.
+
+        Return None when the router does not answer the bulk listing.
+        """
+        data = (
+            await self._make_request(
+                self.api.schedule.async_get_schedules, {"type": "ToD"}
+            )
+        ).get("data")
+        if not isinstance(data, dict) or not isinstance(
+            schedules := data.get("scheduleInfo"), list
+        ):
+            return None
+        return {
+            schedule["ID"]: schedule
+            for schedule in schedules
+            if isinstance(schedule, dict) and schedule.get("ID")
+        }
+
     async def async_get_device_schedule(self, device_key):
         """Get device schedule."""
         parameters = {"type": "ToD", "ID": device_key}
@@ -481,7 +1836,10 @@ class LiveboxDataUpdateCoordinator(DataUpdateCoordinator):
         if self.data and self.data.get("devices"):
             for key in devices:
                 if key not in self.data.get("devices", {}):
-                    self.data["devices"] = devices
+                    # Platforms add the new entities from the data. Replaced,
+                    # not changed in place: listeners diff against the last
+                    # notified data.
+                    self.data = self.data | {"devices": devices}
                     async_dispatcher_send(self.hass, self.signal_device_new)
                     async_dispatcher_send(self.hass, self.signal_wan_access_new)
                     break
@@ -510,9 +1868,6 @@ class LiveboxDataUpdateCoordinator(DataUpdateCoordinator):
         self, domain: str = "default"
     ) -> list[dict[str, Any]]:
         """Get dhcp leases."""
-        if self.model == 5656:
-            return []
-
         data = (await self._make_request(self.api.dhcp.async_get_dhcp_pool)).get(
             "status", {}
         )
@@ -534,67 +1889,237 @@ class LiveboxDataUpdateCoordinator(DataUpdateCoordinator):
             for item in data.get(domain, {}).values()
         ]
 
-    async def async_get_results(self) -> dict[str, Any]:
-        """Get interfaces."""
-        results = {}
-
+    async def async_get_interfaces(self) -> dict[str, Any]:
+        """Get home LAN interfaces indexed by friendly name."""
         data = (await self._make_request(self.api.homelan.async_get_interface)).get(
             "status", {}
         )
-
-        interfaces = {
+        return {
             item["FriendlyName"]: item
             for item in data.values()
             if "Name" in item and "FriendlyName" in item and "vlan" not in item["Name"]
         }
 
+    async def async_get_results(
+        self, interfaces: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Collect the interface traffic readings and return the interface rates."""
+        if interfaces is None:
+            interfaces = await self.async_get_interfaces()
+        await self.async_collect_stats(interfaces)
+        return self.get_stats(interfaces)
+
+    async def async_collect_stats(self, interfaces: dict[str, Any]) -> None:
+        """Append the new traffic readings of the interfaces to their buffer.
+
+        The call takes seconds, so each one requests every reading made since
+        the previous collection, catching up after gaps as far as the router
+        keeps history. When the recorder runs, readings are also imported into
+        long-term statistics once their hour is complete, so outages of Home
+        Assistant leave no hole in the history.
+        """
+        if self._stats_reading_interval is None:
+            self._stats_reading_interval = (
+                await self._make_request(self.api.homelan.async_get_reading_interval)
+            ).get("status") or STATS_READING_INTERVAL
+        if self._stats_max_readings is None:
+            self._stats_max_readings = (
+                await self._make_request(self.api.homelan.async_get_maxnumber_records)
+            ).get("status") or STATS_MAX_READINGS
+        now = time()
+        recording = self.unique_id is not None and (
+            "recorder" in self.hass.config.components
+        )
+        imported_until = self._statistics_imported_until
+        if recording:
+            for key, item in interfaces.items():
+                if key in imported_until:
+                    continue
+                # A new interface starts with the current hour, without moving
+                # the cutoff of the others.
+                imported_until[key] = await async_get_imported_until(
+                    self.hass,
+                    (
+                        traffic_statistic_id(cast(str, self.unique_id), item["Name"], d)
+                        for d in ("rx", "tx")
+                    ),
+                ) or hour_start(now)
+        since = self._stats_collected_at or min(
+            (imported_until[key] for key in interfaces if key in imported_until),
+            default=None,
+        )
+        gap = now - since if since is not None else STATS_SCAN_INTERVAL.total_seconds()
+        number = min(
+            max(ceil(gap / self._stats_reading_interval), 1), self._stats_max_readings
+        )
+
         data = (
             await self._make_request(
                 self.api.homelan.async_get_results,
-                {"InterfaceName": list(interfaces.keys()), "NumberOfReadings": 1},
+                {"InterfaceName": list(interfaces.keys()), "NumberOfReadings": number},
             )
         ).get("status", {})
+        if not data:
+            return
 
-        for key, item in interfaces.items():
-            traffic = data.get(key, {}).get("Traffic", [])
-            stats = traffic[0] if traffic else {}
+        for key in interfaces:
+            traffic = data.get(key, {}).get("Traffic") or []
+            buffer = self.stats_readings.setdefault(
+                key, deque(maxlen=STATS_MAX_READINGS)
+            )
+            newest = buffer[-1].get("Timestamp", 0) if buffer else None
+            readings = [
+                reading
+                for reading in sorted(traffic, key=lambda r: r.get("Timestamp", 0))
+                if newest is None or reading.get("Timestamp", 0) > newest
+            ]
+            buffer.extend(readings)
+            if recording:
+                self._pending_statistics.setdefault(key, []).extend(
+                    reading
+                    for reading in readings
+                    if reading.get("Timestamp", 0) >= imported_until[key]
+                )
+        self._stats_collected_at = now
+        if recording:
+            self._async_import_statistics(interfaces, hour_start(now))
 
-            # Rx_Counter and Tx_Counter are byte counters collected over
-            # a 30-second window.
-            # Convert them to Mbit/s to match the sensor unit declaration.
-            bytes_to_mbit_per_second = 8 / 30 / 1000000
+    @callback
+    def _async_import_statistics(
+        self, interfaces: dict[str, Any], until: float
+    ) -> None:
+        """Import the pending readings of the hours completed before until."""
+        for key, item in interfaces.items():
+            if until <= self._statistics_imported_until[key]:
+                continue
+            pending = self._pending_statistics.get(key, [])
+            if complete := [r for r in pending if r.get("Timestamp", 0) < until]:
+                async_import_traffic(
+                    self.hass,
+                    cast(str, self.unique_id),
+                    item["Name"],
+                    key,
+                    complete,
+                    cast(int, self._stats_reading_interval),
+                )
+            self._pending_statistics[key] = [
+                r for r in pending if r.get("Timestamp", 0) >= until
+            ]
+            self._statistics_imported_until[key] = until
 
-            results.update(
-                {
-                    item["Name"]: {
-                        "friendly_name": key,
-                        "alias": item.get("alias"),
-                        "rate_rx": round(
-                            stats.get("Rx_Counter", 0) * bytes_to_mbit_per_second, 2
-                        ),
-                        "rate_tx": round(
-                            stats.get("Tx_Counter", 0) * bytes_to_mbit_per_second, 2
-                        ),
-                    }
-                }
-            )
+    def get_stats(self, interfaces: dict[str, Any]) -> dict[str, Any]:
+        """Return the rates of the latest buffered reading of each interface."""
+        results = {}
+        # Rx_Counter and Tx_Counter are byte counters collected over a reading
+        # interval. Convert them to Mbit/s to match the sensor unit declaration.
+        bytes_to_mbit_per_second = (
+            8 / (self._stats_reading_interval or STATS_READING_INTERVAL) / 1000000
+        )
+        for key, item in interfaces.items():
+            buffer = self.stats_readings.get(key)
+            stats = buffer[-1] if buffer else {}
+            results[item["Name"]] = {
+                "friendly_name": key,
+                "alias": item.get("alias"),
+                # Unknown until a reading was collected, not a null rate.
+                "rate_rx": _counter_rate(stats, "Rx_Counter", bytes_to_mbit_per_second),
+                "rate_tx": _counter_rate(stats, "Tx_Counter", bytes_to_mbit_per_second),
+            }
         return results
 
+    @callback
+    def _async_start_stats_collection(self, _now: datetime | None = None) -> None:
+        """Collect interface statistics in the background."""
+        interfaces = self._section_results.get("interfaces")
+        if (
+            not interfaces
+            or "interfaces" in self.skipped_sections
+            or (self._stats_task is not None and not self._stats_task.done())
+        ):
+            return
+        self._stats_task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_refresh_stats(interfaces),
+            name=f"{DOMAIN}_stats_collection",
+        )
+
+    async def _async_refresh_stats(self, interfaces: dict[str, Any]) -> None:
+        """Collect interface statistics and push them to entities."""
+        stats = await self.async_get_results(interfaces)
+        if self.data is not None:
+            self.data = self.data | {"stats": stats}
+            self.async_update_listeners()
+
     async def _make_request(
         self, func: Callable[..., Any], *args: Any
     ) -> dict[str, Any]:
-        """Execute request."""
-        try:
-            return await func(*args)
-        except AiosysbusException as error:
-            _LOGGER.error("Error while execute: %s (%s)", func.__name__, error)
-        return {}
+        """Execute request.
+
+        A failing endpoint serves its last good response. Once its breaker is
+        open, it is only called again after the backoff has elapsed.
+        """
+        endpoint = _endpoint_name(func)
+        key = request_key(func, *args)
+        if (found_at := self.capabilities.unsupported.get(key)) is not None:
+            if time() - found_at < UNSUPPORTED_RETRY.total_seconds():
+                return {}
+            # An outage may have passed for a missing feature: probe it again.
+            del self.capabilities.unsupported[key]
+            self.breakers.pop(key, None)
+            self._async_save_capabilities()
+        breaker = self.breakers.get(key)
+        if breaker is None:
+            breaker = self.breakers[key] = EndpointBreaker(endpoint=endpoint)
+        if breaker.is_open and monotonic() < breaker.retry_at:
+            return breaker.last_response
+
+        async with self.scheduler.slot():
+            try:
+                response = await func(*args)
+            except AiosysbusException as error:
+                _raise_if_cancelling()
+                breaker.record_failure(error, monotonic())
+                if (
+                    isinstance(error, RetrieveFailed)
+                    and breaker.failures == BREAKER_THRESHOLD
+                    and not breaker.answered
+                    and endpoint not in PER_DEVICE_ENDPOINTS
+                    and endpoint not in CORE_ENDPOINTS
+                    and self._capabilities_settled()
+                ):
+                    _LOGGER.debug("%s is not supported (%s)", key, error)
+                    self.capabilities.unsupported[key] = time()
+                    self._async_save_capabilities()
+                if not breaker.is_open:
+                    _LOGGER.error("Error while execute: %s (%s)", endpoint, error)
+                elif breaker.failures == BREAKER_THRESHOLD:
+                    _LOGGER.warning(
+                        "%s failed %s times in a row (%s), retrying in %ss",
+                        endpoint,
+                        breaker.failures,
+                        error,
+                        BREAKER_BACKOFF,
+                    )
+                else:
+                    _LOGGER.debug("%s still failing (%s)", endpoint, error)
+                return breaker.last_response
+
+        if breaker.is_open:
+            _LOGGER.info("%s is answering again", endpoint)
+        breaker.record_success(response)
+        self.responses.put(key, response)
+        return response
 
     @property
     def signal_device_new(self) -> str:
         """Event specific per Livebox entry to signal new device."""
         return f"{DOMAIN}-{self.unique_id}-device-new"
 
+    @property
+    def signal_tracking_changed(self) -> str:
+        """Event specific per Livebox entry to signal changed tracking options."""
+        return f"{DOMAIN}-{self.unique_id}-tracking-changed"
+
     @property
     def signal_wan_access_new(self) -> str:
         """Event specific per Livebox entry to signal new device."""
@@ -8,17 +8,18 @@ from typing import Any, cast
 
 from homeassistant.components.device_tracker import ScannerEntity
 from homeassistant.components.device_tracker.const import SourceType
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
 from . import LiveboxConfigEntry
 from .const import CONF_TRACKING_TIMEOUT, DEFAULT_TRACKING_TIMEOUT, DOMAIN
 from .coordinator import LiveboxDataUpdateCoordinator
-from .entity import LiveboxEntity
+from .entity import LiveboxEntity, async_forget_untracked_devices
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -103,6 +104,7 @@ async def async_setup_entry(
             hass, coordinator.signal_device_new, async_update_router
         )
     )
+    async_forget_untracked_devices(hass, entry, coordinator, tracked)
 
     async_update_router()
 
@@ -152,11 +154,22 @@ class LiveboxDeviceScannerEntity(  # pyrefly: ignore[inconsistent-inheritance]
         device: dict[str, Any],
     ) -> None:
         """Initialize the device tracker."""
-        super().__init__(coordinator, description)
+        device_key = cast(str | None, device.get("Key"))
+        super().__init__(
+            coordinator,
+            description,
+            (("devices", device_key or ""), ("topology_via_device", device_key or "")),
+        )
         self._device = device
-        self._device_key = cast(str | None, device.get("Key"))
+        self._device_key = device_key
+        self._unsub_tracking_timeout: CALLBACK_TYPE | None = None
         self._via_device = coordinator.get_parent_device_identifier(self._device_key)
         self._old_status = datetime.today()
+        # A device seen active in the snapshot of the previous run may have
+        # left since: the tracking timeout only starts from live data.
+        self._seen_live = not coordinator.from_snapshot
+        if self._seen_live and device.get("Active") is True:
+            self._async_seen_active()
         self._attr_is_connected = device.get("Active", False)
         self._attr_source_type = SourceType.ROUTER
         self._attr_mac_address = self._device_key
@@ -226,12 +239,7 @@ class LiveboxDeviceScannerEntity(  # pyrefly: ignore[inconsistent-inheritance]
     @property
     def is_connected(self) -> bool:
         """Return true if the device is connected to the network via router."""
-        timeout_tracking = self.coordinator.config_entry.options.get(
-            CONF_TRACKING_TIMEOUT, DEFAULT_TRACKING_TIMEOUT
-        )
         status = self._device.get("Active", False)
-        if status is True:
-            self._old_status = datetime.today() + timedelta(seconds=timeout_tracking)
         if status is False and self._old_status > datetime.today():
             _LOGGER.debug("%s will be disconnected at %s", self.name, self._old_status)
             return True
@@ -256,9 +264,15 @@ class LiveboxDeviceScannerEntity(  # pyrefly: ignore[inconsistent-inheritance]
     @callback
     def _handle_coordinator_update(self) -> None:
         """Respond to a DataUpdateCoordinator update."""
+        # Unchanged data is not notified: a device active until this update
+        # was seen active up to now.
+        was_active = self._seen_live and self._device.get("Active") is True
         self._device = self.coordinator.data.get("devices", {}).get(
             self._device_key, {}
         )
+        self._seen_live = not self.coordinator.from_snapshot
+        if self._seen_live and (was_active or self._device.get("Active") is True):
+            self._async_seen_active()
         self._attr_ip_address = self._device.get("IPAddress")
         via_device = self.coordinator.get_parent_device_identifier(self._device_key)
         if via_device != self._via_device and self.device_entry is not None:
@@ -272,3 +286,41 @@ class LiveboxDeviceScannerEntity(  # pyrefly: ignore[inconsistent-inheritance]
             self._via_device = via_device
 
         self.async_write_ha_state()
+        self._async_schedule_tracking_timeout()
+
+    @callback
+    def _async_seen_active(self) -> None:
+        """Report the device home until the tracking timeout from now."""
+        timeout_tracking = self.coordinator.config_entry.options.get(
+            CONF_TRACKING_TIMEOUT, DEFAULT_TRACKING_TIMEOUT
+        )
+        self._old_status = datetime.today() + timedelta(seconds=timeout_tracking)
+
+    @callback
+    def _async_schedule_tracking_timeout(self) -> None:
+        """Write the state again once a disconnected device times out.
+
+        Unchanged data no longer writes the entity, so nothing else would
+        report the device away at the end of the tracking timeout.
+        """
+        if self._unsub_tracking_timeout is not None:
+            self._unsub_tracking_timeout()
+            self._unsub_tracking_timeout = None
+        remaining = (self._old_status - datetime.today()).total_seconds()
+        if self._device.get("Active", False) is False and remaining > 0:
+            self._unsub_tracking_timeout = async_call_later(
+                self.hass, remaining, self._async_tracking_timeout
+            )
+
+    @callback
+    def _async_tracking_timeout(self, _now: datetime) -> None:
+        """Report the device away once its tracking timeout elapsed."""
+        self._unsub_tracking_timeout = None
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the pending tracking timeout."""
+        await super().async_will_remove_from_hass()
+        if self._unsub_tracking_timeout is not None:
+            self._unsub_tracking_timeout()
+            self._unsub_tracking_timeout = None
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from time import time
+from collections.abc import Callable
+from dataclasses import asdict
+from time import monotonic, time
 from typing import Any
 
+from aiosysbus.exceptions import TimeoutExceededError
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
+from .const import DOMAIN
+from .coordinator import PRIORITY_DIAGNOSTICS, request_key
+
 TO_REDACT = {
     "address",
     "Address",
@@ -101,9 +108,23 @@ TO_REDACT = {
     "WEPKey",
 }
 
+# Longer than the 30s topology build requested below.
+CALL_TIMEOUT = 45
+# Calls still waiting for the router after this time are given up.
+TIME_BUDGET = 120
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def _dump(result: Any) -> Any:
+    """Return a JSON serializable version of an API response."""
+    if isinstance(result, (dict, list, set, float, int, str, tuple)) or result is None:
+        return result
+    if hasattr(result, "__dict__"):
+        return vars(result)
+    return f"Can't dump {type(result)!s} data"
+
+
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> dict[str, Any]:
@@ -154,6 +175,7 @@ async def async_get_config_entry_diagnostics(
         coordinator.api.firewall.async_get_port_forwarding,
         coordinator.api.upnpigd.async_get,
         coordinator.api.schedule.async_get_scheduletypes,
+        (coordinator.api.schedule.async_get_schedules, [{"type": "ToD"}]),
         coordinator.api.dhcp.async_get_dhcp_pool,
         coordinator.api.dhcp.async_get_dhcp_leases,
         (coordinator.api.dhcp.async_get_dhcp_leases, [None, "guest"]),
@@ -166,7 +188,6 @@ async def async_get_config_entry_diagnostics(
         # coordinator.api.event.async_get_events,  # take 10s
         coordinator.api.userinterface.async_get_language,
         coordinator.api.userinterface.async_get_state,
-        coordinator.api.upnpigd.async_get,
         coordinator.api.homelan.async_get_interface,
         # coordinator.api.homelan.async_get_results,  # take 5s
         # coordinator.api.homelan.async_get_devices_results,  # take 13s
@@ -195,7 +216,6 @@ async def async_get_config_entry_diagnostics(
         coordinator.api.nmc.async_get_iptv_config,
         coordinator.api.nmc.async_get_iptv_multi_screens,
         coordinator.api.nmc.async_autodetect,
-        coordinator.api.nmc.async_get_wan_status,
         coordinator.api.nmc.async_get_remote_access,
         coordinator.api.usermanagement.async_get_users,
         coordinator.api.usermanagement.async_get_groups,
@@ -238,43 +258,74 @@ async def async_get_config_entry_diagnostics(
         ),
     ]
 
-    _LOGGER.debug("Start building diagnostics data...")
-    start_time = time()
-    api_raw: dict[str, Any] = {}
+    calls: dict[str, tuple[Callable[..., Any], list[Any]]] = {}
     for api_method in api_methods:
-        params = None
-        qualified_name = "unknown"
-        try:
-            if isinstance(api_method, tuple):
-                api_method, params = api_method
-                str_p = "_".join(str(e) for e in params)
-                qualified_name = f"{api_method.__qualname__}::{str_p}"
-            else:
-                qualified_name = api_method.__qualname__
+        params: list[Any] = []
+        if isinstance(api_method, tuple):
+            api_method, params = api_method
+        qualified_name = getattr(api_method, "__qualname__", None) or repr(api_method)
+        if params:
+            qualified_name += "::" + "_".join(str(e) for e in params)
+        calls[qualified_name] = (api_method, params)
 
+    api_raw: dict[str, Any] = {}
+    api_timings: dict[str, float] = {}
+    api_cached: list[str] = []
+
+    async def _async_call(
+        qualified_name: str, api_method: Callable[..., Any], params: list[Any]
+    ) -> None:
+        key = request_key(api_method, *params)
+        if (response := coordinator.responses.get(key)) is not None:
+            # Fetched moments ago, no need to ask the router again.
+            api_raw[qualified_name] = _dump(response)
+            api_cached.append(qualified_name)
+            return
+        async with coordinator.scheduler.slot(PRIORITY_DIAGNOSTICS):
             _LOGGER.debug("Call API %s method...", qualified_name)
-            result = await api_method(*params) if params else await api_method()
-            api_raw[qualified_name] = (
-                result
-                if isinstance(result, (dict, list, set, float, int, str, tuple))
-                or result is None
-                else (
-                    vars(result)
-                    if hasattr(result, "__dict__")
-                    else f"Can't dump {type(result)!s} data"
-                )
-            )
-        except Exception as err:  # pylint: disable=broad-exception-caught
-            api_raw[qualified_name] = f"Exception: {err}"
-    _LOGGER.debug("Diagnostics data built in %0.1fs", time() - start_time)
+            call_start = monotonic()
+            call_timeout = asyncio.timeout(CALL_TIMEOUT)
+            try:
+                async with call_timeout:
+                    response = await api_method(*params)
+                coordinator.responses.put(key, response)
+                api_raw[qualified_name] = _dump(response)
+            except (TimeoutError, TimeoutExceededError) as err:
+                # aiosysbus turns a cancellation into its own timeout error.
+                if call_timeout.expired():
+                    api_raw[qualified_name] = f"Timeout after {CALL_TIMEOUT}s"
+                elif (task := asyncio.current_task()) and task.cancelling():
+                    raise asyncio.CancelledError from err
+                else:
+                    api_raw[qualified_name] = f"Exception: {err}"
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                api_raw[qualified_name] = f"Exception: {err}"
+            api_timings[qualified_name] = round(monotonic() - call_start, 3)
 
-    lucky_address = api_raw.get("NeMo.async_lucky_addr_address::lan", {})
-    if isinstance(lucky_address, dict) and lucky_address.get("status"):
-        lucky_address["status"] = "**REDACTED**"
+    # Calls share the request slots of the coordinator, behind its polling.
+    _LOGGER.debug("Start building diagnostics data...")
+    start_time = time()
+    tasks = [
+        asyncio.create_task(_async_call(name, *call), name=f"{DOMAIN}_diagnostics")
+        for name, call in calls.items()
+    ]
+    _, pending = await asyncio.wait(tasks, timeout=TIME_BUDGET)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.wait(pending)
+    for name in calls:
+        api_raw.setdefault(name, f"Skipped: time budget of {TIME_BUDGET}s exceeded")
+    _LOGGER.debug("Diagnostics data built in %0.1fs", time() - start_time)
 
-    lucky_address = api_raw.get("NeMo.async_lucky_addr_address::data", {})
-    if isinstance(lucky_address, dict) and lucky_address.get("status"):
-        lucky_address["status"] = "**REDACTED**"
+    for name in (
+        "NeMo.async_lucky_addr_address::lan",
+        "NeMo.async_lucky_addr_address::data",
+    ):
+        lucky_address = api_raw.get(name, {})
+        if isinstance(lucky_address, dict) and lucky_address.get("status"):
+            # Copied, the response may be shared with the response cache.
+            api_raw[name] = lucky_address | {"status": "**REDACTED**"}
 
     return {
         "entry": {
@@ -282,5 +333,25 @@ async def async_get_config_entry_diagnostics(
             "options": async_redact_data(entry.options, TO_REDACT),
         },
         "data": async_redact_data(coordinator.data, TO_REDACT),
-        "api_raw": async_redact_data(api_raw, TO_REDACT),
+        "profile": asdict(coordinator.profile) if coordinator.profile else None,
+        "capabilities": asdict(coordinator.capabilities),
+        "fetch_plan": [section.key for section in coordinator.fetch_plan],
+        "section_timings": coordinator.section_timings,
+        "circuit_breakers": [
+            {
+                "endpoint": breaker.endpoint,
+                "failures": breaker.failures,
+                "open": breaker.is_open,
+                "retry_in": max(round(breaker.retry_at - monotonic()), 0),
+                "last_error": breaker.last_error,
+            }
+            for breaker in coordinator.breakers.values()
+            if breaker.failures
+        ],
+        "skipped_sections": sorted(coordinator.skipped_sections),
+        "api_raw": async_redact_data(
+            {name: api_raw[name] for name in calls}, TO_REDACT
+        ),
+        "api_timings": api_timings,
+        "api_cached": sorted(api_cached),
     }
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -10,18 +13,59 @@ from .const import CONF_USE_TLS, DOMAIN
 from .coordinator import LiveboxDataUpdateCoordinator
 
 
+@callback
+def async_forget_untracked_devices(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: LiveboxDataUpdateCoordinator,
+    added: set[str],
+) -> None:
+    """Drop the devices no longer tracked from the keys a platform added.
+
+    Their entities remove themselves, so forgetting the keys lets the platform
+    add them again once the devices are tracked again.
+    """
+
+    @callback
+    def _async_tracking_changed() -> None:
+        added.intersection_update(coordinator.data.get("devices", {}))
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            coordinator.signal_tracking_changed,
+            _async_tracking_changed,
+        )
+    )
+
+
 class LiveboxEntity(CoordinatorEntity[LiveboxDataUpdateCoordinator]):
     """Base class for all entities."""
 
     entity_description: EntityDescription
     _attr_has_entity_name = True
+    # Key of the Livebox device a per-device entity belongs to.
+    _device_key: str | None = None
 
     def __init__(
-        self, coordinator: LiveboxDataUpdateCoordinator, description: EntityDescription
+        self,
+        coordinator: LiveboxDataUpdateCoordinator,
+        description: EntityDescription,
+        data_keys: tuple[str | tuple[str, ...], ...] | None = None,
     ) -> None:
-        """Initialize the entity."""
-        super().__init__(coordinator)
+        """Initialize the entity.
+
+        The entity is only written when the data behind ``data_keys`` changes,
+        defaulting to the ``data_keys`` of its description. Without any, it is
+        written after every refresh.
+        """
+        if data_keys is None:
+            data_keys = getattr(description, "data_keys", None)
+        super().__init__(coordinator, data_keys)
         self.entity_description = description
+        self._top_data_keys = {
+            key if isinstance(key, str) else key[0] for key in data_keys or ()
+        }
 
         config_entry = coordinator.config_entry
         data = coordinator.data or {}
@@ -40,3 +84,30 @@ class LiveboxEntity(CoordinatorEntity[LiveboxDataUpdateCoordinator]):
             sw_version=infos.get("SoftwareVersion"),
             configuration_url=f"{scheme}://{config_entry.data.get('host')}:{config_entry.data.get('port')}",
         )
+
+    @property
+    def available(self) -> bool:
+        """Return False until the data of the entity was first fetched."""
+        return super().available and not self._top_data_keys.intersection(
+            self.coordinator.pending_keys
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Follow tracking option changes for per-device entities."""
+        await super().async_added_to_hass()
+        if self._device_key is not None:
+            self.async_on_remove(
+                async_dispatcher_connect(
+                    self.hass,
+                    self.coordinator.signal_tracking_changed,
+                    self._async_tracking_changed,
+                )
+            )
+
+    @callback
+    def _async_tracking_changed(self) -> None:
+        """Remove the entity once its device is no longer tracked."""
+        if self._device_key not in self.coordinator.data.get("devices", {}):
+            self.coordinator.config_entry.async_create_task(
+                self.hass, self.async_remove()
+            )
@@ -1,11 +1,79 @@
 """Helpers functions."""
 
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 
+class KeyPath:
+    """Path to a value of the coordinator data, parsed once.
+
+    The path is either a dotted string ("key.key.0.key"), where an element of
+    an array is addressed by its index, or a tuple of keys when a key may
+    itself contain a dot (interface names, device keys). Calling the path
+    returns the value, or ``default`` when a key is missing, passed through
+    ``convert`` when given.
+
+    Example:
+        >>> KeyPath("a.b.0.c")({"a": {"b": [{"c": "value_a"}, {"d": "value_b"}]}})
+        "value_a"
+        >>> KeyPath("a.b.1.c", default="default")({"a": {"b": [{"c": "value"}]}})
+        "default"
+    """
+
+    __slots__ = ("_keys", "convert", "default", "path")
+
+    def __init__(
+        self,
+        path: str | tuple[str, ...],
+        *,
+        default: Any = None,
+        convert: Callable[[Any], Any] | None = None,
+    ) -> None:
+        """Parse the path."""
+        self.path = path if isinstance(path, str) else ".".join(path)
+        self.default = default
+        self.convert = convert
+        keys = path.split(".") if isinstance(path, str) else path
+        self._keys: tuple[tuple[str, int | None], ...] = tuple(
+            (key, int(key) if key.isdigit() else None) for key in keys
+        )
+
+    def __repr__(self) -> str:
+        """Return the representation of the path."""
+        return f"KeyPath({self.path!r})"
+
+    def __call__(self, data: dict[str, Any]) -> Any:
+        """Return the converted value of the path in data."""
+        value = self.get(data, self.default)
+        return value if self.convert is None else self.convert(value)
+
+    def get(self, data: dict[str, Any], default: Any = None) -> Any:
+        """Return the raw value of the path in data, or default if not found."""
+        current: Any = data
+        for key, index in self._keys:
+            if isinstance(current, dict):
+                current = current.get(key)
+            elif isinstance(current, list) and index is not None:
+                current = current[index] if index < len(current) else None
+            else:
+                return default
+            if current is None:
+                return default
+        return current
+
+
+@lru_cache(maxsize=256)
+def _compile(key_chain: str) -> KeyPath:
+    """Return the compiled path of a dotted string."""
+    return KeyPath(key_chain)
+
+
 def find_item(data: dict[str, Any], key_chain: str, default: Any = None) -> Any:
     """Get recursive key and return value.
 
+    Prefer a ``KeyPath`` built once for paths read on every refresh.
+
     Parameters:
         data (dict[str, Any]) : dictionary to search
         key (str): searched string with dot for key delimited (ex: "key.key.key")
@@ -20,16 +88,4 @@ def find_item(data: dict[str, Any], key_chain: str, default: Any = None) -> Any:
         >>> find_item({"a": {"b": [{"c": "value"}]}}, "a.b.1.c", "default")
         "default"
     """
-    current: Any = data
-    if (keys := key_chain.split(".")) and isinstance(keys, list):
-        for key in keys:
-            if isinstance(current, dict):
-                current = current.get(key)
-            elif (
-                isinstance(current, list)
-                and len(current) > 0
-                and key.isdigit()
-                and int(key) < len(current)
-            ):
-                current = current[int(key)]
-    return default if current is None and default is not None else current
+    return _compile(key_chain).get(data, default)
@@ -28,8 +28,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from . import LiveboxConfigEntry
 from .const import DOMAIN, DOWNLOAD_ICON, PHONE_ICON, UPLOAD_ICON
 from .coordinator import LiveboxDataUpdateCoordinator
-from .entity import LiveboxEntity
-from .helpers import find_item
+from .entity import LiveboxEntity, async_forget_untracked_devices
+from .helpers import KeyPath
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,6 +40,7 @@ class LiveboxSensorEntityDescription(SensorEntityDescription):
 
     value_fn: Callable[..., Any]
     attrs: dict[str, Callable[..., Any]] | None = None
+    data_keys: tuple[str | tuple[str, ...], ...] | None = None
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -48,45 +49,17 @@ class LiveboxDeviceSensorEntityDescription(SensorEntityDescription):
 
     value_fn: Callable[..., Any]
     attrs: dict[str, Callable[..., Any]] | None = None
+    data_keys: tuple[str | tuple[str, ...], ...] | None = None
 
 
-def get_rolling_32_bit_value_fn(path: str) -> Callable[..., Any]:
-    """Returns a closure function, that extracts a rolling 32-bit value from"""
-    """the coordinator data structure, and tweaks its result so that HASS"""
-    """properly accumulates the total rolling value."""
-    """Meant for monotonically increasing counters: fiber/DSL Tx/Rx, and WiFi Tx/Rx"""
+def get_counter_value_fn(counter: str) -> KeyPath:
+    """Return the value function of a byte counter accumulated by the coordinator."""
+    return KeyPath(("counters", counter), default=0)
 
-    previous_reading: int = 0
-    previous_uptime: int = 0
-    rolls: int = 0
 
-    def value_fn(coordinator_data) -> int:
-        nonlocal previous_reading
-        nonlocal previous_uptime
-        nonlocal rolls
-        current_uptime = coordinator_data.get("infos", {}).get("UpTime") or 0
-        current_reading = find_item(coordinator_data, path, 0)
-
-        if current_uptime < previous_uptime:
-            # The router has reset, so clear up previous counter value
-            previous_reading = 0
-            rolls = 0
-
-        if current_reading < previous_reading:
-            _LOGGER.debug("Rolling over 32-bit integer counter: %s", path)
-            rolls += 1
-
-        previous_reading = current_reading
-        previous_uptime = current_uptime
-
-        return (rolls << 32) + current_reading
-
-    return value_fn
-
-
-def get_closure_value_fn(path: str) -> Callable[..., Any]:
-    """Returns a closure function for value_fn of entities with variable name"""
-    return lambda x: find_item(x, path)
+def get_rate_value_fn(counter: str) -> KeyPath:
+    """Return the value function of a throughput derived from a byte counter."""
+    return KeyPath(("rates", counter))
 
 
 def kilobits_per_second_to_megabits_per_second(value: Any) -> float:
@@ -113,53 +86,20 @@ def _get_wireless_device_value_fn(
     device_key: str, path: str, default: Any = None
 ) -> Callable[..., Any]:
     """Return a sensor value function for a device field."""
-    return lambda data: find_item(data, f"devices.{device_key}.{path}", default)
+    return KeyPath(("devices", device_key, path), default=default)
 
 
 def _get_wireless_device_rate_value_fn(
     device_key: str, path: str
 ) -> Callable[..., Any]:
     """Return a Mbit/s sensor value function for a Kbit/s device rate field."""
-    return lambda data: kilobits_per_second_to_megabits_per_second(
-        find_item(data, f"devices.{device_key}.{path}", 0)
+    return KeyPath(
+        ("devices", device_key, path),
+        default=0,
+        convert=kilobits_per_second_to_megabits_per_second,
     )
 
 
-def _get_associated_wifi_device(
-    coordinator_data: dict[str, Any], device_key: str
-) -> dict[str, Any] | None:
-    """Return the AP-side payload for a Wi-Fi client when available."""
-    for lan_device in coordinator_data.get("lan", []):
-        if lan_device.get("type") != "Wireless":
-            continue
-        associated_devices = lan_device.get("extra_attributes", {}).get(
-            "associated_devices", {}
-        )
-        if not isinstance(associated_devices, dict):
-            continue
-        for associated_device in associated_devices.values():
-            if not isinstance(associated_device, dict):
-                continue
-            if associated_device.get("MACAddress") == device_key:
-                return associated_device
-    return None
-
-
-def _get_associated_wifi_metric_value_fn(
-    device_key: str, metric: str, default: Any = None
-) -> Callable[..., Any]:
-    """Return a sensor value function for AP-side Wi-Fi statistics."""
-
-    def value_fn(coordinator_data: dict[str, Any]) -> Any:
-        associated_device = _get_associated_wifi_device(coordinator_data, device_key)
-        if associated_device is None:
-            return default
-        value = associated_device.get(metric)
-        return default if value is None else value
-
-    return value_fn
-
-
 def _is_wireless_device(device: dict[str, Any]) -> bool:
     """Return whether a Livebox device looks like a Wi-Fi client."""
     interface_name = device.get("InterfaceName", "")
@@ -199,8 +139,8 @@ DEVICE_SENSOR_TYPES: Final[list[dict[str, Any]]] = [
         "key": "tx_bytes",
         "name": "Tx Bytes",
         "icon": UPLOAD_ICON,
-        "value_fn_factory": lambda device_key: _get_associated_wifi_metric_value_fn(
-            device_key, "TxBytes", 0
+        "value_fn_factory": lambda device_key: get_counter_value_fn(
+            f"wifi_clients.{device_key}.TxBytes"
         ),
         "native_unit_of_measurement": UnitOfInformation.BYTES,
         "suggested_unit_of_measurement": UnitOfInformation.MEGABYTES,
@@ -211,14 +151,38 @@ DEVICE_SENSOR_TYPES: Final[list[dict[str, Any]]] = [
         "key": "rx_bytes",
         "name": "Rx Bytes",
         "icon": DOWNLOAD_ICON,
-        "value_fn_factory": lambda device_key: _get_associated_wifi_metric_value_fn(
-            device_key, "RxBytes", 0
+        "value_fn_factory": lambda device_key: get_counter_value_fn(
+            f"wifi_clients.{device_key}.RxBytes"
         ),
         "native_unit_of_measurement": UnitOfInformation.BYTES,
         "suggested_unit_of_measurement": UnitOfInformation.MEGABYTES,
         "state_class": SensorStateClass.TOTAL_INCREASING,
         "device_class": SensorDeviceClass.DATA_SIZE,
     },
+    {
+        "key": "download_throughput",
+        "name": "Download Throughput",
+        "icon": DOWNLOAD_ICON,
+        "value_fn_factory": lambda device_key: get_rate_value_fn(
+            f"wifi_clients.{device_key}.TxBytes"
+        ),
+        "native_unit_of_measurement": UnitOfDataRate.BYTES_PER_SECOND,
+        "suggested_unit_of_measurement": UnitOfDataRate.MEGABITS_PER_SECOND,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "device_class": SensorDeviceClass.DATA_RATE,
+    },
+    {
+        "key": "upload_throughput",
+        "name": "Upload Throughput",
+        "icon": UPLOAD_ICON,
+        "value_fn_factory": lambda device_key: get_rate_value_fn(
+            f"wifi_clients.{device_key}.RxBytes"
+        ),
+        "native_unit_of_measurement": UnitOfDataRate.BYTES_PER_SECOND,
+        "suggested_unit_of_measurement": UnitOfDataRate.MEGABITS_PER_SECOND,
+        "state_class": SensorStateClass.MEASUREMENT,
+        "device_class": SensorDeviceClass.DATA_RATE,
+    },
     {
         "key": "signal_strength",
         "name": "Signal Strength",
@@ -244,53 +208,48 @@ DEVICE_SENSOR_TYPES: Final[list[dict[str, Any]]] = [
 SENSOR_TYPES: Final[list[LiveboxSensorEntityDescription]] = [
     LiveboxSensorEntityDescription(
         key="down",
+        data_keys=("dsl_status",),
         name="xDSL Download",
         icon=DOWNLOAD_ICON,
         translation_key="down_rate",
-        value_fn=lambda x: find_item(x, "dsl_status.DownstreamCurrRate", 0),
+        value_fn=KeyPath("dsl_status.DownstreamCurrRate", default=0),
         native_unit_of_measurement=UnitOfDataRate.KILOBITS_PER_SECOND,
         suggested_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.DATA_RATE,
         attrs={
-            "downstream_maxrate": lambda x: find_item(
-                x, "dsl_status.DownstreamMaxRate"
+            "downstream_maxrate": KeyPath("dsl_status.DownstreamMaxRate"),
+            "downstream_lineattenuation": KeyPath(
+                "dsl_status.DownstreamLineAttenuation"
             ),
-            "downstream_lineattenuation": lambda x: find_item(
-                x, "dsl_status.DownstreamLineAttenuation"
-            ),
-            "downstream_noisemargin": lambda x: find_item(
-                x, "dsl_status.DownstreamNoiseMargin"
-            ),
-            "downstream_power": lambda x: find_item(x, "dsl_status.DownstreamPower"),
+            "downstream_noisemargin": KeyPath("dsl_status.DownstreamNoiseMargin"),
+            "downstream_power": KeyPath("dsl_status.DownstreamPower"),
         },
     ),
     LiveboxSensorEntityDescription(
         key="up",
+        data_keys=("dsl_status",),
         name="xDSL Upload",
         icon=UPLOAD_ICON,
         translation_key="up_rate",
-        value_fn=lambda x: x.get("dsl_status", {}).get("UpstreamCurrRate", 0),
+        value_fn=KeyPath("dsl_status.UpstreamCurrRate", default=0),
         native_unit_of_measurement=UnitOfDataRate.KILOBITS_PER_SECOND,
         suggested_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.DATA_RATE,
         attrs={
-            "upstream_maxrate": lambda x: find_item(x, "dsl_status.UpstreamMaxRate"),
-            "upstream_lineattenuation": lambda x: find_item(
-                x, "dsl_status.UpstreamLineAttenuation"
-            ),
-            "upstream_noisemargin": lambda x: find_item(
-                x, "dsl_status.UpstreamNoiseMargin"
-            ),
-            "upstream_power": lambda x: find_item(x, "dsl_status.UpstreamPower"),
+            "upstream_maxrate": KeyPath("dsl_status.UpstreamMaxRate"),
+            "upstream_lineattenuation": KeyPath("dsl_status.UpstreamLineAttenuation"),
+            "upstream_noisemargin": KeyPath("dsl_status.UpstreamNoiseMargin"),
+            "upstream_power": KeyPath("dsl_status.UpstreamPower"),
         },
     ),
     LiveboxSensorEntityDescription(
         key="wifi_rx",
+        data_keys=(("counters", "wifi_stats.RxBytes"),),
         name="Wifi Rx",
         icon="mdi:wifi-arrow-down",
-        value_fn=get_rolling_32_bit_value_fn("wifi_stats.RxBytes"),
+        value_fn=get_counter_value_fn("wifi_stats.RxBytes"),
         native_unit_of_measurement=UnitOfInformation.BYTES,
         suggested_unit_of_measurement=UnitOfInformation.MEGABYTES,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -300,9 +259,10 @@ SENSOR_TYPES: Final[list[LiveboxSensorEntityDescription]] = [
     ),
     LiveboxSensorEntityDescription(
         key="wifi_tx",
+        data_keys=(("counters", "wifi_stats.TxBytes"),),
         name="Wifi Tx",
         icon="mdi:wifi-arrow-up",
-        value_fn=get_rolling_32_bit_value_fn("wifi_stats.TxBytes"),
+        value_fn=get_counter_value_fn("wifi_stats.TxBytes"),
         native_unit_of_measurement=UnitOfInformation.BYTES,
         suggested_unit_of_measurement=UnitOfInformation.MEGABYTES,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -312,91 +272,128 @@ SENSOR_TYPES: Final[list[LiveboxSensorEntityDescription]] = [
     ),
     LiveboxSensorEntityDescription(
         key="fiber_power_rx",
+        data_keys=("fiber_status",),
         name="Fiber Power Rx",
-        value_fn=lambda x: round(
-            find_item(x, "fiber_status.SignalRxPower", 0) / 1000, 2
+        value_fn=KeyPath(
+            "fiber_status.SignalRxPower",
+            default=0,
+            convert=lambda x: round(x / 1000, 2),
         ),
         native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.SIGNAL_STRENGTH,
         translation_key="fiber_power_rx",
         attrs={
-            "Downstream max rate Gbps": lambda x: (
-                kilobits_per_second_to_gigabits_per_second(
-                    find_item(x, "fiber_status.DownstreamMaxRate", 0)
-                )
+            "Downstream max rate Gbps": KeyPath(
+                "fiber_status.DownstreamMaxRate",
+                default=0,
+                convert=kilobits_per_second_to_gigabits_per_second,
             ),
-            "Downstream current rate Gbps": lambda x: (
-                kilobits_per_second_to_gigabits_per_second(
-                    find_item(x, "fiber_status.DownstreamCurrRate", 0)
-                )
+            "Downstream current rate Gbps": KeyPath(
+                "fiber_status.DownstreamCurrRate",
+                default=0,
+                convert=kilobits_per_second_to_gigabits_per_second,
             ),
-            "Max bitrate (Gbps)": lambda x: megabits_per_second_to_gigabits_per_second(
-                find_item(x, "fiber_status.MaxBitRateSupported", 0)
+            "Max bitrate (Gbps)": KeyPath(
+                "fiber_status.MaxBitRateSupported",
+                default=0,
+                convert=megabits_per_second_to_gigabits_per_second,
             ),
-            "Temperature (°C)": lambda x: find_item(x, "fiber_status.Temperature"),
-            "Voltage (V)": lambda x: find_item(x, "fiber_status.Voltage"),
-            "Bias (mA)": lambda x: find_item(x, "fiber_status.Bias"),
-            "ONU State": lambda x: find_item(x, "fiber_status.ONUState"),
+            "Temperature (°C)": KeyPath("fiber_status.Temperature"),
+            "Voltage (V)": KeyPath("fiber_status.Voltage"),
+            "Bias (mA)": KeyPath("fiber_status.Bias"),
+            "ONU State": KeyPath("fiber_status.ONUState"),
         },
     ),
     LiveboxSensorEntityDescription(
         key="fiber_power_tx",
+        data_keys=("fiber_status",),
         name="Fiber Power Tx",
-        value_fn=lambda x: round(
-            find_item(x, "fiber_status.SignalTxPower", 0) / 1000, 2
+        value_fn=KeyPath(
+            "fiber_status.SignalTxPower",
+            default=0,
+            convert=lambda x: round(x / 1000, 2),
         ),
         native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.SIGNAL_STRENGTH,
         translation_key="fiber_power_tx",
         attrs={
-            "Upstream max rate (Gbps)": lambda x: (
-                kilobits_per_second_to_gigabits_per_second(
-                    find_item(x, "fiber_status.UpstreamMaxRate", 0)
-                )
+            "Upstream max rate (Gbps)": KeyPath(
+                "fiber_status.UpstreamMaxRate",
+                default=0,
+                convert=kilobits_per_second_to_gigabits_per_second,
             ),
-            "Upstream current rate (Gbps)": lambda x: (
-                kilobits_per_second_to_gigabits_per_second(
-                    find_item(x, "fiber_status.UpstreamCurrRate", 0)
-                )
+            "Upstream current rate (Gbps)": KeyPath(
+                "fiber_status.UpstreamCurrRate",
+                default=0,
+                convert=kilobits_per_second_to_gigabits_per_second,
             ),
-            "Max bitrate (Gbps)": lambda x: megabits_per_second_to_gigabits_per_second(
-                find_item(x, "fiber_status.MaxBitRateSupported", 0)
+            "Max bitrate (Gbps)": KeyPath(
+                "fiber_status.MaxBitRateSupported",
+                default=0,
+                convert=megabits_per_second_to_gigabits_per_second,
             ),
-            "Tx power (dbm)": lambda x: find_item(x, "fiber_status.SignalTxPower"),
-            "Temperature (°C)": lambda x: find_item(x, "fiber_status.Temperature"),
-            "Voltage (V)": lambda x: find_item(x, "fiber_status.Voltage"),
-            "Bias (mA)": lambda x: find_item(x, "fiber_status.Bias"),
-            "ONU State": lambda x: find_item(x, "fiber_status.ONUState"),
+            "Tx power (dbm)": KeyPath("fiber_status.SignalTxPower"),
+            "Temperature (°C)": KeyPath("fiber_status.Temperature"),
+            "Voltage (V)": KeyPath("fiber_status.Voltage"),
+            "Bias (mA)": KeyPath("fiber_status.Bias"),
+            "ONU State": KeyPath("fiber_status.ONUState"),
         },
     ),
     LiveboxSensorEntityDescription(
         key="fiber_tx",
+        data_keys=("fiber_stats", ("counters", "fiber_stats.TxBytes")),
         name="Fiber Tx",
         icon=UPLOAD_ICON,
-        value_fn=get_rolling_32_bit_value_fn("fiber_stats.TxBytes"),
+        value_fn=get_counter_value_fn("fiber_stats.TxBytes"),
         native_unit_of_measurement=UnitOfInformation.BYTES,
         suggested_unit_of_measurement=UnitOfInformation.GIGABYTES,
         state_class=SensorStateClass.TOTAL_INCREASING,
         device_class=SensorDeviceClass.DATA_SIZE,
         translation_key="fiber_tx",
-        attrs={"Tx errors": lambda x: find_item(x, "fiber_stats.TxErrors")},
+        attrs={"Tx errors": KeyPath("fiber_stats.TxErrors")},
     ),
     LiveboxSensorEntityDescription(
         key="fiber_rx",
+        data_keys=("fiber_stats", ("counters", "fiber_stats.RxBytes")),
         name="Fiber Rx",
         icon=DOWNLOAD_ICON,
-        value_fn=get_rolling_32_bit_value_fn("fiber_stats.RxBytes"),
+        value_fn=get_counter_value_fn("fiber_stats.RxBytes"),
         native_unit_of_measurement=UnitOfInformation.BYTES,
         suggested_unit_of_measurement=UnitOfInformation.GIGABYTES,
         state_class=SensorStateClass.TOTAL_INCREASING,
         device_class=SensorDeviceClass.DATA_SIZE,
         translation_key="fiber_rx",
-        attrs={"Rx errors": lambda x: find_item(x, "fiber_stats.RxErrors")},
+        attrs={"Rx errors": KeyPath("fiber_stats.RxErrors")},
+    ),
+    LiveboxSensorEntityDescription(
+        key="fiber_tx_throughput",
+        data_keys=(("rates", "fiber_stats.TxBytes"),),
+        name="Fiber Tx Throughput",
+        icon=UPLOAD_ICON,
+        value_fn=get_rate_value_fn("fiber_stats.TxBytes"),
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        suggested_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        device_class=SensorDeviceClass.DATA_RATE,
+        translation_key="fiber_tx_throughput",
+    ),
+    LiveboxSensorEntityDescription(
+        key="fiber_rx_throughput",
+        data_keys=(("rates", "fiber_stats.RxBytes"),),
+        name="Fiber Rx Throughput",
+        icon=DOWNLOAD_ICON,
+        value_fn=get_rate_value_fn("fiber_stats.RxBytes"),
+        native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+        suggested_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        device_class=SensorDeviceClass.DATA_RATE,
+        translation_key="fiber_rx_throughput",
     ),
     LiveboxSensorEntityDescription(
         key="callers",
+        data_keys=("callers",),
         name="Callers",
         icon=PHONE_ICON,
         value_fn=lambda x: len(x.get("callers", {})),
@@ -406,6 +403,7 @@ SENSOR_TYPES: Final[list[LiveboxSensorEntityDescription]] = [
     ),
     LiveboxSensorEntityDescription(
         key="upnp",
+        data_keys=("upnp",),
         name="Ports forwarding",
         value_fn=lambda x: len(x.get("upnp", {})),
         state_class=SensorStateClass.TOTAL,
@@ -415,6 +413,7 @@ SENSOR_TYPES: Final[list[LiveboxSensorEntityDescription]] = [
     ),
     LiveboxSensorEntityDescription(
         key="dhcp_leases",
+        data_keys=("dhcp_leases",),
         name="DHCP Leases",
         value_fn=lambda x: len(x.get("dhcp_leases", {})),
         state_class=SensorStateClass.TOTAL,
@@ -424,6 +423,7 @@ SENSOR_TYPES: Final[list[LiveboxSensorEntityDescription]] = [
     ),
     LiveboxSensorEntityDescription(
         key="guest_dhcp_leases",
+        data_keys=("guest_dhcp_leases",),
         name="Guest DHCP Leases",
         value_fn=lambda x: len(x.get("guest_dhcp_leases", {})),
         state_class=SensorStateClass.TOTAL,
@@ -433,9 +433,10 @@ SENSOR_TYPES: Final[list[LiveboxSensorEntityDescription]] = [
     ),
     LiveboxSensorEntityDescription(
         key="uptime",
+        data_keys=("infos",),
         name="Uptime",
         icon="progress-clock",
-        value_fn=lambda x: find_item(x, "infos.UpTime", 0),
+        value_fn=KeyPath("infos.UpTime", default=0),
         native_unit_of_measurement=UnitOfTime.SECONDS,
         state_class=SensorStateClass.TOTAL,
         device_class=SensorDeviceClass.DURATION,
@@ -462,7 +463,8 @@ async def async_setup_entry(
             LiveboxSensorEntityDescription(
                 key=f"{name}_rate_rx",
                 name=f"{item['friendly_name']} Rate Rx",
-                value_fn=get_closure_value_fn(f"stats.{name}.rate_rx"),
+                value_fn=KeyPath(("stats", name, "rate_rx")),
+                data_keys=(("stats", name),),
                 translation_key=f"{name}_rate_rx",
                 native_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
                 suggested_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
@@ -474,7 +476,8 @@ async def async_setup_entry(
             LiveboxSensorEntityDescription(
                 key=f"{name}_rate_tx",
                 name=f"{item['friendly_name']} Rate Tx",
-                value_fn=get_closure_value_fn(f"stats.{name}.rate_tx"),
+                value_fn=KeyPath(("stats", name, "rate_tx")),
+                data_keys=(("stats", name),),
                 translation_key=f"{name}_rate_tx",
                 native_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
                 suggested_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
@@ -500,6 +503,7 @@ async def async_setup_entry(
             _async_update_device_sensors,
         )
     )
+    async_forget_untracked_devices(hass, entry, coordinator, tracked)
 
     _async_update_device_sensors()
     async_add_entities(entities)
@@ -517,19 +521,24 @@ def async_add_new_device_entities(
     for device_key, device in coordinator.data.get("devices", {}).items():
         if not _is_wireless_device(device):
             continue
+        if device_key in tracked:
+            continue
         device_name = device.get("Name") or device_key
         device_key_fragment = _normalize_device_key(device_key)
 
         for template in DEVICE_SENSOR_TYPES:
             entity_key = f"{device_key_fragment}_{template['key']}"
-            if entity_key in tracked:
-                continue
-
             description = LiveboxDeviceSensorEntityDescription(
                 key=entity_key,
                 name=template["name"],
                 icon=template.get("icon"),
                 value_fn=template["value_fn_factory"](device_key),
+                data_keys=(
+                    ("devices", device_key),
+                    ("wifi_clients", device_key),
+                    ("rates", f"wifi_clients.{device_key}.TxBytes"),
+                    ("rates", f"wifi_clients.{device_key}.RxBytes"),
+                ),
                 native_unit_of_measurement=template.get("native_unit_of_measurement"),
                 suggested_unit_of_measurement=template.get(
                     "suggested_unit_of_measurement"
@@ -547,7 +556,7 @@ def async_add_new_device_entities(
                     device_name=device_name,
                 )
             )
-            tracked.add(entity_key)
+        tracked.add(device_key)
 
     if new_entities:
         async_add_entities(new_entities)
@@ -0,0 +1,96 @@
+"""Long-term statistics of the Livebox interface traffic."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import UnitOfDataRate
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+
+HOUR = 3600
+TRAFFIC_DIRECTIONS = (("rx", "Rx_Counter"), ("tx", "Tx_Counter"))
+
+
+def hour_start(timestamp: float) -> float:
+    """Return the start of the hour containing the timestamp."""
+    return timestamp // HOUR * HOUR
+
+
+def traffic_statistic_id(unique_id: str, name: str, direction: str) -> str:
+    """Return the external statistic id of an interface rate."""
+    return f"{DOMAIN}:{slugify(f'{unique_id}_{name}_rate_{direction}')}"
+
+
+async def async_get_imported_until(
+    hass: HomeAssistant, statistic_ids: Iterable[str]
+) -> float | None:
+    """Return the end of the last hour imported for all the statistics."""
+    ends = []
+    for statistic_id in statistic_ids:
+        last = await get_instance(hass).async_add_executor_job(
+            get_last_statistics, hass, 1, statistic_id, False, {"mean"}
+        )
+        if not (rows := last.get(statistic_id)):
+            return None
+        ends.append(rows[0]["end"])
+    return min(ends, default=None)
+
+
+def hourly_rates(
+    readings: Iterable[dict[str, Any]], counter: str, reading_interval: int
+) -> list[StatisticData]:
+    """Aggregate the readings of a counter into hourly Mbit/s statistics."""
+    bytes_to_mbit_per_second = 8 / reading_interval / 1000000
+    hours: dict[float, list[float]] = {}
+    for reading in readings:
+        hours.setdefault(hour_start(reading.get("Timestamp", 0)), []).append(
+            reading.get(counter, 0) * bytes_to_mbit_per_second
+        )
+    return [
+        StatisticData(
+            start=dt_util.utc_from_timestamp(start),
+            mean=round(sum(rates) / len(rates), 3),
+            min=round(min(rates), 3),
+            max=round(max(rates), 3),
+        )
+        for start, rates in sorted(hours.items())
+    ]
+
+
+@callback
+def async_import_traffic(
+    hass: HomeAssistant,
+    unique_id: str,
+    name: str,
+    friendly_name: str,
+    readings: list[dict[str, Any]],
+    reading_interval: int,
+) -> None:
+    """Import the hourly rates of an interface in one batch per direction."""
+    for direction, counter in TRAFFIC_DIRECTIONS:
+        metadata = StatisticMetaData(
+            mean_type=StatisticMeanType.ARITHMETIC,
+            has_sum=False,
+            name=f"{friendly_name} Rate {direction.capitalize()}",
+            source=DOMAIN,
+            statistic_id=traffic_statistic_id(unique_id, name, direction),
+            unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
+        )
+        async_add_external_statistics(
+            hass, metadata, hourly_rates(readings, counter, reading_interval)
+        )
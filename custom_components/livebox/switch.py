@@ -16,7 +16,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from . import LiveboxConfigEntry
 from .const import DEVICE_WANACCESS_ICON, DOMAIN, GUESTWIFI_ICON
 from .coordinator import LiveboxDataUpdateCoordinator
-from .entity import LiveboxEntity
+from .entity import LiveboxEntity, async_forget_untracked_devices
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -26,11 +26,13 @@ class LiveboxSwitchEntityDescription(SwitchEntityDescription):
     value_fn: Callable[..., Any]
     turn_on: Callable[..., Any]
     turn_off: Callable[..., Any]
+    data_keys: tuple[str | tuple[str, ...], ...] | None = None
 
 
 SWITCH_TYPES: Final[tuple[LiveboxSwitchEntityDescription, ...]] = (
     LiveboxSwitchEntityDescription(
         key="wifi",
+        data_keys=("wifi",),
         name="Wifi",
         translation_key="wifi_switch",
         value_fn=lambda x: x.get("wifi"),
@@ -39,6 +41,7 @@ SWITCH_TYPES: Final[tuple[LiveboxSwitchEntityDescription, ...]] = (
     ),
     LiveboxSwitchEntityDescription(
         key="guest_wifi",
+        data_keys=("guest_wifi",),
         name="Guest Wifi",
         icon=GUESTWIFI_ICON,
         translation_key="guest_wifi",
@@ -51,6 +54,7 @@ SWITCH_TYPES: Final[tuple[LiveboxSwitchEntityDescription, ...]] = (
 SWITCH_TYPES_5: Final[tuple[LiveboxSwitchEntityDescription, ...]] = (
     LiveboxSwitchEntityDescription(
         key="wifi",
+        data_keys=("wifi",),
         name="Wifi",
         translation_key="wifi_switch",
         value_fn=lambda x: x.get("wifi"),
@@ -59,6 +63,7 @@ SWITCH_TYPES_5: Final[tuple[LiveboxSwitchEntityDescription, ...]] = (
     ),
     LiveboxSwitchEntityDescription(
         key="guest_wifi",
+        data_keys=("guest_wifi",),
         name="Guest Wifi",
         icon=GUESTWIFI_ICON,
         translation_key="guest_wifi",
@@ -107,6 +112,7 @@ async def async_setup_entry(
             hass, coordinator.signal_wan_access_new, async_update_wan_access
         )
     )
+    async_forget_untracked_devices(hass, entry, coordinator, wan_access)
 
     async_update_wan_access()
 
@@ -131,14 +137,14 @@ class LiveboxSwitch(LiveboxEntity, SwitchEntity):  # pyrefly: ignore[inconsisten
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the switch on."""
         description = cast(LiveboxSwitchEntityDescription, self.entity_description)
-        await description.turn_on(self.coordinator.api)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_run_action(description.turn_on)
+        await self.coordinator.async_refresh_sections(description.key)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the switch off."""
         description = cast(LiveboxSwitchEntityDescription, self.entity_description)
-        await description.turn_off(self.coordinator.api)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_run_action(description.turn_off)
+        await self.coordinator.async_refresh_sections(description.key)
 
 
 class DeviceWANAccessSwitch(LiveboxEntity, SwitchEntity):  # pyrefly: ignore[inconsistent-inheritance]
@@ -153,8 +159,11 @@ class DeviceWANAccessSwitch(LiveboxEntity, SwitchEntity):  # pyrefly: ignore[inc
         device: dict[str, Any],
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, description)
-        self._device_key = device.get("Key", self.name)
+        device_key = device.get("Key", description.name)
+        super().__init__(
+            coordinator, description, (("devices_wan_access", device_key),)
+        )
+        self._device_key = device_key
         self._device = device
         self._attr_unique_id = f"{coordinator.unique_id or DOMAIN}_{description.key}"
         unique_id = coordinator.unique_id or DOMAIN
@@ -181,28 +190,32 @@ class DeviceWANAccessSwitch(LiveboxEntity, SwitchEntity):  # pyrefly: ignore[inc
         schedule = self._get_device_schedule()
         if schedule:
             parameters = {"type": "ToD", "ID": self._device_key, "override": "Enable"}
-            result = await self.coordinator.api.schedule.async_set_schedule(parameters)
+            result = await self.coordinator.async_run_action(
+                lambda api: api.schedule.async_set_schedule(parameters)
+            )
             if not isinstance(result, dict) or not result.get("status"):
                 raise HomeAssistantError(
                     f"Fail to unlock device "
                     f"{self._device.get('Name')} ({self._device_key}) "
                     "WAN access"
                 )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_device_schedule(self._device_key)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the switch off."""
         schedule = self._get_device_schedule()
         if schedule:
             parameters = {"type": "ToD", "ID": self._device_key, "override": "Disable"}
-            result = await self.coordinator.api.schedule.async_set_schedule(parameters)
+            result = await self.coordinator.async_run_action(
+                lambda api: api.schedule.async_set_schedule(parameters)
+            )
             if not isinstance(result, dict) or not result.get("status"):
                 raise HomeAssistantError(
                     f"Fail to lock device "
                     f"{self._device.get('Name')} ({self._device_key}) "
                     "WAN access"
                 )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_device_schedule(self._device_key)
         else:
             parameters = {
                 "type": "ToD",
@@ -216,11 +229,13 @@ class DeviceWANAccessSwitch(LiveboxEntity, SwitchEntity):  # pyrefly: ignore[inc
                     "override": "Disable",
                 },
             }
-            result = await self.coordinator.api.schedule.async_add_schedule(parameters)
+            result = await self.coordinator.async_run_action(
+                lambda api: api.schedule.async_add_schedule(parameters)
+            )
             if not isinstance(result, dict) or not result.get("status"):
                 raise HomeAssistantError(
                     f"Fail to lock device "
                     f"{self._device.get('Name')} ({self._device_key}) "
                     "WAN access"
                 )
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_device_schedule(self._device_key)
@@ -0,0 +1,98 @@
+"""Micro-benchmark of entity value reads: dotted lookups versus KeyPath.
+
+Run with ``python -m tests.benchmark_key_path``. It evaluates the value and
+attribute functions of every entity a Livebox with 200 Wi-Fi devices creates,
+once with the former string-splitting lookup and once with compiled paths.
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any
+
+from custom_components.livebox.binary_sensor import BINARYSENSOR_TYPES
+from custom_components.livebox.helpers import KeyPath
+from custom_components.livebox.sensor import DEVICE_SENSOR_TYPES, SENSOR_TYPES
+
+DEVICES = 200
+NUMBER = 200
+
+
+def _legacy_find_item(data: dict[str, Any], key_chain: str, default: Any = None):
+    """Return a value the way ``find_item`` did before paths were compiled."""
+    current: Any = data
+    if (keys := key_chain.split(".")) and isinstance(keys, list):
+        for key in keys:
+            if isinstance(current, dict):
+                current = current.get(key)
+            elif (
+                isinstance(current, list)
+                and len(current) > 0
+                and key.isdigit()
+                and int(key) < len(current)
+            ):
+                current = current[int(key)]
+    return default if current is None and default is not None else current
+
+
+def _snapshot() -> dict[str, Any]:
+    """Return coordinator data with many wireless devices."""
+    devices = {
+        f"AA:BB:CC:DD:{index // 256:02X}:{index % 256:02X}": {
+            "Key": f"AA:BB:CC:DD:{index // 256:02X}:{index % 256:02X}",
+            "InterfaceName": "wl0",
+            "LastDataDownlinkRate": 866000,
+            "LastDataUplinkRate": 433000,
+            "SignalStrength": -60,
+            "SignalNoiseRatio": 35,
+        }
+        for index in range(DEVICES)
+    }
+    return {
+        "infos": {"UpTime": 123456},
+        "wan_status": {"WanState": "up", "LinkType": "gpon"},
+        "dsl_status": {"DownstreamCurrRate": 1000, "UpstreamCurrRate": 100},
+        "fiber_status": {"SignalRxPower": -20000, "SignalTxPower": 2000},
+        "fiber_stats": {"RxBytes": 1000, "TxBytes": 1000},
+        "wifi_stats": {"RxBytes": 1000, "TxBytes": 1000},
+        "devices": devices,
+        "lan": [],
+    }
+
+
+def _key_paths() -> list[KeyPath]:
+    """Return the compiled paths read by the full entity set."""
+    paths = []
+    for description in (*SENSOR_TYPES, *BINARYSENSOR_TYPES):
+        for fn in (description.value_fn, *(description.attrs or {}).values()):
+            if isinstance(fn, KeyPath):
+                paths.append(fn)
+    for device_key in _snapshot()["devices"]:
+        for template in DEVICE_SENSOR_TYPES:
+            fn = template["value_fn_factory"](device_key)
+            if isinstance(fn, KeyPath):
+                paths.append(fn)
+    return paths
+
+
+def main() -> None:
+    """Print the time spent reading every entity value."""
+    data = _snapshot()
+    paths = _key_paths()
+    dotted = [(path.path, path.default) for path in paths]
+
+    legacy = timeit.timeit(
+        lambda: [_legacy_find_item(data, path, default) for path, default in dotted],
+        number=NUMBER,
+    )
+    compiled = timeit.timeit(
+        lambda: [path.get(data, path.default) for path in paths], number=NUMBER
+    )
+    print(f"{len(paths)} reads per refresh, {NUMBER} refreshes")
+    print(f"string lookup: {legacy / NUMBER * 1e6:8.1f} µs per refresh")
+    print(f"KeyPath:       {compiled / NUMBER * 1e6:8.1f} µs per refresh")
+    print(f"speed-up:      {legacy / compiled:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -191,6 +191,8 @@ def mock_router(request) -> Iterator[MagicMock]:
             return {}
 
         instance.schedule.async_get_schedule = AsyncMock(side_effect=_mock_get_schedule)
+        # Fixtures were captured without the bulk listing: per-device fallback.
+        instance.schedule.async_get_schedules = AsyncMock(return_value={})
 
         instance.schedule.async_get_scheduletypes = AsyncMock(
             return_value=api["Schedule.async_get_scheduletypes"]
@@ -225,6 +227,7 @@ def mock_router(request) -> Iterator[MagicMock]:
             return_value=api["DynDNS.async_get_global_enable"]
         )
         # instance.event.async_get_events = AsyncMock(return_value=INFO)  # take 10s
+        instance.event.async_open_channel = AsyncMock(return_value={})
         instance.userinterface.async_get_language = AsyncMock(
             return_value=api["UserInterface.async_get_language"]
         )
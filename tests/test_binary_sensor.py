@@ -35,7 +35,8 @@ async def test_binary_sensor_link_status(
     assert state.state == STATE_ON
 
     # --- Test for OFF state ---
-    # Set the status to 0 (Disconnected)
+    # Set the status to 0 (Disconnected), in a new payload like the API returns
+    info_data = copy.deepcopy(info_data)
     info_data["data"]["WanState"] = "down"
     AIOSysbus.nmc.async_get_wan_status.return_value = info_data
 
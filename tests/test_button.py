@@ -44,3 +44,27 @@ async def test_button(
     )
     await hass.async_block_till_done()
     assert len(service_calls) == 2
+
+
+async def test_clear_calls_button_refreshes_calls(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+) -> None:
+    """The call list is fetched again once cleared."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    AIOSysbus.voiceservice.async_clear_calllist = AsyncMock()
+    get_calllist = AIOSysbus.voiceservice.async_get_calllist
+    get_calllist.reset_mock()
+
+    await hass.services.async_call(
+        BUTTON_DOMAIN,
+        SERVICE_PRESS,
+        service_data={ATTR_ENTITY_ID: f"button.{AIOSysbus.__unique_name}_clear_calls"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    AIOSysbus.voiceservice.async_clear_calllist.assert_awaited_once()
+    get_calllist.assert_awaited_once()
@@ -1,14 +1,27 @@
 """Tests for the Livebox coordinator."""
 
+from types import SimpleNamespace
 from typing import Any, cast
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from homeassistant.config_entries import ConfigEntry
+from aiosysbus.exceptions import HttpRequestFailed
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.core import HomeAssistant
-from pytest_homeassistant_custom_component.common import load_json_object_fixture
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import (
+    async_fire_time_changed,
+    load_json_object_fixture,
+)
 
-from custom_components.livebox.coordinator import LiveboxDataUpdateCoordinator
+from custom_components.livebox.const import DOMAIN
+from custom_components.livebox.coordinator import (
+    COUNTER_WRAP,
+    COUNTERS_SAVE_DELAY,
+    STORAGE_VERSION,
+    LiveboxDataUpdateCoordinator,
+)
 
 
 def _load_fixture(name: str) -> dict[str, Any]:
@@ -44,3 +57,266 @@ async def test_async_get_devices_matches_issue_233_diagnostics(
     )
 
     assert counters == {"wireless": expected_wireless, "wired": expected_wired}
+
+
+@pytest.mark.parametrize("AIOSysbus", ["7"], indirect=True)
+async def test_sections_of_disabled_entities_are_skipped(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+) -> None:
+    """Sections only read by disabled entities are not fetched until enabled."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = config_entry.runtime_data
+
+    # The port forwarding sensor is disabled by default.
+    AIOSysbus.firewall.async_get_port_forwarding.reset_mock()
+    coordinator.invalidate_sections("upnp")
+    await coordinator.async_refresh()
+
+    assert "upnp" in coordinator.skipped_sections
+    AIOSysbus.firewall.async_get_port_forwarding.assert_not_awaited()
+
+    entity_registry = er.async_get(hass)
+    entity_id = entity_registry.async_get_entity_id(
+        "sensor", "livebox", f"{coordinator.unique_id}_upnp"
+    )
+    assert entity_id is not None
+    entity_registry.async_update_entity(entity_id, disabled_by=None)
+    await hass.async_block_till_done()
+    await coordinator.async_refresh()
+
+    assert "upnp" not in coordinator.skipped_sections
+    AIOSysbus.firewall.async_get_port_forwarding.assert_awaited()
+
+
+@pytest.mark.parametrize(
+    ("AIOSysbus", "fetched_mib", "skipped_mib"),
+    [("7", "veip0", "data"), ("3", "data", "veip0")],
+    indirect=["AIOSysbus"],
+)
+async def test_fetch_plan_follows_link_type(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+    fetched_mib: str,
+    skipped_mib: str,
+) -> None:
+    """GPON boxes never query DSL MIBs and DSL-era boxes never query GPON MIBs."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = config_entry.runtime_data
+    await coordinator.async_refresh()
+
+    mibs = {call.args[0] for call in AIOSysbus.nemo.async_get_MIBs.await_args_list}
+    assert fetched_mib in mibs
+    assert skipped_mib not in mibs
+    # The capability profile is only built once: the startup, deferred and
+    # explicit refreshes each fetch the WAN status once more.
+    assert AIOSysbus.nmc.async_get_wan_status.await_count == 4
+
+
+@pytest.mark.parametrize("AIOSysbus", ["7"], indirect=True)
+async def test_counters_survive_restarts(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Byte counters resume from the stored state and are saved again."""
+    storage_key = f"{DOMAIN}.{config_entry.entry_id}.counters"
+    hass_storage[storage_key] = {
+        "version": STORAGE_VERSION,
+        "key": storage_key,
+        "data": {
+            "uptime": 1000,
+            "readings": {"fiber_stats.TxBytes": 4_000_000_000},
+            "offsets": {"fiber_stats.TxBytes": 5},
+        },
+    }
+
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = config_entry.runtime_data
+
+    # The counter wrapped while Home Assistant was stopped.
+    assert coordinator.data["counters"]["fiber_stats.TxBytes"] == (
+        5 + COUNTER_WRAP + 1975319780
+    )
+    assert coordinator.data["counters"]["fiber_stats.RxBytes"] == 3191980484
+
+    freezer.tick(COUNTERS_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    stored = hass_storage[storage_key]["data"]
+    assert stored["uptime"] == 1210370
+    assert stored["offsets"] == {"fiber_stats.TxBytes": 5 + COUNTER_WRAP}
+
+
+async def test_session_is_reused_across_restarts(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """The stored sysbus context is reused and replaced once renewed."""
+    storage_key = f"{DOMAIN}.{config_entry.entry_id}.session"
+    owner = "192.168.1.1@192.168.1.1:80"
+    hass_storage[storage_key] = {
+        "version": STORAGE_VERSION,
+        "key": storage_key,
+        "data": {"owner": owner, "context_id": "stored", "cookies": {"a": "1"}},
+    }
+    AIOSysbus._auth = SimpleNamespace(session_token=None, _cookies={})
+
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert AIOSysbus._auth.session_token == "stored"
+    assert AIOSysbus._auth._cookies == {"a": "1"}
+
+    # The Livebox rejected the context and aiosysbus logged in again.
+    AIOSysbus._auth.session_token = "renewed"
+    await config_entry.runtime_data.async_refresh()
+    freezer.tick(1)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert hass_storage[storage_key]["data"] == {
+        "owner": owner,
+        "context_id": "renewed",
+        "cookies": {"a": "1"},
+    }
+
+
+async def test_rejected_session_logs_in_again(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+    hass_storage: dict[str, Any],
+) -> None:
+    """A stored context the Livebox rejects is dropped for a new login."""
+    storage_key = f"{DOMAIN}.{config_entry.entry_id}.session"
+    hass_storage[storage_key] = {
+        "version": STORAGE_VERSION,
+        "key": storage_key,
+        "data": {
+            "owner": "192.168.1.1@192.168.1.1:80",
+            "context_id": "expired",
+            "cookies": {"a": "1"},
+        },
+    }
+    AIOSysbus._auth = SimpleNamespace(session_token=None, _cookies={})
+    get_deviceinfo = AIOSysbus.deviceinfo.async_get_deviceinfo
+    deviceinfo = get_deviceinfo.return_value
+
+    async def _get_deviceinfo() -> dict[str, Any]:
+        if AIOSysbus._auth.session_token == "expired":
+            raise HttpRequestFailed(b"401 Unauthorized")
+        return deviceinfo
+
+    get_deviceinfo.side_effect = _get_deviceinfo
+
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert AIOSysbus._auth.session_token is None
+    assert AIOSysbus._auth._cookies == {}
+    assert storage_key not in hass_storage
+
+
+async def test_session_of_other_account_is_ignored(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+    hass_storage: dict[str, Any],
+) -> None:
+    """A context stored for other credentials is never sent."""
+    storage_key = f"{DOMAIN}.{config_entry.entry_id}.session"
+    hass_storage[storage_key] = {
+        "version": STORAGE_VERSION,
+        "key": storage_key,
+        "data": {"owner": "admin@10.0.0.1:80", "context_id": "other", "cookies": {}},
+    }
+    AIOSysbus._auth = SimpleNamespace(session_token=None, _cookies={})
+
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert AIOSysbus._auth.session_token is None
+
+
+async def test_topology_is_reused_across_restarts(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+    hass_storage: dict[str, Any],
+) -> None:
+    """The topology is only built again once the Livebox has a newer one."""
+    api_raw = _load_fixture("issue_191_repeater_topology_sanitized.json")["api_raw"]
+    topology = AIOSysbus.topologydiagnostics
+    topology.async_get_topodiags.return_value = api_raw[
+        "TopologyDiagnostics.async_get_topodiags"
+    ]
+    topology.async_set_topodiags_build.return_value = api_raw[
+        "TopologyDiagnostics.async_set_topodiags_build"
+    ]
+
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    repeaters = config_entry.runtime_data.data["topology_repeaters"]
+    assert repeaters
+    stored = hass_storage[f"{DOMAIN}.{config_entry.entry_id}.topology"]["data"]
+    assert stored["last_update"] == "2026-04-04T22:14:03Z"
+    assert stored["repeaters"] == repeaters
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    topology.async_set_topodiags_build.reset_mock()
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    topology.async_set_topodiags_build.assert_not_awaited()
+    assert config_entry.runtime_data.data["topology_repeaters"] == repeaters
+
+
+async def test_capabilities_are_probed_once_per_firmware(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+    hass_storage: dict[str, Any],
+) -> None:
+    """The stored capabilities are reused until the firmware changes."""
+    storage_key = f"{DOMAIN}.{config_entry.entry_id}.capabilities"
+    get_deviceinfo = AIOSysbus.deviceinfo.async_get_deviceinfo
+    get_wan_status = AIOSysbus.nmc.async_get_wan_status
+
+    async def _restart() -> int:
+        """Set up the entry again and return the WAN status requests sent."""
+        await hass.config_entries.async_unload(config_entry.entry_id)
+        await hass.async_block_till_done()
+        get_wan_status.reset_mock()
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+        return get_wan_status.await_count
+
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    version = get_deviceinfo.return_value["status"]["SoftwareVersion"]
+    stored = hass_storage[storage_key]["data"]
+    assert stored["software_version"] == version
+    assert stored["profile"]["link_type"]
+
+    # The startup and deferred refreshes, without building the profile.
+    assert await _restart() == 2
+
+    get_deviceinfo.return_value = {
+        "status": get_deviceinfo.return_value["status"] | {"SoftwareVersion": "new"}
+    }
+    assert await _restart() == 3
+    assert hass_storage[storage_key]["data"]["software_version"] == "new"
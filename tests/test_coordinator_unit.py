@@ -2,17 +2,44 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import datetime, timedelta
 from types import SimpleNamespace
 from typing import Any, cast
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from aiosysbus.exceptions import (
+    AiosysbusException,
+    RetrieveFailed,
+    TimeoutExceededError,
+)
+from homeassistant.util.dt import UTC
 from pytest_homeassistant_custom_component.common import load_json_object_fixture
 
 from custom_components.livebox.const import (
     CONF_DISPLAY_DEVICES,
     DEFAULT_DISPLAY_DEVICES,
 )
-from custom_components.livebox.coordinator import LiveboxDataUpdateCoordinator
+from custom_components.livebox.coordinator import (
+    BOOT_GRACE,
+    BREAKER_BACKOFF,
+    BREAKER_THRESHOLD,
+    COUNTER_RETENTION,
+    PRIORITY_ACTION,
+    SCAN_INTERVAL,
+    SECTIONS,
+    SLOW_SCAN_INTERVAL,
+    UNSUPPORTED_RETRY,
+    CounterAccumulator,
+    LiveboxCapabilities,
+    LiveboxDataUpdateCoordinator,
+    LiveboxProfile,
+    LiveboxSection,
+    RequestScheduler,
+    ResponseCache,
+    request_priority,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -87,6 +114,8 @@ def _build_issue_191_coordinator() -> LiveboxDataUpdateCoordinator:
     coordinator._topology_cache = ({}, {})
     coordinator._topology_cache_at = None
     coordinator._topology_last_update = None
+    coordinator._topology_store = Mock()
+    coordinator.data = None
     coordinator.api = SimpleNamespace(
         devices=SimpleNamespace(async_get_devices=object()),
         topologydiagnostics=SimpleNamespace(
@@ -112,9 +141,8 @@ async def test_async_get_devices_keeps_repeaters_without_lan_tracking() -> None:
     """Repeaters should stay tracked so clients can attach via_device."""
     coordinator = _build_issue_191_coordinator()
 
-    _, topology_repeaters = await LiveboxDataUpdateCoordinator.async_get_topology(
-        coordinator
-    )
+    await LiveboxDataUpdateCoordinator._async_build_topology(coordinator, None)
+    _, topology_repeaters = coordinator._topology_cache
     tracked_devices, counters = await LiveboxDataUpdateCoordinator.async_get_devices(
         coordinator,
         lan_tracking=False,
@@ -131,9 +159,8 @@ async def test_async_get_devices_skips_repeaters_when_tracking_disabled() -> Non
     """When both tracking modes are off, no device trackers should be created."""
     coordinator = _build_issue_191_coordinator()
 
-    _, topology_repeaters = await LiveboxDataUpdateCoordinator.async_get_topology(
-        coordinator
-    )
+    await LiveboxDataUpdateCoordinator._async_build_topology(coordinator, None)
+    _, topology_repeaters = coordinator._topology_cache
     tracked_devices, counters = await LiveboxDataUpdateCoordinator.async_get_devices(
         coordinator,
         lan_tracking=False,
@@ -175,12 +202,51 @@ async def test_async_get_topology_returns_cached_value_on_invalid_status() -> No
     )
 
 
+async def test_async_get_topology_builds_in_background() -> None:
+    """The poll returns the cached topology while a rebuild runs on its own."""
+    coordinator = _build_issue_191_coordinator()
+    coordinator._topology_task = None
+    coordinator.hass = None
+    coordinator.config_entry.async_create_background_task = lambda hass, target, name: (
+        asyncio.create_task(target, name=name)
+    )
+    coordinator.data = {"topology_via_device": {}, "topology_repeaters": {}}
+    coordinator.async_request_refresh = AsyncMock()
+    coordinator.async_update_listeners = Mock()
+
+    assert await LiveboxDataUpdateCoordinator.async_get_topology(coordinator) == (
+        {},
+        {},
+    )
+    # A second poll while the build runs does not start another one.
+    task = coordinator._topology_task
+    await LiveboxDataUpdateCoordinator.async_get_topology(coordinator)
+    assert coordinator._topology_task is task
+
+    await task
+    assert "CC:CC:CC:CC:CC:01" in coordinator._topology_cache[1]
+    # New repeaters change the tracked devices, so a full refresh is requested.
+    coordinator.async_request_refresh.assert_awaited_once()
+
+    await LiveboxDataUpdateCoordinator._async_build_topology(coordinator, None)
+    coordinator.async_request_refresh.assert_awaited_once()
+    coordinator.async_update_listeners.assert_called_once()
+    assert coordinator.data["topology_repeaters"] == coordinator._topology_cache[1]
+
+
 async def test_async_get_results_keeps_interfaces_without_traffic() -> None:
-    """Interfaces without traffic should still produce zeroed stats."""
+    """Interfaces without traffic are kept, with unknown rates."""
     coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    coordinator.stats_readings = {}
+    coordinator._stats_collected_at = None
+    coordinator._stats_reading_interval = None
+    coordinator._stats_max_readings = 120
+    coordinator._statistics_imported_until = {}
+    coordinator.unique_id = None
     coordinator.api = SimpleNamespace(
         homelan=SimpleNamespace(
             async_get_interface=object(),
+            async_get_reading_interval=object(),
             async_get_results=object(),
         )
     )
@@ -193,6 +259,8 @@ async def test_async_get_results_keeps_interfaces_without_traffic() -> None:
                     "eth1": {"Name": "ETH1", "FriendlyName": "eth1"},
                 }
             }
+        if func is coordinator.api.homelan.async_get_reading_interval:
+            return {"status": 30}
         if func is coordinator.api.homelan.async_get_results:
             return {
                 "status": {
@@ -213,7 +281,874 @@ async def test_async_get_results_keeps_interfaces_without_traffic() -> None:
 
     results = await LiveboxDataUpdateCoordinator.async_get_results(coordinator)
 
-    assert results["ETH0"]["rate_rx"] == 0.0
-    assert results["ETH0"]["rate_tx"] == 0.0
+    # Nothing collected yet: the rate is unknown, not 0.
+    assert results["ETH0"]["rate_rx"] is None
+    assert results["ETH0"]["rate_tx"] is None
     assert results["ETH1"]["rate_rx"] == 0.8
     assert results["ETH1"]["rate_tx"] == 1.6
+
+
+async def test_async_collect_stats_catches_up_after_gaps() -> None:
+    """Each collection asks for the readings made since the previous one."""
+    coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    coordinator.stats_readings = {}
+    coordinator._stats_collected_at = None
+    coordinator._stats_reading_interval = 30
+    coordinator._stats_max_readings = 120
+    coordinator._statistics_imported_until = {}
+    coordinator.unique_id = None
+    coordinator.api = SimpleNamespace(
+        homelan=SimpleNamespace(async_get_results=object())
+    )
+    requested: list[int] = []
+    traffic: list[dict[str, int]] = []
+
+    async def _make_request(func: Any, parameters: Any = None) -> dict[str, Any]:
+        requested.append(parameters["NumberOfReadings"])
+        # The Livebox returns the newest reading first.
+        return {"status": {"eth0": {"Traffic": traffic[::-1][: requested[-1]]}}}
+
+    coordinator._make_request = cast(Any, _make_request)
+    interfaces = {"eth0": {"Name": "ETH0"}}
+
+    def _reading(timestamp: int) -> dict[str, int]:
+        return {"Timestamp": timestamp, "Rx_Counter": timestamp, "Tx_Counter": 0}
+
+    clock = "custom_components.livebox.coordinator.time"
+    traffic.extend(_reading(ts) for ts in range(30, 330, 30))
+    with patch(clock, return_value=300.0):
+        await LiveboxDataUpdateCoordinator.async_collect_stats(coordinator, interfaces)
+    # Home Assistant was down for an hour and a half.
+    traffic.extend(_reading(ts) for ts in range(330, 5730, 30))
+    with patch(clock, return_value=5700.0):
+        await LiveboxDataUpdateCoordinator.async_collect_stats(coordinator, interfaces)
+
+    assert requested == [10, 120]
+    buffer = coordinator.stats_readings["eth0"]
+    assert len(buffer) == 120
+    assert [reading["Timestamp"] for reading in buffer][-2:] == [5670, 5700]
+    # Readings already buffered are not appended twice.
+    with patch(clock, return_value=5700.0):
+        await LiveboxDataUpdateCoordinator.async_collect_stats(coordinator, interfaces)
+    assert len(buffer) == 120
+    assert buffer[-1]["Timestamp"] == 5700
+
+
+async def test_async_collect_stats_cuts_off_statistics_per_interface() -> None:
+    """A new interface does not re-import the history of the others."""
+    coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    coordinator.hass = SimpleNamespace(config=SimpleNamespace(components={"recorder"}))
+    coordinator.stats_readings = {}
+    coordinator._stats_collected_at = None
+    coordinator._stats_reading_interval = 30
+    coordinator._stats_max_readings = 400
+    coordinator._statistics_imported_until = {}
+    coordinator._pending_statistics = {}
+    coordinator.unique_id = "livebox"
+    coordinator.api = SimpleNamespace(
+        homelan=SimpleNamespace(async_get_results=object())
+    )
+    requested: list[int] = []
+
+    async def _make_request(func: Any, parameters: Any = None) -> dict[str, Any]:
+        requested.append(parameters["NumberOfReadings"])
+        traffic = [
+            {"Timestamp": ts, "Rx_Counter": 0, "Tx_Counter": 0}
+            for ts in range(10800, 0, -30)
+        ]
+        return {"status": {key: {"Traffic": traffic} for key in ("eth0", "eth1")}}
+
+    async def _get_imported_until(hass: Any, statistic_ids: Any) -> float | None:
+        # Only eth0 was imported before, up to the end of the first hour.
+        return 3600.0 if "eth0" in next(iter(statistic_ids)) else None
+
+    coordinator._make_request = cast(Any, _make_request)
+    interfaces = {"eth0": {"Name": "eth0"}, "eth1": {"Name": "eth1"}}
+    with (
+        patch("custom_components.livebox.coordinator.time", return_value=10800.0),
+        patch(
+            "custom_components.livebox.coordinator.async_get_imported_until",
+            side_effect=_get_imported_until,
+        ),
+        patch("custom_components.livebox.coordinator.async_import_traffic") as imports,
+    ):
+        await LiveboxDataUpdateCoordinator.async_collect_stats(coordinator, interfaces)
+
+    # eth0 catches up from its own cutoff, eth1 starts with the current hour.
+    assert requested == [240]
+    imported = {call.args[3]: call.args[4] for call in imports.call_args_list}
+    assert list(imported) == ["eth0"]
+    assert imported["eth0"][0]["Timestamp"] == 3600
+    assert imported["eth0"][-1]["Timestamp"] == 10770
+    assert coordinator._statistics_imported_until == {
+        "eth0": 10800.0,
+        "eth1": 10800.0,
+    }
+
+
+async def test_async_fetch_sections_runs_independent_sections_concurrently() -> None:
+    """Independent sections overlap while dependent ones wait for their inputs."""
+    coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    coordinator.section_timings = {}
+    coordinator._section_results = {}
+    coordinator._section_fetched_at = {}
+    coordinator._section_merges = {}
+    coordinator._merge_serial = 0
+    coordinator.skipped_sections = set()
+    coordinator.events_connected = False
+    running: set[str] = set()
+    overlaps: list[set[str]] = []
+
+    async def _fetch(key: str, value: Any) -> Any:
+        running.add(key)
+        await asyncio.sleep(0)
+        overlaps.append(set(running))
+        running.discard(key)
+        return value
+
+    sections = (
+        LiveboxSection(key="first", fetch_fn=lambda c, _: _fetch("first", 1)),
+        LiveboxSection(key="second", fetch_fn=lambda c, _: _fetch("second", 2)),
+        LiveboxSection(
+            key="third",
+            requires=("first", "second"),
+            fetch_fn=lambda c, r: _fetch("third", r["first"] + r["second"]),
+        ),
+    )
+
+    results = await LiveboxDataUpdateCoordinator._async_fetch_sections(
+        coordinator, sections
+    )
+
+    assert results == {"first": 1, "second": 2, "third": 3}
+    assert {"first", "second"} in overlaps
+    assert {"third"} in overlaps
+    assert set(coordinator.section_timings) == {"first", "second", "third"}
+
+
+async def test_async_fetch_sections_reuses_results_until_interval_elapses() -> None:
+    """Slow sections keep their last result between their own refreshes."""
+    coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    coordinator.section_timings = {}
+    coordinator._section_results = {}
+    coordinator._section_fetched_at = {}
+    coordinator._section_merges = {}
+    coordinator._merge_serial = 0
+    coordinator.skipped_sections = set()
+    coordinator.events_connected = False
+    calls = {"fast": 0, "slow": 0}
+
+    async def _fetch(key: str) -> int:
+        calls[key] += 1
+        return calls[key]
+
+    sections = (
+        LiveboxSection(key="fast", fetch_fn=lambda c, _: _fetch("fast")),
+        LiveboxSection(
+            key="slow",
+            interval=SLOW_SCAN_INTERVAL,
+            fetch_fn=lambda c, _: _fetch("slow"),
+        ),
+    )
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+
+    with patch("custom_components.livebox.coordinator.datetime") as mock_datetime:
+        mock_datetime.now.return_value = start
+        first = await LiveboxDataUpdateCoordinator._async_fetch_sections(
+            coordinator, sections
+        )
+        mock_datetime.now.return_value = start + SCAN_INTERVAL
+        second = await LiveboxDataUpdateCoordinator._async_fetch_sections(
+            coordinator, sections
+        )
+        coordinator.invalidate_sections("slow")
+        third = await LiveboxDataUpdateCoordinator._async_fetch_sections(
+            coordinator, sections
+        )
+        mock_datetime.now.return_value = start + SCAN_INTERVAL + SLOW_SCAN_INTERVAL
+        fourth = await LiveboxDataUpdateCoordinator._async_fetch_sections(
+            coordinator, sections
+        )
+
+    assert first == {"fast": 1, "slow": 1}
+    assert second == {"fast": 2, "slow": 1}
+    assert third == {"fast": 3, "slow": 2}
+    assert fourth == {"fast": 4, "slow": 3}
+
+
+async def test_make_request_honours_concurrency_cap() -> None:
+    """No more than the configured number of requests reach the router at once."""
+    coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    coordinator.scheduler = RequestScheduler(2)
+    coordinator.breakers = {}
+    coordinator.capabilities = LiveboxCapabilities()
+    coordinator.responses = ResponseCache(8, 60)
+    in_flight = 0
+    peak = 0
+
+    async def _request() -> dict[str, Any]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {"status": True}
+
+    results = await asyncio.gather(
+        *(
+            LiveboxDataUpdateCoordinator._make_request(coordinator, _request)
+            for _ in range(6)
+        )
+    )
+
+    assert results == [{"status": True}] * 6
+    assert peak == 2
+
+
+async def test_request_scheduler_serves_user_actions_first() -> None:
+    """Queued user actions get the next free slot before queued polling."""
+    scheduler = RequestScheduler(1)
+    order: list[str] = []
+    gate = asyncio.Event()
+
+    async def _request(name: str, priority: int | None = None) -> None:
+        async with scheduler.slot(priority):
+            order.append(name)
+            await gate.wait()
+
+    polls = [asyncio.create_task(_request(f"poll{i}")) for i in range(3)]
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(_request("cancelled", PRIORITY_ACTION))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    with request_priority(PRIORITY_ACTION):
+        action = asyncio.create_task(_request("action"))
+    await asyncio.sleep(0)
+    assert scheduler.waiting == 3
+    gate.set()
+    await asyncio.gather(*polls, action)
+
+    assert order == ["poll0", "action", "poll1", "poll2"]
+    assert (scheduler.active, scheduler.waiting) == (0, 0)
+
+
+async def test_request_scheduler_applies_a_lowered_limit() -> None:
+    """Slots beyond a lowered limit are freed instead of handed over."""
+    scheduler = RequestScheduler(3)
+    running = 0
+    peak = 0
+    gate = asyncio.Event()
+
+    async def _request() -> None:
+        nonlocal running, peak
+        async with scheduler.slot():
+            running += 1
+            peak = max(peak, running)
+            await gate.wait()
+            await asyncio.sleep(0)
+            running -= 1
+
+    first = [asyncio.create_task(_request()) for _ in range(3)]
+    await asyncio.sleep(0)
+    scheduler.set_limit(1)
+    peak = 0
+    queued = [asyncio.create_task(_request()) for _ in range(3)]
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(*first)
+    assert peak == 1
+    await asyncio.gather(*queued)
+
+    assert peak == 1
+    assert (scheduler.active, scheduler.waiting) == (0, 0)
+
+
+async def test_request_scheduler_applies_a_raised_limit() -> None:
+    """Requests waiting for a slot start at once when the limit is raised."""
+    scheduler = RequestScheduler(1)
+    running = 0
+    peak = 0
+    gate = asyncio.Event()
+
+    async def _request() -> None:
+        nonlocal running, peak
+        async with scheduler.slot():
+            running += 1
+            peak = max(peak, running)
+            await gate.wait()
+            running -= 1
+
+    tasks = [asyncio.create_task(_request()) for _ in range(6)]
+    await asyncio.sleep(0)
+    assert (scheduler.active, scheduler.waiting) == (1, 5)
+    scheduler.set_limit(4)
+    await asyncio.sleep(0)
+    assert peak == 4
+    gate.set()
+    await asyncio.gather(*tasks)
+
+    assert peak == 4
+    assert (scheduler.active, scheduler.waiting) == (0, 0)
+
+
+async def test_make_request_returns_empty_payload_on_api_error() -> None:
+    """A failing endpoint keeps the partial-failure behaviour."""
+    coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    coordinator.scheduler = RequestScheduler(1)
+    coordinator.breakers = {}
+    coordinator.capabilities = LiveboxCapabilities()
+    coordinator.responses = ResponseCache(8, 60)
+
+    async def _request() -> dict[str, Any]:
+        raise AiosysbusException("boom")
+
+    assert await LiveboxDataUpdateCoordinator._make_request(coordinator, _request) == {}
+
+
+async def test_make_request_opens_breaker_and_serves_last_good_value() -> None:
+    """A repeatedly failing endpoint is backed off and its last value reused."""
+    coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    coordinator.scheduler = RequestScheduler(1)
+    coordinator.breakers = {}
+    coordinator.capabilities = LiveboxCapabilities()
+    coordinator.responses = ResponseCache(8, 60)
+    calls = 0
+    failing = False
+
+    async def _request(parameters: Any) -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        if failing:
+            raise AiosysbusException("boom")
+        return {"status": calls}
+
+    def _call() -> Any:
+        return LiveboxDataUpdateCoordinator._make_request(coordinator, _request, {})
+
+    clock = "custom_components.livebox.coordinator.monotonic"
+    with patch(clock, return_value=1000.0):
+        assert await _call() == {"status": 1}
+        failing = True
+        for _ in range(BREAKER_THRESHOLD):
+            assert await _call() == {"status": 1}
+        assert calls == 1 + BREAKER_THRESHOLD
+        (breaker,) = coordinator.breakers.values()
+        assert breaker.is_open
+        assert breaker.retry_at == 1000.0 + BREAKER_BACKOFF
+
+        # While open, the endpoint is not called.
+        assert await _call() == {"status": 1}
+        assert calls == 1 + BREAKER_THRESHOLD
+
+    with patch(clock, return_value=1000.0 + BREAKER_BACKOFF):
+        assert await _call() == {"status": 1}
+        assert calls == 2 + BREAKER_THRESHOLD
+        assert breaker.retry_at == 1000.0 + 3 * BREAKER_BACKOFF
+
+    failing = False
+    with patch(clock, return_value=1000.0 + 3 * BREAKER_BACKOFF):
+        assert await _call() == {"status": 3 + BREAKER_THRESHOLD}
+    assert not breaker.is_open
+    assert breaker.failures == 0
+
+
+@pytest.mark.parametrize(
+    ("software_version", "uptime", "endpoint"),
+    [
+        ("", 86400, "NeMo.async_get_MIBs"),
+        ("g6-1.0", BOOT_GRACE.total_seconds() - 60, "NeMo.async_get_MIBs"),
+        ("g6-1.0", 86400, "Nmc.async_get_wan_status"),
+    ],
+)
+async def test_make_request_waits_to_remember_unsupported_endpoints(
+    software_version: str, uptime: int, endpoint: str
+) -> None:
+    """Rejections seen too early, or of startup requests, are not kept."""
+    coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    coordinator.scheduler = RequestScheduler(1)
+    coordinator.breakers = {}
+    coordinator.capabilities = LiveboxCapabilities(software_version=software_version)
+    coordinator.uptime = uptime
+    coordinator.responses = ResponseCache(8, 60)
+    coordinator._capabilities_store = Mock()
+    request = AsyncMock(side_effect=RetrieveFailed("Object not found"))
+    request.__qualname__ = endpoint
+
+    for _ in range(BREAKER_THRESHOLD):
+        await LiveboxDataUpdateCoordinator._make_request(coordinator, request, "data")
+
+    assert coordinator.capabilities.unsupported == {}
+    coordinator._capabilities_store.async_delay_save.assert_not_called()
+
+
+async def test_make_request_remembers_unsupported_endpoints() -> None:
+    """Requests the Livebox always rejected are no longer sent."""
+    coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    coordinator.scheduler = RequestScheduler(1)
+    coordinator.breakers = {}
+    coordinator.capabilities = LiveboxCapabilities(software_version="g6-1.0")
+    coordinator.uptime = 86400
+    coordinator.responses = ResponseCache(8, 60)
+    coordinator._capabilities_store = Mock()
+    request = AsyncMock(side_effect=RetrieveFailed("Object not found"))
+
+    for _ in range(BREAKER_THRESHOLD):
+        assert (
+            await LiveboxDataUpdateCoordinator._make_request(
+                coordinator, request, "data"
+            )
+            == {}
+        )
+    (key,) = coordinator.capabilities.unsupported
+    assert key.endswith("::data")
+    coordinator._capabilities_store.async_delay_save.assert_called_once()
+
+    coordinator.breakers = {}
+    assert (
+        await LiveboxDataUpdateCoordinator._make_request(coordinator, request, "data")
+        == {}
+    )
+    assert request.await_count == BREAKER_THRESHOLD
+
+    # Probed again later, in case the Livebox was only failing for a while.
+    request.side_effect = None
+    request.return_value = {"status": True}
+    later = (
+        coordinator.capabilities.unsupported[key] + UNSUPPORTED_RETRY.total_seconds()
+    )
+    with patch("custom_components.livebox.coordinator.time", return_value=later):
+        assert await LiveboxDataUpdateCoordinator._make_request(
+            coordinator, request, "data"
+        ) == {"status": True}
+    assert coordinator.capabilities.unsupported == {}
+
+
+def test_capabilities_convert_unsupported_requests_of_previous_versions() -> None:
+    """Requests stored as a list are probed again after the retry delay."""
+    with patch("custom_components.livebox.coordinator.time", return_value=1000.0):
+        capabilities = LiveboxCapabilities(unsupported=["NeMo.async_get_MIBs::data"])
+    assert capabilities.unsupported == {"NeMo.async_get_MIBs::data": 1000.0}
+
+
+def test_response_cache_expires_and_is_bounded() -> None:
+    """Responses are served while fresh and the oldest ones are dropped."""
+    cache = ResponseCache(2, 60)
+    clock = "custom_components.livebox.coordinator.monotonic"
+    with patch(clock, return_value=1000.0):
+        cache.put("a", {"status": 1})
+        cache.put("b", {"status": 2})
+    with patch(clock, return_value=1060.0):
+        assert cache.get("a") == {"status": 1}
+        cache.put("c", {"status": 3})
+        assert cache.get("a") is None
+        assert cache.get("c") == {"status": 3}
+    with patch(clock, return_value=1061.0):
+        assert cache.get("b") is None
+        assert cache.get("c") == {"status": 3}
+
+
+@pytest.mark.parametrize(
+    ("bulk_error", "bulk_schedules", "bulk_calls"),
+    [
+        (None, False, 1),
+        (RetrieveFailed("Function not found"), False, 1),
+        (TimeoutExceededError("Timeout occurred"), None, 2),
+    ],
+)
+async def test_async_get_devices_wan_access_falls_back_to_per_device(
+    bulk_error: Exception | None, bulk_schedules: bool | None, bulk_calls: int
+) -> None:
+    """Firmwares without the bulk listing keep using one call per device.
+
+    Only an answer of the Livebox rules the listing out, a transient failure
+    probes it again at the next refresh.
+    """
+    coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    coordinator.scheduler = RequestScheduler(4)
+    coordinator.breakers = {}
+    coordinator.capabilities = LiveboxCapabilities(software_version="g6-1.0")
+    coordinator.uptime = 86400
+    coordinator.responses = ResponseCache(8, 60)
+    coordinator._capabilities_store = Mock()
+
+    async def _get_schedules(parameters: Any) -> dict[str, Any]:
+        if bulk_error is not None:
+            raise bulk_error
+        return {"status": True}
+
+    async def _get_schedule(parameters: Any) -> dict[str, Any]:
+        return {"data": {"scheduleInfo": {"ID": parameters["ID"]}}}
+
+    get_schedules = AsyncMock(side_effect=_get_schedules)
+    coordinator.api = SimpleNamespace(
+        schedule=SimpleNamespace(
+            async_get_schedules=get_schedules,
+            async_get_schedule=AsyncMock(side_effect=_get_schedule),
+        )
+    )
+    devices = {"AA:AA:AA:AA:AA:01": {}, "AA:AA:AA:AA:AA:02": {}}
+
+    for _ in range(2):
+        assert await LiveboxDataUpdateCoordinator.async_get_devices_wan_access(
+            coordinator, devices
+        ) == {
+            "AA:AA:AA:AA:AA:01": {"ID": "AA:AA:AA:AA:AA:01"},
+            "AA:AA:AA:AA:AA:02": {"ID": "AA:AA:AA:AA:AA:02"},
+        }
+
+    # An unsupported bulk listing is only probed once.
+    assert coordinator.capabilities.bulk_schedules is bulk_schedules
+    assert get_schedules.await_count == bulk_calls
+    assert coordinator.api.schedule.async_get_schedule.await_count == 4
+
+
+@pytest.mark.parametrize(
+    ("model", "link_type", "excluded", "wan_interface"),
+    [
+        (7, "gpon", {"dsl_status"}, "veip0"),
+        (3, "vdsl", {"fiber_status"}, "bridge_vmulti"),
+        (4, "ethernet", {"fiber_status"}, "eth0"),
+        (5656, "sfp", {"dsl_status", "dhcp_leases", "guest_dhcp_leases"}, "bridge"),
+        (None, "", set(), "veip0"),
+    ],
+)
+def test_profile_builds_fetch_plan(
+    model: int | None, link_type: str, excluded: set[str], wan_interface: str
+) -> None:
+    """Irrelevant sections are left out of the plan of each kind of box."""
+    profile = LiveboxProfile(model=model, link_type=link_type)
+
+    plan = {section.key for section in SECTIONS if section.supported_fn(profile)}
+
+    assert plan == {section.key for section in SECTIONS} - excluded
+    assert profile.wan_interface == wan_interface
+
+
+def test_update_listeners_only_notifies_changed_data_keys() -> None:
+    """Listeners subscribed to unchanged data are not called."""
+    coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    coordinator._notified_data = None
+    coordinator._notified_success = False
+    coordinator._notified_pending = set()
+    coordinator.pending_keys = set()
+    coordinator.last_update_success = True
+    wifi, device, other, always = Mock(), Mock(), Mock(), Mock()
+    coordinator._listeners = {
+        1: (wifi, ("wifi",)),
+        2: (device, (("devices", "AA"),)),
+        3: (other, (("devices", "BB"), "lan")),
+        4: (always, None),
+    }
+
+    coordinator.data = {"wifi": True, "devices": {"AA": {"Active": True}}}
+    LiveboxDataUpdateCoordinator.async_update_listeners(coordinator)
+    assert [m.call_count for m in (wifi, device, other, always)] == [1, 1, 1, 1]
+
+    coordinator.data = {"wifi": True, "devices": {"AA": {"Active": False}}}
+    LiveboxDataUpdateCoordinator.async_update_listeners(coordinator)
+    assert [m.call_count for m in (wifi, device, other, always)] == [1, 2, 1, 2]
+
+    # A failed refresh changes availability, so everyone is told.
+    coordinator.last_update_success = False
+    LiveboxDataUpdateCoordinator.async_update_listeners(coordinator)
+    assert [m.call_count for m in (wifi, device, other, always)] == [2, 3, 2, 3]
+
+    # Deferred sections landing change availability too.
+    coordinator.pending_keys = {"lan"}
+    LiveboxDataUpdateCoordinator.async_update_listeners(coordinator)
+    assert [m.call_count for m in (wifi, device, other, always)] == [3, 4, 3, 4]
+
+
+async def test_new_devices_do_not_hide_changes_of_known_ones() -> None:
+    """Known devices changed in the poll adding a device are still written."""
+    coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    coordinator.hass = None
+    coordinator.unique_id = "serial"
+    coordinator.last_update_success = True
+    coordinator._notified_success = True
+    coordinator.pending_keys = set()
+    coordinator._notified_pending = set()
+    coordinator.data = {"devices": {"AA": {"Active": True}}}
+    coordinator._notified_data = coordinator.data
+    known = Mock()
+    coordinator._listeners = {1: (known, (("devices", "AA"),))}
+    devices = {"AA": {"Active": False}, "BB": {"Active": True}}
+
+    with patch("custom_components.livebox.coordinator.async_dispatcher_send"):
+        await LiveboxDataUpdateCoordinator.async_detect_new_dvices(coordinator, devices)
+    coordinator.data = {"devices": devices}
+    LiveboxDataUpdateCoordinator.async_update_listeners(coordinator)
+
+    known.assert_called_once()
+
+
+def test_counter_accumulator_absorbs_wraps_and_resets() -> None:
+    """Counters keep increasing across 32-bit wraps and counter resets."""
+    counters = CounterAccumulator()
+    top = (1 << 32) - 100
+
+    assert counters.update(1000, {"rx": top, "client": 500}, 0) == {
+        "rx": top,
+        "client": 500,
+    }
+    # rx wrapped around 32 bits, the client reassociated and restarted at zero.
+    assert counters.update(1060, {"rx": 50, "client": 20}, 60) == {
+        "rx": (1 << 32) + 50,
+        "client": 520,
+    }
+    # The Livebox rebooted: every counter restarted, wrapped or not.
+    assert counters.update(30, {"rx": 10, "client": 30}, 120) == {
+        "rx": (1 << 32) + 60,
+        "client": 550,
+    }
+    # A missing reading keeps its last total.
+    assert counters.update(90, {}, 180)["client"] == 550
+
+
+def test_counter_accumulator_reboot_waits_for_fresh_readings() -> None:
+    """A counter not read when the reboot is seen restarts at its next reading."""
+    counters = CounterAccumulator()
+    counters.update(1000, {"fiber": 1_000_000, "wifi": 5_000}, 0)
+
+    # Only wifi was fetched again after the reboot.
+    assert counters.update(30, {"wifi": 100}, 60) == {
+        "fiber": 1_000_000,
+        "wifi": 5_100,
+    }
+    # fiber restarted too, it is accounted from its next reading.
+    assert counters.update(330, {"fiber": 5_000}, 360)["fiber"] == 1_005_000
+    assert counters.update(630, {"fiber": 8_000}, 660)["fiber"] == 1_008_000
+
+
+def test_counter_accumulator_forgets_departed_clients() -> None:
+    """Counters no longer read are dropped after the retention period."""
+    counters = CounterAccumulator()
+    counters.update(1000, {"fiber": 10, "client": 500}, 0)
+    counters.update(1060, {"client": 20}, 60)
+    retention = COUNTER_RETENTION.total_seconds()
+
+    totals = counters.update(2000, {"fiber": 20}, retention + 1)
+
+    assert totals == {"fiber": 20, "client": 520}
+    totals = counters.update(3000, {"fiber": 30}, retention + 61)
+    assert totals == {"fiber": 30}
+    assert "client" not in counters.offsets
+    assert "client" not in counters.seen
+
+
+def test_throughput_is_derived_from_fresh_counter_readings() -> None:
+    """Rates only move when their section was fetched again, across wraps."""
+    coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    coordinator.counters = CounterAccumulator()
+    coordinator.rates = {}
+    coordinator._counter_samples = {}
+    coordinator._counters_store = Mock()
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    client = "wifi_clients.AA:BB:CC:DD:EE:FF.TxBytes"
+
+    def _update(
+        seconds: int, fiber_rx: int, client_tx: int | None, lan: int = 0
+    ) -> None:
+        coordinator._section_fetched_at = {
+            "fiber_stats": start + timedelta(seconds=seconds),
+            "lan": start + timedelta(seconds=lan),
+        }
+        LiveboxDataUpdateCoordinator._async_update_counters(
+            coordinator,
+            1000 + seconds,
+            {"fiber_stats": {"RxBytes": fiber_rx}, "wifi_stats": {}},
+            {} if client_tx is None else {"AA:BB:CC:DD:EE:FF": {"TxBytes": client_tx}},
+        )
+
+    _update(0, (1 << 32) - 3000, 10)
+    assert coordinator.rates == {}
+
+    # The fiber counter wrapped; the lan section was not fetched again.
+    _update(60, 3000, 10)
+    assert coordinator.rates == {"fiber_stats.RxBytes": 100.0}
+    assert client not in coordinator.rates
+
+    _update(120, 9000, 1210, lan=120)
+    assert coordinator.rates[client] == 10.0
+
+    # The client left: a fresh lan fetch no longer lists it.
+    _update(180, 15000, None, lan=180)
+    assert coordinator.rates == {"fiber_stats.RxBytes": 100.0}
+    assert client not in coordinator._counter_samples
+
+
+def test_counters_ignore_sections_served_from_cache() -> None:
+    """A reboot seen while a section is cached does not count it twice."""
+    coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    coordinator.counters = CounterAccumulator()
+    coordinator.rates = {}
+    coordinator._counter_samples = {}
+    coordinator._counters_store = Mock()
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+
+    def _update(uptime: int, fetched: int, fiber_rx: int) -> dict[str, int]:
+        coordinator._section_fetched_at = {
+            "fiber_stats": start + timedelta(seconds=fetched)
+        }
+        return LiveboxDataUpdateCoordinator._async_update_counters(
+            coordinator,
+            uptime,
+            {"fiber_stats": {"RxBytes": fiber_rx}, "wifi_stats": {}},
+            {},
+        )
+
+    _update(1000, 0, 1_000_000)
+    # Rebooted, fiber_stats is still the cached result of the last fetch.
+    assert _update(30, 0, 1_000_000)["fiber_stats.RxBytes"] == 1_000_000
+    assert _update(330, 300, 5_000)["fiber_stats.RxBytes"] == 1_005_000
+
+
+async def test_device_events_patch_devices_between_reconciliations() -> None:
+    """Pushed device changes update the snapshot without polling devices."""
+    coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    devices = {"AA": {"Key": "AA", "Active": True}}
+    coordinator._section_results = {"devices": (devices, {"wireless": 1})}
+    coordinator._section_fetched_at = {"devices": datetime(2026, 1, 1, tzinfo=UTC)}
+    coordinator._section_merges = {}
+    coordinator._merge_serial = 0
+    coordinator.data = {"devices": devices}
+    coordinator.events_connected = False
+    coordinator.capabilities = LiveboxCapabilities()
+    coordinator._capabilities_store = Mock()
+    coordinator.async_update_listeners = Mock()
+    coordinator.async_request_refresh = AsyncMock()
+
+    def _event(key: str, reason: str, **attributes: Any) -> dict[str, Any]:
+        handler = f"Devices.Device.{key}"
+        payload = {"reason": reason, "attributes": attributes}
+        return {"data": {"handler": handler, "object": payload}}
+
+    polls = [
+        {"events": [_event("AA", "changed", Active=False)]},
+        # Not tracked, e.g. a wired device without LAN tracking.
+        {"events": [_event("CC", "changed", Active=True)]},
+        {"data": {"events": [_event("BB", "device_added")]}},
+    ]
+
+    async def _get_events(parameters: dict[str, Any]) -> dict[str, Any]:
+        assert parameters["channelid"] == 7
+        assert coordinator.events_connected
+        if polls:
+            return polls.pop(0)
+        raise asyncio.CancelledError
+
+    coordinator.api = SimpleNamespace(
+        event=SimpleNamespace(
+            async_open_channel=AsyncMock(return_value={"data": {"channelid": 7}}),
+            async_get_events=_get_events,
+        )
+    )
+
+    with pytest.raises(asyncio.CancelledError):
+        await LiveboxDataUpdateCoordinator._async_listen_device_events(coordinator)
+
+    assert coordinator.data["devices"]["AA"]["Active"] is False
+    assert devices["AA"]["Active"] is True
+    assert coordinator._section_results["devices"][0]["AA"]["Active"] is False
+    coordinator.async_update_listeners.assert_called_once()
+    # A new device forces the next refresh to fetch all devices.
+    assert "devices" not in coordinator._section_fetched_at
+    coordinator.async_request_refresh.assert_awaited_once()
+
+
+async def test_device_events_rejected() -> None:
+    """Boxes answering the channel request with an error stop asking."""
+    coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    coordinator.events_connected = False
+    coordinator.capabilities = LiveboxCapabilities(software_version="g6-1.0")
+    coordinator.uptime = 86400
+    coordinator._capabilities_store = Mock()
+    coordinator.api = SimpleNamespace(
+        event=SimpleNamespace(
+            async_open_channel=AsyncMock(side_effect=RetrieveFailed("Not found"))
+        )
+    )
+
+    await LiveboxDataUpdateCoordinator._async_listen_device_events(coordinator)
+
+    assert coordinator.capabilities.events is False
+    coordinator._capabilities_store.async_delay_save.assert_called_once()
+
+
+async def test_device_events_listener_stops_when_cancelled() -> None:
+    """A cancelled long-poll ends although aiosysbus reports a timeout."""
+    coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    coordinator.events_connected = False
+    coordinator.capabilities = LiveboxCapabilities(events=True)
+    polling = asyncio.Event()
+
+    async def _get_events(parameters: dict[str, Any]) -> dict[str, Any]:
+        polling.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError as error:
+            raise TimeoutExceededError("Timeout occurred") from error
+        return {}
+
+    open_channel = AsyncMock(return_value={"data": {"channelid": 7}})
+    coordinator.api = SimpleNamespace(
+        event=SimpleNamespace(
+            async_open_channel=open_channel, async_get_events=_get_events
+        )
+    )
+
+    task = asyncio.create_task(
+        LiveboxDataUpdateCoordinator._async_listen_device_events(coordinator)
+    )
+    await polling.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    open_channel.assert_awaited_once()
+
+
+async def test_make_request_propagates_cancellation() -> None:
+    """Background tasks cancelled mid-request are not kept running."""
+    coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    coordinator.scheduler = RequestScheduler(1)
+    coordinator.breakers = {}
+    coordinator.capabilities = LiveboxCapabilities()
+    started = asyncio.Event()
+
+    async def _request() -> dict[str, Any]:
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError as error:
+            raise TimeoutExceededError("Timeout occurred") from error
+        return {}
+
+    task = asyncio.create_task(
+        LiveboxDataUpdateCoordinator._make_request(coordinator, _request)
+    )
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert not any(breaker.failures for breaker in coordinator.breakers.values())
+    assert coordinator.scheduler.active == 0
+
+
+async def test_device_events_unsupported() -> None:
+    """Boxes without event channel keep polling devices every scan."""
+    coordinator = object.__new__(LiveboxDataUpdateCoordinator)
+    coordinator.events_connected = False
+    coordinator.capabilities = LiveboxCapabilities()
+    coordinator._capabilities_store = Mock()
+    coordinator.api = SimpleNamespace(
+        event=SimpleNamespace(async_open_channel=AsyncMock(return_value={}))
+    )
+
+    await LiveboxDataUpdateCoordinator._async_listen_device_events(coordinator)
+
+    assert not coordinator.events_connected
+    assert coordinator.capabilities.events is False
+    # Known unsupported, the channel is not even opened on the next start.
+    coordinator.api.event.async_open_channel.reset_mock()
+    await LiveboxDataUpdateCoordinator._async_listen_device_events(coordinator)
+    coordinator.api.event.async_open_channel.assert_not_awaited()
@@ -1,23 +1,28 @@
 """The tests for the bbox component."""
 
-from datetime import datetime
+from datetime import timedelta
 from types import SimpleNamespace
 from typing import Any, cast
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from freezegun.api import FrozenDateTimeFactory
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_HOME, STATE_NOT_HOME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
 from custom_components.livebox.const import (
     CONF_TRACKING_TIMEOUT,
     DEFAULT_TRACKING_TIMEOUT,
     DOMAIN,
 )
-from custom_components.livebox.coordinator import LiveboxDataUpdateCoordinator
+from custom_components.livebox.coordinator import (
+    SNAPSHOT_SAVE_DELAY,
+    LiveboxDataUpdateCoordinator,
+)
 from custom_components.livebox.device_tracker import (
     LiveboxDeviceScannerEntity,
     async_add_new_tracked_entities,
@@ -31,6 +36,10 @@ async def test_device_tracker(
     AIOSysbus: AsyncMock | MagicMock,
 ) -> None:
     """Test the device tracker platform."""
+    # Report devices away as soon as they disconnect.
+    hass.config_entries.async_update_entry(
+        config_entry, options={**config_entry.options, CONF_TRACKING_TIMEOUT: 0}
+    )
     await hass.config_entries.async_setup(config_entry.entry_id)
     await hass.async_block_till_done()
 
@@ -51,21 +60,91 @@ async def test_device_tracker(
     # Disable device PC-408
     AIOSysbus.__devices["status"][69]["Active"] = False
     AIOSysbus.__devices["status"][69]["IPAddress"] = None
-    with (
-        patch("custom_components.livebox.device_tracker.datetime") as mock_datetime,
-    ):
-        mock_datetime.today.return_value = datetime(9999, 1, 1, 12, 0, 0)
-        mock_datetime.side_effect = lambda *a, **kw: datetime(*a, **kw)
+    coordinator = config_entry.runtime_data
+    await coordinator.async_request_refresh()
+    await hass.async_block_till_done()
+
+    state = hass.states.get("device_tracker.pc_408")
+    assert state is not None
+    assert state.state == STATE_NOT_HOME
+    assert state.attributes.get("ip") is None
+
+
+@pytest.mark.parametrize("AIOSysbus", ["7"], indirect=True)
+async def test_device_tracker_away_after_tracking_timeout(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A disconnected device is reported away once the timeout elapsed."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    AIOSysbus.__devices["status"][69]["Active"] = False
+    coordinator = config_entry.runtime_data
+    await coordinator.async_request_refresh()
+    await hass.async_block_till_done()
+
+    state = hass.states.get("device_tracker.pc_408")
+    assert state is not None
+    assert state.state == STATE_HOME
+
+    # The devices data does not change anymore, the timeout alone flips it.
+    freezer.tick(timedelta(seconds=DEFAULT_TRACKING_TIMEOUT + 1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("device_tracker.pc_408")
+    assert state is not None
+    assert state.state == STATE_NOT_HOME
 
-        # Trigger a refresh of the coordinator
-        coordinator = config_entry.runtime_data
-        await coordinator.async_request_refresh()
-        await hass.async_block_till_done()
 
-        state = hass.states.get("device_tracker.pc_408")
-        assert state is not None
-        assert state.state == STATE_NOT_HOME
-        assert state.attributes.get("ip") is None
+@pytest.mark.parametrize("AIOSysbus", ["7"], indirect=True)
+async def test_device_tracker_timeout_starts_when_device_leaves(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A device active for long, unchanged meanwhile, gets the full timeout."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    freezer.tick(timedelta(seconds=DEFAULT_TRACKING_TIMEOUT * 3))
+
+    AIOSysbus.__devices["status"][69]["Active"] = False
+    await config_entry.runtime_data.async_refresh()
+    await hass.async_block_till_done()
+
+    state = hass.states.get("device_tracker.pc_408")
+    assert state is not None
+    assert state.state == STATE_HOME
+
+
+@pytest.mark.parametrize("AIOSysbus", ["7"], indirect=True)
+async def test_device_tracker_timeout_ignores_the_snapshot(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A device that left while stopped is away once the Livebox answers."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    freezer.tick(SNAPSHOT_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    AIOSysbus.__devices["status"][69]["Active"] = False
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert config_entry.runtime_data.from_snapshot is False
+    state = hass.states.get("device_tracker.pc_408")
+    assert state is not None
+    assert state.state == STATE_NOT_HOME
 
 
 @pytest.mark.parametrize("AIOSysbus", ["7"], indirect=True)
@@ -115,6 +194,7 @@ async def test_device_tracker_adds_repeaters_before_clients() -> None:
         LiveboxDataUpdateCoordinator,
         SimpleNamespace(
             unique_id="LIVEBOX-1",
+            from_snapshot=False,
             config_entry=SimpleNamespace(
                 data={"host": "192.168.1.1", "port": 80},
                 options={},
@@ -200,6 +280,7 @@ def test_device_tracker_adds_associated_wifi_stats() -> None:
             ),
             get_parent_device_identifier=lambda _device_key: (DOMAIN, "LIVEBOX"),
             unique_id="LIVEBOX",
+            from_snapshot=False,
         ),
     )
     device = {
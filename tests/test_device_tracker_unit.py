@@ -24,6 +24,7 @@ async def test_device_tracker_updates_via_device_on_coordinator_refresh() -> Non
     coordinator = object.__new__(LiveboxDataUpdateCoordinator)
     coordinator.hass = cast(Any, SimpleNamespace())
     coordinator.unique_id = "LIVEBOX-1"
+    coordinator.from_snapshot = False
     coordinator.config_entry = SimpleNamespace(
         entry_id="entry-1",
         data={"host": "192.168.1.1", "port": 80},
@@ -0,0 +1,112 @@
+"""Tests for the Livebox diagnostics."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from aiosysbus.exceptions import TimeoutExceededError
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from custom_components.livebox.diagnostics import async_get_config_entry_diagnostics
+
+
+def _named_mock(name: str, **kwargs) -> AsyncMock:
+    """Return an API method mock dumped under name."""
+    mock = AsyncMock(**kwargs)
+    mock.__qualname__ = name
+    return mock
+
+
+async def _stuck_call() -> None:
+    """Never answer."""
+    await asyncio.Event().wait()
+
+
+async def _stuck_sysbus_call() -> None:
+    """Never answer, turning the cancellation into an error like aiosysbus."""
+    try:
+        await asyncio.Event().wait()
+    except asyncio.CancelledError as error:
+        raise TimeoutExceededError("Timeout occurred") from error
+
+
+async def test_diagnostics_calls_run_concurrently(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+) -> None:
+    """Calls overlap, are timed, and a stuck call does not block the others."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    running = 0
+    overlap = 0
+
+    async def _slow_call() -> dict[str, str]:
+        nonlocal running, overlap
+        running += 1
+        overlap = max(overlap, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"status": "ok"}
+
+    AIOSysbus.time.async_get_time = _named_mock("Time.get", side_effect=_slow_call)
+    AIOSysbus.time.async_get_ntp = _named_mock("Time.ntp", side_effect=_slow_call)
+    AIOSysbus.pnp.async_get = _named_mock("PnP.get", side_effect=_stuck_call)
+    AIOSysbus.sfp.async_get = _named_mock("SFP.get", side_effect=_stuck_sysbus_call)
+
+    with patch("custom_components.livebox.diagnostics.CALL_TIMEOUT", 0.05):
+        diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+
+    assert overlap == 2
+    assert diagnostics["api_raw"]["Time.get"] == {"status": "ok"}
+    assert diagnostics["api_raw"]["PnP.get"] == "Timeout after 0.05s"
+    assert diagnostics["api_raw"]["SFP.get"] == "Timeout after 0.05s"
+    assert diagnostics["api_timings"]["Time.get"] >= 0.01
+    assert diagnostics["api_timings"]["PnP.get"] >= 0.05
+
+
+async def test_diagnostics_time_budget(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+) -> None:
+    """Calls left when the time budget is spent are reported as skipped."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    AIOSysbus.pnp.async_get = _named_mock("PnP.get", side_effect=_stuck_call)
+    AIOSysbus.sfp.async_get = _named_mock("SFP.get", side_effect=_stuck_sysbus_call)
+    scheduler = config_entry.runtime_data.scheduler
+
+    with patch("custom_components.livebox.diagnostics.TIME_BUDGET", 0.05):
+        diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+
+    for name in ("PnP.get", "SFP.get"):
+        assert diagnostics["api_raw"][name] == "Skipped: time budget of 0.05s exceeded"
+        assert name not in diagnostics["api_timings"]
+    # Cancelled calls gave their request slot back.
+    assert scheduler.active == 0
+
+
+async def test_diagnostics_reuse_fresh_responses(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+) -> None:
+    """Responses the coordinator just received are not requested again."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    get_wan_status = AIOSysbus.nmc.async_get_wan_status
+    get_wan_status.__qualname__ = "NMC.async_get_wan_status"
+    await config_entry.runtime_data.async_refresh()
+    get_wan_status.reset_mock()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+
+    get_wan_status.assert_not_awaited()
+    assert "NMC.async_get_wan_status" in diagnostics["api_cached"]
+    assert (
+        diagnostics["api_raw"]["NMC.async_get_wan_status"]
+        == get_wan_status.return_value
+    )
@@ -0,0 +1,39 @@
+"""Tests for the Livebox helpers."""
+
+import pytest
+
+from custom_components.livebox.helpers import KeyPath, find_item
+
+DATA = {
+    "a": {"b": [{"c": "value_a"}, {"d": "value_b"}], "1": "digit key"},
+    "devices": {"AA:BB": {"Rate": 2000}},
+    "stats": {"eth0.100": {"rate_rx": 1.5}},
+}
+
+
+@pytest.mark.parametrize(
+    ("path", "default", "expected"),
+    [
+        ("a.b.0.c", None, "value_a"),
+        ("a.b.1.c", "default", "default"),
+        ("a.b.5.c", "default", "default"),
+        ("a.1", None, "digit key"),
+        ("a.b.x", "default", "default"),
+        ("a.b.0.c.d", "default", "default"),
+        ("missing", None, None),
+        (("devices", "AA:BB", "Rate"), 0, 2000),
+        (("stats", "eth0.100", "rate_rx"), None, 1.5),
+    ],
+)
+def test_key_path(path: str | tuple[str, ...], default: object, expected: object):
+    """A compiled path reads the same values as the dotted lookup."""
+    assert KeyPath(path, default=default)(DATA) == expected
+    if isinstance(path, str):
+        assert find_item(DATA, path, default) == expected
+
+
+def test_key_path_convert():
+    """The converter is applied to the value or to the default."""
+    path = KeyPath(("devices", "AA:BB", "Rate"), default=0, convert=lambda x: x / 1000)
+    assert path(DATA) == 2
+    assert path({}) == 0
@@ -13,7 +13,11 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from pytest_homeassistant_custom_component.common import load_json_object_fixture
 
-from custom_components.livebox.coordinator import LiveboxDataUpdateCoordinator
+from custom_components.livebox.coordinator import (
+    CounterAccumulator,
+    LiveboxDataUpdateCoordinator,
+    _index_wifi_clients,
+)
 from custom_components.livebox.sensor import (
     SENSOR_TYPES,
     LiveboxSensor,
@@ -123,7 +127,8 @@ async def test_rate_sensors_use_megabits_per_second_math(
 ) -> None:
     """Test rate sensors use Mbit/s math to match their declared unit."""
     await hass.config_entries.async_setup(config_entry.entry_id)
-    await hass.async_block_till_done()
+    # Interface statistics are collected in the background.
+    await hass.async_block_till_done(wait_background_tasks=True)
 
     rx_state = hass.states.get(f"sensor.{AIOSysbus.__unique_name}_eth2_rate_rx")
     assert rx_state is not None
@@ -148,6 +153,7 @@ async def test_device_metric_sensors_are_created_for_wifi_clients(
                 options={},
             ),
             signal_device_new="livebox-LIVEBOX-device-new",
+            signal_tracking_changed="livebox-LIVEBOX-tracking-changed",
             get_parent_device_identifier=lambda _device_key: ("livebox", "LIVEBOX"),
             data={
                 "devices": {
@@ -179,6 +185,17 @@ async def test_device_metric_sensors_are_created_for_wifi_clients(
             },
         ),
     )
+    # The coordinator indexes the clients associated to each access point and
+    # accumulates their byte counters.
+    coordinator.data["wifi_clients"] = _index_wifi_clients(coordinator.data["lan"])
+    coordinator.data["counters"] = CounterAccumulator().update(
+        0,
+        {
+            f"wifi_clients.AA:BB:CC:DD:EE:FF.{metric}": value
+            for metric, value in (("TxBytes", 321), ("RxBytes", 654))
+        },
+        0,
+    )
     config_entry.runtime_data = coordinator
 
     entities: list[LiveboxSensor] = []
@@ -1,10 +1,22 @@
 """Tests pour l'intégration Bbox2 utilisant config_entries."""
 
+import asyncio
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from freezegun.api import FrozenDateTimeFactory
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import ATTR_RESTORED, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.livebox.const import CONF_WIFI_TRACKING, DOMAIN
+from custom_components.livebox.coordinator import (
+    COUNTERS_SAVE_DELAY,
+    SNAPSHOT_KEYS,
+    SNAPSHOT_SAVE_DELAY,
+)
 
 
 @pytest.mark.parametrize("AIOSysbus", ["3", "5", "7", "7.1", "7.2"], indirect=True)
@@ -37,3 +49,135 @@ async def test_coordinator_refresh(
     coordinator = config_entry.runtime_data
     await coordinator.async_request_refresh()
     await hass.async_block_till_done()
+
+
+@pytest.mark.parametrize("AIOSysbus", ["7"], indirect=True)
+async def test_remove_entry_deletes_stored_data(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Removing the entry removes the data persisted for it."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    freezer.tick(COUNTERS_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert f"{DOMAIN}.{config_entry.entry_id}.counters" in hass_storage
+
+    await hass.config_entries.async_remove(config_entry.entry_id)
+
+    assert not any(key.startswith(f"{DOMAIN}.") for key in hass_storage)
+
+
+@pytest.mark.parametrize("AIOSysbus", ["7"], indirect=True)
+async def test_options_are_applied_without_reload(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+) -> None:
+    """Tracking options remove and add trackers on the running entry."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = config_entry.runtime_data
+    entity_id = "device_tracker.pc_408"
+    assert hass.states.get(entity_id).state != STATE_UNAVAILABLE
+
+    hass.config_entries.async_update_entry(
+        config_entry,
+        options={**config_entry.options, CONF_WIFI_TRACKING: False},
+    )
+    await hass.async_block_till_done()
+
+    # Like after a reload, the registry entry of the untracked device stays.
+    assert config_entry.runtime_data is coordinator
+    assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
+    assert hass.states.get(entity_id).attributes[ATTR_RESTORED]
+
+    hass.config_entries.async_update_entry(
+        config_entry,
+        options={**config_entry.options, CONF_WIFI_TRACKING: True},
+    )
+    await hass.async_block_till_done()
+
+    assert config_entry.runtime_data is coordinator
+    assert hass.states.get(entity_id).state != STATE_UNAVAILABLE
+
+
+async def test_setup_starts_from_the_stored_snapshot(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Entities are created from the last snapshot before the Livebox answers."""
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    trackers = hass.states.async_entity_ids("device_tracker")
+    sensors = hass.states.async_entity_ids("sensor")
+    freezer.tick(SNAPSHOT_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    snapshot = hass_storage[f"{DOMAIN}.{config_entry.entry_id}.snapshot"]["data"]
+    # Only what entities are created from is kept, no call log nor WAN address.
+    assert set(snapshot["data"]) == {*SNAPSHOT_KEYS, "infos", "wan_status", "stats"}
+    assert "ExternalIPAddress" not in snapshot["data"]["infos"]
+    assert set(snapshot["data"]["wan_status"]) == {"LinkType"}
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    answered = asyncio.Event()
+    get_deviceinfo = AIOSysbus.deviceinfo.async_get_deviceinfo
+    infos = await get_deviceinfo()
+
+    async def _slow_deviceinfo() -> dict[str, Any]:
+        await answered.wait()
+        return infos
+
+    get_deviceinfo.side_effect = _slow_deviceinfo
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert hass.states.async_entity_ids("device_tracker") == trackers
+    assert hass.states.async_entity_ids("sensor") == sensors
+    assert config_entry.runtime_data.last_update_success
+    call_missed = f"binary_sensor.{AIOSysbus.__unique_name}_call_missed"
+    assert hass.states.get(call_missed).state == STATE_UNAVAILABLE
+
+    answered.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert config_entry.runtime_data.data["infos"] == infos["status"]
+    assert hass.states.get(call_missed).state != STATE_UNAVAILABLE
+
+
+async def test_slow_sections_are_fetched_after_setup(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+) -> None:
+    """Setup only waits for the sections entities are created from."""
+    answered = asyncio.Event()
+    get_wifi = AIOSysbus.nmc.async_get_wifi
+    wifi = await get_wifi()
+
+    async def _slow_wifi() -> dict[str, Any]:
+        await answered.wait()
+        return wifi
+
+    get_wifi.side_effect = _slow_wifi
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = f"switch.{AIOSysbus.__unique_name}_wifi"
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
+    assert "wifi" in config_entry.runtime_data.pending_keys
+
+    answered.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert not config_entry.runtime_data.pending_keys
+    assert hass.states.get(entity_id).state != STATE_UNAVAILABLE
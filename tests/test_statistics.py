@@ -0,0 +1,125 @@
+"""Tests for the Livebox long-term statistics."""
+
+from datetime import datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.statistics import statistics_during_period
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.util.dt import UTC
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+
+from custom_components.livebox.statistics import hourly_rates, traffic_statistic_id
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(
+    recorder_mock: Recorder, enable_custom_integrations: None
+) -> None:
+    """Start the recorder before Home Assistant loads the integration."""
+
+
+def test_hourly_rates() -> None:
+    """Readings are grouped by hour and converted to Mbit/s."""
+    start = datetime(2026, 1, 1, 10, tzinfo=UTC).timestamp()
+    readings = [
+        {"Timestamp": start, "Rx_Counter": 3_750_000},
+        {"Timestamp": start + 1800, "Rx_Counter": 11_250_000},
+        {"Timestamp": start + 3600, "Rx_Counter": 0},
+    ]
+
+    assert hourly_rates(readings, "Rx_Counter", 30) == [
+        {
+            "start": datetime(2026, 1, 1, 10, tzinfo=UTC),
+            "mean": 2.0,
+            "min": 1.0,
+            "max": 3.0,
+        },
+        {
+            "start": datetime(2026, 1, 1, 11, tzinfo=UTC),
+            "mean": 0.0,
+            "min": 0.0,
+            "max": 0.0,
+        },
+    ]
+
+
+async def test_interface_traffic_is_backfilled_into_statistics(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock | MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Readings missed during an outage are imported hour by hour."""
+    start = datetime(2026, 1, 1, 9, 0, tzinfo=UTC).timestamp()
+    freezer.move_to(datetime(2026, 1, 1, 10, 20, tzinfo=UTC))
+    requested: list[int] = []
+
+    async def _get_results(parameters: dict[str, Any]) -> dict[str, Any]:
+        number = parameters["NumberOfReadings"]
+        requested.append(number)
+        newest = int(freezer().timestamp())  # type: ignore[operator]
+        # The Livebox returns the newest reading first, one every 30 seconds.
+        traffic = [
+            {
+                "Timestamp": timestamp,
+                "Rx_Counter": 3_750_000,
+                "Tx_Counter": 7_500_000 if timestamp % 3600 == 1800 else 0,
+            }
+            for timestamp in range(newest, int(start), -30)
+        ][:number]
+        return {
+            "status": {
+                name: {"Traffic": traffic} for name in parameters["InterfaceName"]
+            }
+        }
+
+    AIOSysbus.homelan.async_get_interface = AsyncMock(
+        return_value={"status": {"eth4": {"Name": "eth4", "FriendlyName": "WAN"}}}
+    )
+    AIOSysbus.homelan.async_get_results = AsyncMock(side_effect=_get_results)
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    coordinator = config_entry.runtime_data
+    rx_id, tx_id = (
+        traffic_statistic_id(coordinator.unique_id, "eth4", direction)
+        for direction in ("rx", "tx")
+    )
+
+    # Nothing was imported before, so collection starts with the current hour.
+    assert requested == [40]
+
+    # Home Assistant lost the router for two hours.
+    freezer.move_to(datetime(2026, 1, 1, 12, 40, tzinfo=UTC))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    await async_wait_recording_done(hass)
+
+    assert requested == [40, 280]
+    statistics = await recorder_mock.async_add_executor_job(
+        statistics_during_period,
+        hass,
+        datetime(2026, 1, 1, 9, 0, tzinfo=UTC),
+        None,
+        {rx_id, tx_id},
+        "hour",
+        None,
+        {"mean", "min", "max"},
+    )
+    rx, tx = statistics[rx_id], statistics[tx_id]
+    assert [row["start"] for row in rx] == [
+        datetime(2026, 1, 1, hour, tzinfo=UTC).timestamp() for hour in (10, 11)
+    ]
+    assert {row["mean"] for row in rx} == {1.0}
+    assert [(row["min"], row["max"]) for row in tx] == [(0.0, 2.0), (0.0, 2.0)]
+    assert coordinator._statistics_imported_until == {
+        "WAN": datetime(2026, 1, 1, 12, tzinfo=UTC).timestamp()
+    }
@@ -1,3 +1,4 @@
+import asyncio
 import copy
 from unittest.mock import AsyncMock
 
@@ -219,3 +220,161 @@ async def test_wan_access_switch_unique_id_migration(
 
     # No duplicate entry should exist under the old unique_id
     assert entity_registry.async_get_entity_id("switch", "livebox", legacy_uid) is None
+
+
+@pytest.mark.parametrize("AIOSysbus", ["7"], indirect=True)
+async def test_switch_wan_access_uses_bulk_schedule_listing(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock,
+) -> None:
+    """WAN access state comes from one bulk ToD listing when the box supports it."""
+    AIOSysbus.schedule.async_get_schedules = AsyncMock(
+        return_value={
+            "status": True,
+            "data": {
+                "scheduleInfo": [
+                    {
+                        "base": "Weekly",
+                        "def": "Enable",
+                        "ID": "**REDACTED**",
+                        "override": "Disable",
+                        "value": "Enable",
+                        "enable": True,
+                        "schedule": [],
+                    }
+                ]
+            },
+        }
+    )
+
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("switch.pc_408_wan_access")
+    assert state is not None
+    assert state.state == STATE_OFF
+    AIOSysbus.schedule.async_get_schedules.assert_awaited_with({"type": "ToD"})
+    AIOSysbus.schedule.async_get_schedule.assert_not_awaited()
+
+
+@pytest.mark.parametrize("AIOSysbus", ["7"], indirect=True)
+async def test_switch_refreshes_only_its_section(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock,
+) -> None:
+    """Toggling Wi-Fi fetches the Wi-Fi state again, not the whole Livebox."""
+    wifi_data = copy.deepcopy(await AIOSysbus.nmc.async_get_wifi())
+    wifi_data["status"]["Enable"] = False
+    AIOSysbus.nmc.async_get_wifi.return_value = wifi_data
+
+    async def mock_set_wifi(parameters):
+        wifi_data["status"]["Enable"] = parameters["Enable"]
+
+    AIOSysbus.nmc.async_set_wifi.side_effect = mock_set_wifi
+
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    entity_id = f"switch.{AIOSysbus.__unique_name}_wifi"
+    assert hass.states.get(entity_id).state == STATE_OFF
+    AIOSysbus.devices.async_get_devices.reset_mock()
+
+    await hass.services.async_call(
+        Platform.SWITCH, "turn_on", {ATTR_ENTITY_ID: entity_id}, blocking=True
+    )
+
+    assert hass.states.get(entity_id).state == STATE_ON
+    AIOSysbus.devices.async_get_devices.assert_not_awaited()
+
+
+@pytest.mark.parametrize("AIOSysbus", ["7"], indirect=True)
+async def test_switch_wan_access_refreshes_only_its_schedule(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock,
+) -> None:
+    """Locking a device fetches its schedule again, not the whole Livebox."""
+    schedule = {
+        "base": "Weekly",
+        "def": "Enable",
+        "ID": "**REDACTED**",
+        "override": "Enable",
+        "enable": True,
+        "schedule": [],
+    }
+    AIOSysbus.schedule.async_get_schedule = AsyncMock(
+        side_effect=lambda *_: {"data": {"scheduleInfo": dict(schedule)}}
+    )
+
+    async def mock_set_schedule(parameters):
+        schedule["override"] = parameters["override"]
+        return {"status": True}
+
+    AIOSysbus.schedule.async_set_schedule = AsyncMock(side_effect=mock_set_schedule)
+
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.states.get("switch.pc_408_wan_access").state == STATE_ON
+    AIOSysbus.devices.async_get_devices.reset_mock()
+    AIOSysbus.schedule.async_get_schedule.reset_mock()
+
+    await hass.services.async_call(
+        Platform.SWITCH,
+        "turn_off",
+        {ATTR_ENTITY_ID: "switch.pc_408_wan_access"},
+        blocking=True,
+    )
+
+    assert hass.states.get("switch.pc_408_wan_access").state == STATE_OFF
+    AIOSysbus.schedule.async_get_schedule.assert_awaited_once()
+    AIOSysbus.devices.async_get_devices.assert_not_awaited()
+
+
+@pytest.mark.parametrize("AIOSysbus", ["7"], indirect=True)
+async def test_switch_wifi_toggled_during_a_poll(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    AIOSysbus: AsyncMock,
+) -> None:
+    """A poll that read the Wi-Fi before a toggle does not revert it."""
+    wifi_data = copy.deepcopy(await AIOSysbus.nmc.async_get_wifi())
+    wifi_data["status"]["Enable"] = False
+    AIOSysbus.nmc.async_get_wifi = AsyncMock(
+        side_effect=lambda: copy.deepcopy(wifi_data)
+    )
+
+    async def mock_set_wifi(parameters):
+        wifi_data["status"]["Enable"] = parameters["Enable"]
+
+    AIOSysbus.nmc.async_set_wifi.side_effect = mock_set_wifi
+
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    entity_id = f"switch.{AIOSysbus.__unique_name}_wifi"
+    assert hass.states.get(entity_id).state == STATE_OFF
+
+    wan_status = await AIOSysbus.nmc.async_get_wan_status()
+    polled = asyncio.Event()
+    answered = asyncio.Event()
+
+    async def _slow_wan_status():
+        polled.set()
+        await answered.wait()
+        return wan_status
+
+    AIOSysbus.nmc.async_get_wan_status = AsyncMock(side_effect=_slow_wan_status)
+    coordinator = config_entry.runtime_data
+    coordinator.invalidate_sections("wifi", "wan_status")
+    poll = hass.async_create_task(coordinator.async_refresh())
+    await polled.wait()
+
+    await hass.services.async_call(
+        Platform.SWITCH, "turn_on", {ATTR_ENTITY_ID: entity_id}, blocking=True
+    )
+    assert hass.states.get(entity_id).state == STATE_ON
+
+    answered.set()
+    await poll
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == STATE_ON